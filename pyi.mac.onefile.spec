@@ -89,6 +89,7 @@ source_files = [
     os.path.join( src_dir, "bl_title_panel.py"),
     os.path.join( src_dir, "fb_config.py"),
     os.path.join( src_dir, "fb_dialog.py"),
+    os.path.join( src_dir, "fb_fullword.py"),
     os.path.join( src_dir, "fb_local2canon_mgmt.py"),
     os.path.join( src_dir, "fb_menu_stats.py"),
     os.path.join( src_dir, "fb_search.py"),
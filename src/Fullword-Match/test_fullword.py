@@ -5,6 +5,7 @@
 #   This is for testing the fullword C module.
 # ------------------------------------------------------------------------
 
+import os
 import sys
 import fullword
 # print( dir( fullword ) )
@@ -90,3 +91,25 @@ for words in test_words:
             print( f"  Data: {data}", file=sys.stderr  )
             print( f"  Words: {words}", file=sys.stderr  )
             sys.exit(1)
+
+# ------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - fullword_tokens() in fb_utils.py must split words exactly as
+#       the C module does. The word_index lookup in get_fulltext() narrows rows to those
+#       having all tokens of the search, so every match must have them all.
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ )), '..' ))
+from fb_fullword import fullword_tokens
+
+print()
+print( "Check fullword_tokens() against fullword.match()" )
+errors = 0
+for words in test_words:
+    for data in test_titles:
+        if fullword.match( data, words ) and not set( fullword_tokens( words ) ) <= set( fullword_tokens( data ) ):
+            print( "   ERROR: match() true, tokens missing in data", file=sys.stderr )
+            print( f"     Data: {data}, tokens: {fullword_tokens( data )}", file=sys.stderr )
+            print( f"     Words: {words}, tokens: {fullword_tokens( words )}", file=sys.stderr )
+            errors += 1
+
+print( f"   {errors} errors" )
+sys.exit( 1 if errors else 0 )
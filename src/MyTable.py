@@ -3,44 +3,279 @@
 #   WRW 28-Jan-2025
 #   MyTable - Base class for all birdland tables.
 #   With a little bit of work and help from Chat this turns out to be quite clean.
+#   WRW 18-Oct-2026 - TableModel, rows in plain Python lists, replaces QStandardItemModel,
+#       which made a QStandardItem with a tooltip for every cell and update() set the height
+#       of every row. Now one reset per update() and data() answers for the visible cells only.
+#   WRW 18-Oct-2026 - TableProxyModel replaces NumericSortProxyModel. Sorts a list of row
+#       numbers with Python sorted() on keys made once per column, was float() of both cells
+#       in lessThan() and Python data() calls from Qt on every comparison. Add a filter box,
+#       Ctrl+F, matching rows on text in any column.
 # -------------------------------------------------------------------------------------
 
 import sys
 
-from PySide6.QtCore import Qt, Signal, QSortFilterProxyModel, QItemSelectionModel
-from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtCore import Qt, Signal, QItemSelectionModel
+from PySide6.QtCore import QAbstractTableModel, QAbstractProxyModel, QModelIndex
+from PySide6.QtGui import QStandardItem, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
     QTableView,
     QVBoxLayout,
     QHeaderView,
     QAbstractItemView,
+    QLineEdit,
 )
 
 
 # -------------------------------------------------------------------------------------
-#   20-Feb-2025 - Proposed by CoPilot after a lot of screwing around with ChatGPT to
-#       an eventual near solution but a lot of complexity. Actually, this was proposed
-#       by chat early but I ignored it.
+#   WRW 18-Oct-2026 - Returned by TableModel.item() for the code that used QStandardItemModel.item(),
+#       just text() and setText().
 
-class NumericSortProxyModel( QSortFilterProxyModel ):
+class TableItem():
+
+    def __init__( self, model, row, col ):
+        self.model = model
+        self.row = row
+        self.col = col
+
+    def text( self ):
+        return self.model.rows[ self.row ][ self.col ]
+
+    def setText( self, text ):
+        self.model.setCell( self.row, self.col, text )
+
+# -------------------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Table data as a list of rows, each a list of str, one per column.
+#       Display and tooltip roles are the cell text. Cells may also be given as QStandardItem,
+#       e.g., the bold titles in fb_menu_stats.py, only their text and font are kept.
+#   Sort keys of numericCols are made in setRows(), of other columns, and after other changes,
+#       when first needed. Cells in numericCols that are not numbers sort after those that are.
+#       Filter keys, the lower-case text of a row, are made when first needed.
+
+class TableModel( QAbstractTableModel ):
+
+    def __init__( self, header, numericCols=None ):
+        super().__init__()
+        self.header = list( header )
+        self.numericCols = numericCols or []
+        self.rows = []
+        self.fonts = {}                 # ( row, col ) : QFont for cells given as QStandardItem
+        self.sort_keys = None           # { col : [ key of each row ] }
+        self.filter_keys = None         # [ lower-case text of each row ]
+
+    # -----------------------------------------------------
+
+    def rowCount( self, parent=QModelIndex() ):
+        return 0 if parent.isValid() else len( self.rows )
+
+    def columnCount( self, parent=QModelIndex() ):
+        return 0 if parent.isValid() else len( self.header )
+
+    def data( self, index, role=Qt.DisplayRole ):
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            row = self.rows[ index.row() ]
+            col = index.column()
+            return row[ col ] if col < len( row ) else None
+
+        elif role == Qt.FontRole and self.fonts:
+            return self.fonts.get( ( index.row(), index.column() ))
+
+        return None
+
+    def headerData( self, section, orientation, role=Qt.DisplayRole ):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len( self.header ):
+            return self.header[ section ]
+        return None
+
+    # -----------------------------------------------------
+    #   Make a row of str from data, noting font of any QStandardItem.
+
+    def make_row( self, row, data ):
+        data = list( data )
+        for col, cell in enumerate( data ):
+            if isinstance( cell, QStandardItem ):
+                data[ col ] = cell.text()
+                self.fonts[ ( row, col ) ] = cell.font()
+        return data
+
+    def setRows( self, data ):
+        self.beginResetModel()
+        self.fonts = {}
+        self.rows = [ self.make_row( row, x ) for row, x in enumerate( data ) ]
+        self.changed()
+        for col in self.numericCols:
+            self.get_sort_keys( col )
+        self.endResetModel()
+
+    def appendRow( self, data ):
+        row = len( self.rows )
+        self.beginInsertRows( QModelIndex(), row, row )
+        self.rows.append( self.make_row( row, data ))
+        self.changed()
+        self.endInsertRows()
+
+    def removeRows( self, row, count, parent=QModelIndex() ):
+        if parent.isValid() or row < 0 or row + count > len( self.rows ):
+            return False
+
+        self.beginRemoveRows( parent, row, row + count -1 )
+        del self.rows[ row : row + count ]
+        if self.fonts:
+            self.fonts = { ( r if r < row else r - count, c ) : f for ( r, c ), f in self.fonts.items() if not row <= r < row + count }
+        self.changed()
+        self.endRemoveRows()
+        return True
+
+    def setCell( self, row, col, text ):
+        self.rows[ row ][ col ] = text
+        self.changed()
+        index = self.index( row, col )
+        self.dataChanged.emit( index, index )
+
+    # -----------------------------------------------------
+
+    def changed( self ):
+        self.sort_keys = None
+        self.filter_keys = None
+
+    def get_sort_keys( self, col ):
+        if self.sort_keys is None:
+            self.sort_keys = {}
+
+        keys = self.sort_keys.get( col )
+        if keys is None:
+            keys = []
+            if col in self.numericCols:
+                for row in self.rows:
+                    try:
+                        keys.append( float( row[ col ] ))
+                    except ( ValueError, TypeError, IndexError ):       # Not a number, sort after numbers
+                        keys.append( float( 'inf' ))
+            else:
+                for row in self.rows:
+                    keys.append( ( row[ col ] if col < len( row ) else None ) or '' )
+            self.sort_keys[ col ] = keys
+
+        return keys
+
+    def get_filter_keys( self ):
+        if self.filter_keys is None:
+            self.filter_keys = [ '\t'.join( x for x in row if x ).lower() for row in self.rows ]
+        return self.filter_keys
+
+    def item( self, row, col ):
+        return TableItem( self, row, col )
+
+# -------------------------------------------------------------------------------------
+#   20-Feb-2025 - NumericSortProxyModel proposed by CoPilot after a lot of screwing around with
+#       ChatGPT to an eventual near solution but a lot of complexity.
+#   WRW 18-Oct-2026 - Replaced by TableProxyModel over TableModel. self.rows is the source
+#       row of each proxy row, made by build() from the model's filter and sort keys. Source
+#       rows stay in the order given to update() as they did with the QSortFilterProxyModel.
+#       A sort keeps the selection, a filter change or a change in the rows resets the view.
+
+class TableProxyModel( QAbstractProxyModel ):
 
     def __init__( self, numericCols ):
         super().__init__()
         self.numericCols = numericCols
+        self.filter_text = ''
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+        self.rows = []              # Source row of each proxy row
+        self.proxy_rows = []        # Proxy row of each source row, -1 if filtered out
+
+    def setSourceModel( self, model ):
+        super().setSourceModel( model )
+        model.modelAboutToBeReset.connect( self.beginResetModel )
+        model.modelReset.connect( self.on_source_reset )
+        model.rowsAboutToBeInserted.connect( self.beginResetModel )
+        model.rowsInserted.connect( self.on_source_reset )
+        model.rowsAboutToBeRemoved.connect( self.beginResetModel )
+        model.rowsRemoved.connect( self.on_source_reset )
+        model.dataChanged.connect( self.on_source_data_changed )
+        self.build()
+
+    # -----------------------------------------------------
+
+    def build( self ):
+        model = self.sourceModel()
+        rows = range( model.rowCount() )
+
+        if self.filter_text:
+            keys = model.get_filter_keys()
+            rows = [ row for row in rows if self.filter_text in keys[ row ] ]
+
+        if 0 <= self.sort_column < model.columnCount():
+            keys = model.get_sort_keys( self.sort_column )
+            rows = sorted( rows, key=keys.__getitem__, reverse = self.sort_order == Qt.DescendingOrder )
+
+        self.rows = list( rows )
+        self.proxy_rows = [ -1 ] * model.rowCount()
+        for proxy_row, row in enumerate( self.rows ):
+            self.proxy_rows[ row ] = proxy_row
 
-    # Override sorting to handle numeric values for specific columns
-    def lessThan(self, left, right):
-        col = left.column()
-        if self.numericCols and col in self.numericCols:
-            # Convert to float for numeric sorting
-            left_value =  left.data(Qt.DisplayRole)
-            right_value = right.data(Qt.DisplayRole)
-            try:
-                return float(left_value) < float(right_value)
-            except ValueError:  # Fallback in case of non-numeric values
-                return left_value < right_value
-        return super().lessThan(left, right)
+    #   Rows in new places, same rows, keep selection and current index on their rows.
+
+    def relayout( self ):
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        old_source = [ self.mapToSource( x ) for x in old ]
+        self.build()
+        self.changePersistentIndexList( old, [ self.mapFromSource( x ) for x in old_source ] )
+        self.layoutChanged.emit()
+
+    def on_source_reset( self ):
+        self.build()
+        self.endResetModel()
+
+    def on_source_data_changed( self, top_left, bottom_right, roles=[] ):
+        if self.filter_text or self.sort_column >= 0:
+            self.relayout()
+        else:
+            self.dataChanged.emit( self.mapFromSource( top_left ), self.mapFromSource( bottom_right ), roles )
+
+    # -----------------------------------------------------
+
+    def sort( self, column, order=Qt.AscendingOrder ):
+        self.sort_column = column
+        self.sort_order = order
+        self.relayout()
+
+    def setFilterText( self, text ):
+        self.beginResetModel()
+        self.filter_text = text.strip().lower()
+        self.build()
+        self.endResetModel()
+
+    # -----------------------------------------------------
+
+    def index( self, row, column, parent=QModelIndex() ):
+        if parent.isValid() or not ( 0 <= row < len( self.rows )) or not ( 0 <= column < self.columnCount() ):
+            return QModelIndex()
+        return self.createIndex( row, column )
+
+    def parent( self, index=None ):
+        return QModelIndex()
+
+    def rowCount( self, parent=QModelIndex() ):
+        return 0 if parent.isValid() else len( self.rows )
+
+    def columnCount( self, parent=QModelIndex() ):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+    def mapToSource( self, proxy_index ):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index( self.rows[ proxy_index.row() ], proxy_index.column() )
+
+    def mapFromSource( self, source_index ):
+        if not source_index.isValid() or self.proxy_rows[ source_index.row() ] < 0:
+            return QModelIndex()
+        return self.index( self.proxy_rows[ source_index.row() ], source_index.column() )
+
+    def headerData( self, section, orientation, role=Qt.DisplayRole ):
+        return self.sourceModel().headerData( section, orientation, role )
 
 # -------------------------------------------------------------------------------------
 #   Changed model to pmodel as had conflict with model when added numeric sort
@@ -148,11 +383,10 @@ class MyTable( MyView ):
 
     def __init__(self, header, ratios, numericCols = None, disableSorting = False ):
         self.col_count = len(header)
-        self.model = QStandardItemModel(0, self.col_count)
-        self.model.setHorizontalHeaderLabels( header )
+        self.model = TableModel( header, numericCols )     # WRW 18-Oct-2026 - was QStandardItemModel(0, self.col_count)
 
         if True:        # For numeric sorting of numericCols
-            self.proxy_model = NumericSortProxyModel( numericCols )
+            self.proxy_model = TableProxyModel( numericCols )
             self.proxy_model.setSourceModel(self.model)
             super().__init__( self.proxy_model, ratios, disableSorting )
 
@@ -162,48 +396,77 @@ class MyTable( MyView ):
         self.view = super()
         self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)         # WRW 9-Apr-2025 - disable editing on Windows
 
-        self.row_count = 0
+        #   WRW 18-Oct-2026 - All rows one height, was setRowHeight( row, 20 ) for each row in addRow().
+        self.vheader.setSectionResizeMode( QHeaderView.Fixed )
+        self.vheader.setDefaultSectionSize( 20 )
+
         self.numericCols = numericCols
 
+        #   WRW 18-Oct-2026 - Filter box over top right of table, Ctrl+F to show, Escape to clear and hide.
+        self.filter_box = QLineEdit( self )
+        self.filter_box.setPlaceholderText( "Filter rows" )
+        self.filter_box.setClearButtonEnabled( True )
+        self.filter_box.setVisible( False )
+        self.filter_box.textChanged.connect( self.proxy_model.setFilterText )
+
+        find_shortcut = QShortcut( QKeySequence.Find, self )
+        find_shortcut.setContext( Qt.WidgetWithChildrenShortcut )
+        find_shortcut.activated.connect( self.show_filter_box )
+
+        esc_shortcut = QShortcut( QKeySequence( Qt.Key_Escape ), self.filter_box )
+        esc_shortcut.setContext( Qt.WidgetShortcut )
+        esc_shortcut.activated.connect( self.hide_filter_box )
+
+    # -----------------------------------------------------
+
+    def show_filter_box( self ):
+        self.place_filter_box()
+        self.filter_box.setVisible( True )
+        self.filter_box.setFocus()
+        self.filter_box.selectAll()
+
+    def hide_filter_box( self ):
+        self.filter_box.clear()
+        self.filter_box.setVisible( False )
+        self.setFocus()
+
+    def place_filter_box( self ):
+        width = min( 250, self.viewport().width() )
+        self.filter_box.setGeometry( self.viewport().geometry().right() - width, self.viewport().geometry().top(), width, self.filter_box.sizeHint().height() )
+
+    def resizeEvent( self, event ):
+        super().resizeEvent( event )
+        if hasattr( self, 'filter_box' ):           # Not yet in MyView __init__()
+            self.place_filter_box()
+
     # -----------------------------------------------------
     #   Had to set row height explicitly here to make it small.
     #   Make QStandardItme here, not in calling program.
     #   WRW 30-May-2025 - add tooltip, may want to make it conditional on flag as only
     #       wanted for canonical -> file tables. No, I like it on all as many columns are
     #       too short.
+    #   WRW 18-Oct-2026 - Tooltip and row height now from TableModel and vheader.
 
     def addRow( self, data ):
-        # print( "/// addRow before append" )
-        # irow = [ QStandardItem( d ) for d in data ]
-        irow = []
-        for d in data:
-            item = QStandardItem(d)
+        self.model.appendRow( data )
 
-            try:
-                item.setToolTip(d)          # Fails if called with QStandardItem(), not applicable for that
-            except:
-                pass
-
-            irow.append(item)
-
-        self.model.appendRow( irow )
-        self.setRowHeight(self.row_count, 20)
-        self.row_count += 1
-        # print( "/// addRow after append" )
+    @property
+    def row_count( self ):
+        return self.model.rowCount()
 
     # -----------------------------------------------------
     # /// trying model here
 
     def getRow( self, row ):
         if row < self.row_count:
-            return [ self.model.item(row, col).text() for col in range( self.model.columnCount() ) ]
+            return list( self.model.rows[ row ] )
         else:
             print( f"getRow() row {row} exceeds row count: {self.row_count}" )
             return None
 
     def getItem( self, row, col ):
         if row < self.row_count and col < self.col_count:
-            return self.model.item(row, col).text()
+            return self.model.rows[ row ][ col ]
         else:
             print( f"getItem() row {row} or col {col} exceeds row count: {self.row_count} or column count: {self.col_count}" )
             return None
@@ -214,25 +477,26 @@ class MyTable( MyView ):
     #   WRW 8-Mar-2025 - Note: terrible bug here, index was coming in as 0 when passed as None
     #       because arg type was int. Ok when changed arg type to object.
 
+    #   WRW 18-Oct-2026 - One model reset for all of data, was clear() and addRow() for each row.
+
     def update( self, data, index=None ):
-        self.clear()
-        for row in data:
-            self.addRow( row )
+        self.model.setRows( data )
 
         # print( "/// index", index )
 
         if index is not None:
             selection_model = self.selectionModel()
             index = self.model.index(index, 0)  # Get the index for the first column of the row
+            index = self.proxy_model.mapFromSource( index )     # WRW 18-Oct-2026 - View row, may be sorted or filtered
             self.blockSignals(True)     # select() generates a signal as if user clicked in row.
-            selection_model.select(index, QItemSelectionModel.Select | QItemSelectionModel.Rows)
+            if index.isValid():         # Not valid when filtered out
+                selection_model.select(index, QItemSelectionModel.Select | QItemSelectionModel.Rows)
             self.blockSignals(False)
 
     # -----------------------------------------------------
 
     def clear( self ):
-        self.row_count = 0
-        self.model.setRowCount(0)
+        self.model.setRows( [] )
         # self.model.removeRows(0, self.model.rowCount())
 
 # -------------------------------------------------------------------------------------
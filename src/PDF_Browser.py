@@ -6,67 +6,184 @@
 #   WRW 3-June-2025 - added as_posix() in a couple of places to resolve prob
 #       on Windows - no index count in browser
 
+#   WRW 18-Oct-2026 - Make thumbnails in a process pool, was one every 30 ms on the GUI thread,
+#       each first page at 150 dpi. Cache file named by path, mtime and size of the pdf file
+#       and holds the index count shown on it. A cached thumbnail with the same count is used
+#       as is. Thumbnails appear in the grid as they complete.
+
+#   WRW 18-Oct-2026 - Grid is a QListView in IconMode on ThumbnailModel, was a QLabel per
+#       pdf file in a QGridLayout, all pixmaps in memory, rebuilt on every resize.
+#       ThumbnailDelegate loads and scales the thumbnail files of visible cells only,
+#       keeping the last THUMBNAIL_CACHE_SIZE of them. A resize only changes the cell size.
+
 # ----------------------------------------------------------------------------------------------
 
 import os
 import sys
 from pathlib import Path
 import hashlib
-import fitz                 # For PyMuPDF
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
-from PySide6.QtCore import Qt, QSize, QEvent, QTimer, QObject, Slot, QTimer, QRect
-from PySide6.QtGui import QPixmap, QImage, QCursor, QPainter, QFont, QColor, QFontMetrics, QPen
-from PySide6.QtWidgets import QWidget, QApplication, QLabel, QGridLayout
-from PySide6.QtWidgets import QSizePolicy, QScrollArea, QPushButton, QVBoxLayout
+from PySide6.QtCore import Qt, QSize, QEvent, QTimer, QObject, Slot, QTimer, QRect, Signal
+from PySide6.QtCore import QAbstractListModel, QModelIndex
+from PySide6.QtGui import QPixmap, QImage, QImageReader, QCursor, QPainter, QFont, QColor, QFontMetrics, QPen
+from PySide6.QtWidgets import QWidget, QApplication, QLabel
+from PySide6.QtWidgets import QPushButton, QVBoxLayout
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle
 
 from Store import Store
 from bl_constants import MT
+from bl_pdf_render import render_thumbnail
 
 # ----------------------------------------------------------------------------------------------
 
 THUMBNAIL_WIDTH = 200   # Cached image width in pixels, should be larger than ever needed
 GRID_COLUMNS = 8        # Number of columns in the grid - 6 is good comprimise, 8 was too small.
+CHECK_BATCH = 50        # Cached thumbnails checked per timer tick
+COUNT_KEY = 'Index-Count'   # PNG text key for index count drawn on thumbnail
+THUMBNAIL_ASPECT = 1.3  # Cell height / width, about that of letter-size cover
+THUMBNAIL_CACHE_SIZE = 400  # Scaled pixmaps kept by ThumbnailDelegate
+CELL_SPACING = 4
+RESIZE_DELAY = 100      # ms after last resize to set cell size
 
 # ----------------------------------------------------------------------------------------------
+#   One row per pdf file with a thumbnail: ( pdf_path, cache_path ). No pixmaps here.
 
-class PDFThumbnailLabel( QLabel ):
-    def __init__(self, pdf_path):
-        super().__init__()
-        self.pdf_path = pdf_path
-        self.setToolTip(Path(pdf_path).name)
+class ThumbnailModel( QAbstractListModel ):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.on_click()
-        else:
-            super().mousePressEvent(event)
+    def rowCount( self, parent=QModelIndex() ):
+        return 0 if parent.isValid() else len( self.items )
 
-    def on_click(self):
-        s = Store()
-        path = Path( self.pdf_path ).as_posix()    # WRW 11-Apr-2025 - browser on Windows returning backslashes.
-        s.sigman.emit( "sig_music_browser_clicked", path )
+    def data( self, index, role=Qt.DisplayRole ):
+        if not index.isValid():
+            return None
+
+        pdf_path, cache_path = self.items[ index.row() ]
+
+        if role == Qt.ToolTipRole:
+            return Path(pdf_path).name
+
+        elif role == Qt.UserRole:
+            return pdf_path
+
+        elif role == Qt.UserRole + 1:
+            return cache_path
+
+        return None
+
+    def set_items( self, items ):
+        self.beginResetModel()
+        self.items = list( items )
+        self.endResetModel()
+
+    def append_item( self, item ):
+        row = len( self.items )
+        self.beginInsertRows( QModelIndex(), row, row )
+        self.items.append( item )
+        self.endInsertRows()
+
+# ----------------------------------------------------------------------------------------------
+#   Paint thumbnail of a cell, loaded from its cache file and scaled to the cell width
+#       when first painted. LRU of scaled pixmaps keyed by ( cache_path, width ).
+
+class ThumbnailDelegate( QStyledItemDelegate ):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cell_width = THUMBNAIL_WIDTH
+        self.pixmaps = OrderedDict()
+
+    def set_cell_width( self, width ):
+        self.cell_width = width
+
+    def sizeHint( self, option, index ):
+        return QSize( self.cell_width, int( self.cell_width * THUMBNAIL_ASPECT ))
+
+    def get_pixmap( self, cache_path ):
+        key = ( cache_path, self.cell_width )
+
+        pixmap = self.pixmaps.get( key )
+        if pixmap is not None:
+            self.pixmaps.move_to_end( key )
+            return pixmap
+
+        image = QImage( cache_path )
+        if image.isNull():
+            return None
+
+        if image.width() > self.cell_width:
+            image = image.scaledToWidth( self.cell_width, Qt.SmoothTransformation )
+
+        pixmap = QPixmap.fromImage( image )
+        self.pixmaps[ key ] = pixmap
+
+        while len( self.pixmaps ) > THUMBNAIL_CACHE_SIZE:
+            self.pixmaps.popitem( last=False )
+
+        return pixmap
+
+    def forget( self, cache_path ):
+        for key in [ x for x in self.pixmaps if x[0] == cache_path ]:
+            del self.pixmaps[ key ]
+
+    def paint( self, painter, option, index ):
+        pixmap = self.get_pixmap( index.data( Qt.UserRole + 1 ))
+        if pixmap is None:
+            return
+
+        rect = option.rect
+        x = rect.x() + ( rect.width() - pixmap.width() ) // 2
+        painter.drawPixmap( x, rect.y(), pixmap )
+
+        if option.state & QStyle.State_MouseOver:
+            painter.setPen( QPen( option.palette.highlight().color(), 2 ))
+            painter.drawRect( QRect( x, rect.y(), pixmap.width(), pixmap.height() ).adjusted( 1, 1, -1, -1 ))
 
 # ----------------------------------------------------------------------------------------------
 
 class PDF_Browser(QWidget):
+    sig_thumbnail_rendered = Signal( str, str, object )  # pdf_path, cache_path, future, from pool thread
+
     def __init__(self, parent=None):
         s = Store()
         super().__init__(parent)
 
         s.sigman.register_slot( 'slot_make_thumbnails', self.slot_make_thumbnails )
+        s.sigman.register_slot( 'slot_stop_thumbnails', self.slot_stop_thumbnails )
+        self.sig_thumbnail_rendered.connect( self.on_thumbnail_rendered )
+        self.thumbnail_pool = None                      # Not None while making thumbnails
 
         self.cache_dir = s.conf.val( 'thumbnail_dir' )
         os.makedirs( self.cache_dir, exist_ok=True )
 
-        self.scroll_area = QScrollArea(self)
-        self.scroll_area.setWidgetResizable(True)
-        self.container = QWidget()
-        self.layout = QGridLayout(self.container)
-        self.scroll_area.setWidget(self.container)
+        self.model = ThumbnailModel( self )
+        self.delegate = ThumbnailDelegate( self )
+
+        self.view = QListView( self )
+        self.view.setViewMode( QListView.IconMode )
+        self.view.setResizeMode( QListView.Adjust )
+        self.view.setMovement( QListView.Static )
+        self.view.setUniformItemSizes( True )
+        self.view.setSpacing( CELL_SPACING )
+        self.view.setMouseTracking( True )
+        self.view.setSelectionMode( QListView.NoSelection )
+        self.view.setModel( self.model )
+        self.view.setItemDelegate( self.delegate )
+        self.view.clicked.connect( self.on_click )
+
+        self.container_width = self.width()
+        self.resize_timer = QTimer( self )
+        self.resize_timer.setSingleShot( True )
+        self.resize_timer.setInterval( RESIZE_DELAY )
+        self.resize_timer.timeout.connect( self.set_cell_width )
 
         outer_layout = QVBoxLayout(self)
         outer_layout.setContentsMargins(0, 0, 0, 0)
-        outer_layout.addWidget(self.scroll_area)
+        outer_layout.addWidget(self.view)
         self.setLayout(outer_layout)
 
         txt = """No cover browser thumbnails.
@@ -78,14 +195,18 @@ the 'Root of music files' option is configured. Then:
         outer_layout.addWidget( self.no_thumbnails_label )
 
         self.get_pdf_files()
-
-        self.labels = []
-        self.cached_pixmaps = {}
         self.load_all_pixmaps( )              
 
-        if self.cached_pixmaps:
+        if self.model.items:
             self.no_thumbnails_label.setVisible( False )
 
+    # --------------------------------------------------------------------------------
+
+    def on_click( self, index ):
+        s = Store()
+        path = Path( index.data( Qt.UserRole ) ).as_posix()    # WRW 11-Apr-2025 - browser on Windows returning backslashes.
+        s.sigman.emit( "sig_music_browser_clicked", path )
+
     # --------------------------------------------------------------------------------
     #   Get list of all pdf files in 'browser_folders' sorted by each folder, not all together.
 
@@ -113,8 +234,15 @@ the 'Root of music files' option is configured. Then:
 
     # --------------------------------------------------------------------------------
 
+    #   WRW 18-Oct-2026 - Key on path, mtime and size, was path only. None if pdf_path gone.
+
     def get_cache_path( self, pdf_path):
-        pdf_hash = hashlib.md5(pdf_path.encode()).hexdigest()
+        try:
+            st = os.stat( pdf_path )
+        except OSError:
+            return None
+
+        pdf_hash = hashlib.md5( f"{pdf_path}|{st.st_mtime_ns}|{st.st_size}".encode()).hexdigest()
         return os.path.join( self.cache_dir, f"{pdf_hash}.png")
 
     # --------------------------------------------------------------------------------
@@ -125,6 +253,9 @@ the 'Root of music files' option is configured. Then:
     def slot_make_thumbnails( self ):
         s = Store()
 
+        if self.thumbnail_pool:                             # Already making them
+            return
+
         s.app.setOverrideCursor(QCursor(Qt.WaitCursor))
         self.get_pdf_files()                                # Start with fresh list of pdf files
         if self.pdf_ppaths:
@@ -137,107 +268,148 @@ the 'Root of music files' option is configured. Then:
         self.create_all_pixmaps()
 
     # --------------------------------------------------------------------------------
+    #   WRW 18-Oct-2026 - On exit, by sig_stopping. Drop thumbnails not started yet, only
+    #       those being made are waited for by the pool.
+
+    @Slot()
+    def slot_stop_thumbnails( self ):
+        if self.thumbnail_pool:
+            pool = self.thumbnail_pool
+            self.thumbnail_pool = None                      # Before shutdown(), it calls back for cancelled ones
+            self.todo = []
+            pool.shutdown( wait=False, cancel_futures=True )
 
-    def clear_grid_layout( self, grid_layout: QGridLayout ):
-        while (item := grid_layout.itemAt(0)) is not None:
-            widget = item.widget()
-            grid_layout.removeWidget(widget)
-            widget.setParent(None)
 
     # --------------------------------------------------------------------------------
     #   /// RESUME - combine common code here and populate_grid into a new function.
+    #   WRW 18-Oct-2026 - Check the cache a batch at a time in check_next_thumbnails(), send
+    #       misses to the process pool, add both to the grid as they come in.
 
     def create_all_pixmaps( self ):
         s = Store()
         s.selectTab(MT.Browser)
         s.sigman.emit( "sig_search_results", "Building browser thumbnails" )
     
-        self.clear_grid_layout(self.layout)
-        self.labels.clear()
-    
-        self.row = 0
-        self.col = 0
-
-        self.column_width = self.container.width() / (GRID_COLUMNS + 1)
+        self.model.set_items( [] )
+        self.thumbnails = {}                    # pdf_path : cache_path
     
-        self.pdf_iter = iter(self.pdf_files)
-        self.add_next_thumbnail()
+        self.index_counts = s.fb.get_index_counts_by_file()      # WRW 18-Oct-2026 - One query for all files
+        self.todo = list( self.pdf_files )
+        self.cache_paths = set()
+        self.outstanding = 0
+        self.cache_hits = 0
+        self.thumbnail_pool = ProcessPoolExecutor( mp_context=multiprocessing.get_context( 'spawn' ))     # Not fork, GUI app with threads
+        self.check_next_thumbnails()
     
     # ----------------------------------------------------------
 
-    def add_next_thumbnail( self ):
-        s = Store()
-
-        try:
-            pdf_path = next(self.pdf_iter)
-        except StopIteration:
-            s.app.restoreOverrideCursor()
-            s.sigman.emit( "sig_search_results", "Build browser thumbnails completed" )
-            return  # Done
-    
-        pixmap = self.render_pdf_first_page( pdf_path )
-        if pixmap:
-            self.cached_pixmaps[pdf_path] = pixmap
-
-            label = PDFThumbnailLabel(pdf_path)
-
-            if pixmap.width() > self.column_width:
-                scaled_pixmap = pixmap.scaledToWidth(self.column_width, Qt.SmoothTransformation)
-            else:
-                scaled_pixmap = pixmap
+    def check_next_thumbnails( self ):
+        batch = self.todo[ :CHECK_BATCH ]
+        del self.todo[ :CHECK_BATCH ]
 
-            label.setPixmap(scaled_pixmap)
-            label.setFixedSize(scaled_pixmap.size())
-            label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        for pdf_path in batch:
+            cache_path = self.get_cache_path( pdf_path )
+            if not cache_path:
+                continue
 
-            self.layout.addWidget(label, self.row, self.col)
-            self.labels.append(label)
+            self.cache_paths.add( cache_path )
+            cnt, src = self.get_index_count( pdf_path )
 
-            self.col += 1
-            if self.col >= GRID_COLUMNS:
-                self.col = 0
-                self.row += 1
+            reader = QImageReader( cache_path )                 # Header and text only, not the image
+            if reader.canRead() and reader.text( COUNT_KEY ) == str( cnt or '' ):
+                self.cache_hits += 1
+                self.add_thumbnail( pdf_path, cache_path )
 
-            # Scroll to bottom
-            scrollbar = self.scroll_area.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+            else:
+                self.outstanding += 1
+                future = self.thumbnail_pool.submit( render_thumbnail, pdf_path, THUMBNAIL_WIDTH * 2 )
+                future.add_done_callback( lambda future, pdf_path=pdf_path, cache_path=cache_path:
+                                          self.sig_thumbnail_rendered.emit( pdf_path, cache_path, future ))
 
-        QTimer.singleShot(30, self.add_next_thumbnail)  # Delay before adding next
+        if self.todo:
+            QTimer.singleShot( 0, self.check_next_thumbnails )     # Let GUI run between batches
+        else:
+            self.check_thumbnails_done()
 
-    # --------------------------------------------------------------------------------
+    # ----------------------------------------------------------
+    #   Rendered first page from pool, in pool thread order. Add index count and save in cache.
+    #   cache_path is the one checked in check_next_thumbnails(), not got again here, so that
+    #   it is in cache_paths even if the pdf changed meanwhile. It is then stale next time.
 
-    def render_pdf_first_page( self, pdf_path):
+    @Slot( str, str, object )
+    def on_thumbnail_rendered( self, pdf_path, cache_path, future ):
         s = Store()
 
-        cache_path = self.get_cache_path(pdf_path)
+        if not self.thumbnail_pool:                     # Stopped by slot_stop_thumbnails()
+            return
 
-        # if os.path.exists(cache_path):
-        #     return QPixmap(cache_path)
-
-        doc = fitz.open(pdf_path)
+        self.outstanding -= 1
 
         try:
-            page = doc.load_page(0)
+            width, height, stride, alpha, samples = future.result()
 
         except Exception:
             (extype, value, xtraceback) = sys.exc_info()
             s.msgWarn( f"File {pdf_path} appears corrupted, type: '{extype}', value: '{value}', ignoring" )
-            return None
 
-        pix = page.get_pixmap(dpi=150)
-        image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGBA8888 if pix.alpha else QImage.Format_RGB888)
-        scaled_image = image.scaledToWidth(THUMBNAIL_WIDTH, Qt.SmoothTransformation)
-        pixmap = QPixmap.fromImage(scaled_image)
+        else:
+            image = QImage( samples, width, height, stride, QImage.Format_RGBA8888 if alpha else QImage.Format_RGB888 )
+            scaled_image = image.scaledToWidth(THUMBNAIL_WIDTH, Qt.SmoothTransformation)
+            pixmap = QPixmap.fromImage(scaled_image)
+
+            cnt, src = self.get_index_count( pdf_path )
+            if cnt:
+                # pixmap = self.add_text_to_pixmap( pixmap, f"{src}: {cnt}" )
+                pixmap = self.add_text_to_pixmap( pixmap, f"Index: {cnt}" )
+
+            image = pixmap.toImage()
+            image.setText( COUNT_KEY, str( cnt or '' ))
+            image.save( cache_path, "PNG" )
+            self.delegate.forget( cache_path )
+            self.add_thumbnail( pdf_path, cache_path )
+
+        self.check_thumbnails_done()
+
+    # ----------------------------------------------------------
+
+    def check_thumbnails_done( self ):
+        s = Store()
+
+        if self.todo or self.outstanding or not self.thumbnail_pool:
+            return
+
+        self.thumbnail_pool.shutdown( wait=False )
+        self.thumbnail_pool = None
+        self.remove_stale_cache_files()
+
+        self.model.set_items( [ ( x, self.thumbnails[ x ] ) for x in self.pdf_files if x in self.thumbnails ] )  # Back to pdf_files order
+        s.app.restoreOverrideCursor()
+        s.sigman.emit( "sig_search_results", f"Build browser thumbnails completed, {self.cache_hits} of {len( self.thumbnails )} from cache" )
+
+    # ----------------------------------------------------------
+    #   Index count for thumbnail, was s.fb.get_index_count_from_file() for each file.
 
+    def get_index_count( self, pdf_path ):
         ppath = self.pdf_ppaths[ pdf_path ]        
-        cnt, src = s.fb.get_index_count_from_file( str( ppath ) )
+        return self.index_counts.get( str( ppath ), ( None, None ))
 
-        if cnt:
-            # pixmap = self.add_text_to_pixmap( pixmap, f"{src}: {cnt}" )
-            pixmap = self.add_text_to_pixmap( pixmap, f"Index: {cnt}" )
+    # ----------------------------------------------------------
+    #   Remove thumbnails of files changed or gone, only names like get_cache_path() makes.
 
-        pixmap.save(cache_path, "PNG")
-        return pixmap
+    def remove_stale_cache_files( self ):
+        for path in Path( self.cache_dir ).glob( '*.png' ):
+            if len( path.stem ) == 32 and str( path ) not in self.cache_paths:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    # ----------------------------------------------------------
+
+    def add_thumbnail( self, pdf_path, cache_path ):
+        self.thumbnails[ pdf_path ] = cache_path
+        self.model.append_item( ( pdf_path, cache_path ))
+        self.view.scrollToBottom()
 
     # --------------------------------------------------------------------------------
     #   This is a lot of code for a minor feature but it is helpful to have
@@ -285,59 +457,37 @@ the 'Root of music files' option is configured. Then:
         return pixmap
 
     # --------------------------------------------------------------------------------
-    #   Load existing thumbnail files for files in self.pdf_files into self.cached_pixmaps
+    #   Load existing thumbnail files for files in self.pdf_files into self.model
+    #   WRW 18-Oct-2026 - Just the names of the files, was the pixmaps, ThumbnailDelegate loads them.
 
     def load_all_pixmaps( self ):
         s = Store()
         # s.selectTab( MT.Browser )
+        items = []
         for pdf_path in self.pdf_files:
             cache_path = self.get_cache_path(pdf_path)
-            if os.path.exists(cache_path):
-                pixmap = QPixmap(cache_path)
-                self.cached_pixmaps[pdf_path] = pixmap
-
-    # --------------------------------------------------------------------------------
-    #   Copy thumbnails from self.cached_pixmaps to grid.
-
-    def populate_grid( self, container_width ):
-        for i in reversed(range(self.layout.count())):
-            widget = self.layout.itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
-
-        self.labels.clear()
-        column_width = container_width/(GRID_COLUMNS+1)       # +1 to prevent clipping of last one
-
-        row = col = 0
-        for pdf_path in self.pdf_files:
-            if pdf_path not in self.cached_pixmaps:
-                continue
+            if cache_path and os.path.exists(cache_path):
+                items.append( ( pdf_path, cache_path ) )
 
-            label = PDFThumbnailLabel(pdf_path)
-            pixmap = self.cached_pixmaps[pdf_path]
-
-            if pixmap.width() > column_width:
-                scaled_pixmap = pixmap.scaledToWidth(column_width, Qt.SmoothTransformation)
-            else:
-                scaled_pixmap = pixmap
-
-            label.setPixmap(scaled_pixmap)
-            label.setFixedSize(scaled_pixmap.size())
-            label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-
-            self.layout.addWidget(label, row, col)
-            self.labels.append(label)
-            col += 1
-            if col >= GRID_COLUMNS:
-                col = 0
-                row += 1
+        self.model.set_items( items )
 
     # -------------------------------------------------------------
+    #   WRW 18-Oct-2026 - Just set the cell size for GRID_COLUMNS columns, was populate_grid()
+    #       of a new label for every thumbnail. Once RESIZE_DELAY ms after a burst of resizes,
+    #       each new size scales the visible thumbnails again.
 
     def resizeEvent( self, event ):
         super().resizeEvent(event)
-        container_width = event.size().width()
-        self.populate_grid( container_width )
+        self.container_width = event.size().width()
+        self.resize_timer.start()
+
+    def set_cell_width( self ):
+        cell_width = int( self.container_width / (GRID_COLUMNS + 1) )      # +1 for spacing and scroll bar, as before
+        cell_width = max( 1, min( cell_width, THUMBNAIL_WIDTH ))
+
+        if cell_width != self.delegate.cell_width:
+            self.delegate.set_cell_width( cell_width )
+            self.view.doItemsLayout()
 
 # ----------------------------------------------------------------------------------------------
 #   /// RESUME - not maintained
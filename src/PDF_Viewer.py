@@ -18,6 +18,7 @@ from PySide6.QtWidgets import QApplication, QLabel, QHBoxLayout, QVBoxLayout, QW
 from PySide6.QtWidgets import QPushButton, QScrollArea, QScrollBar, QMainWindow, QSizePolicy
 
 from bl_metadata_panel import BL_Metadata_Panel
+from bl_pdf_render import PageCache, PageRenderer, DocumentPool, Render_Ahead, Render_Ahead_Delay, Preview_Scale, Resize_Delay, get_view_scale
 from Store import Store
 from bl_style import getOneStyle                  
 
@@ -444,6 +445,34 @@ class PDFViewer( QWidget ):
         self.mouse_state = 'up'
         self.current_pixmap_y = None                                                                                         
         self.current_file = None
+        self.pdf_document = None
+
+        #   WRW 18-Oct-2026 - Cache of rendered pages and render-ahead of neighbors, see bl_pdf_render.py
+        self.pdf_data = None                # pdf bytes when loaded from stream
+        self.view = None                    # ( fit, zoom, width, height ) set by get_view()
+        self.cache_view = None              # view of the images in page_cache
+        self.pending = None                 # ( file, page, view ) requested for display
+        self.page_cache = PageCache()
+        self.document_pool = DocumentPool()     # Open documents by path and mtime for load_pdf()
+        self.renderer = PageRenderer( self )
+        self.renderer.sig_rendered.connect( self.on_page_rendered )
+
+        #   WRW 18-Oct-2026 - Image shown and its view, scaled to new size during resize.
+        #   resize_timer coalesces a burst of resize events into one render of the final size.
+        self.shown_image = None
+        self.shown_view = None
+        self.resize_timer = QTimer( self )
+        self.resize_timer.setSingleShot( True )
+        self.resize_timer.setInterval( Resize_Delay )
+        self.resize_timer.timeout.connect( self.refresh_size_done )
+
+        #   WRW 18-Oct-2026 - Render-ahead starts Render_Ahead_Delay after the last page turn, not on
+        #       each one, while flipping quickly or dragging the slider.
+        self.ahead_page = None
+        self.ahead_timer = QTimer( self )
+        self.ahead_timer.setSingleShot( True )
+        self.ahead_timer.setInterval( Render_Ahead_Delay )
+        self.ahead_timer.timeout.connect( self.render_ahead_now )
 
         self.layout = QHBoxLayout(self)
 
@@ -457,6 +486,7 @@ class PDFViewer( QWidget ):
 
         s.sigman.register_slot( "slot_load_pdf",                    self.load_pdf )
         s.sigman.register_slot( "slot_change_pdf_page",             self.change_pdf_page )
+        s.sigman.register_slot( "slot_stop_renderer",               self.renderer.stop )           # WRW 18-Oct-2026
         
         # --------------------------------------------------------
         #   Navigation and zoom controls.
@@ -518,10 +548,14 @@ class PDFViewer( QWidget ):
     # ------------------------------------------------------------
     #   WRW 3-Mar-2025 - added support for stream for use with file from pyside resource facility.
 
+    #   WRW 18-Oct-2026 - Documents from files come from document_pool, already open when the
+    #       book was shown recently. The page cache is kept when it is the same document.
+
     @Slot( object, str, int )
     def load_pdf( self, stream=None, file=None, page=None ):
         s = Store()
         self.current_file = file
+        prior_document = self.pdf_document
 
         page -= 1       # User-facing page numbers are 1-based, pdf files are 0-based.   /// PAGE
 
@@ -539,7 +573,7 @@ class PDFViewer( QWidget ):
 
             try:
                 if Path( file ).suffix.lower() == '.pdf':       # WRW 7-Apr-2025 - Don't let fitz.open() barf.
-                    self.pdf_document = fitz.open(file)         # Load the PDF document
+                    self.pdf_document = self.document_pool.get( file )      # Load the PDF document, was fitz.open(file)
                 else:
                     s.msgInfo( f"File: {file} is not a .pdf file. Please select a .pdf file" )
                     return
@@ -553,6 +587,16 @@ class PDFViewer( QWidget ):
         self.page_count = self.pdf_document.page_count
         self.current_page = page
 
+        self.pdf_data = stream.getvalue() if stream else None      # WRW 18-Oct-2026 - For render processes
+        if stream or self.pdf_document is not prior_document:
+            self.page_cache.clear()
+        self.renderer.cancel()
+        self.resize_timer.stop()
+        self.ahead_timer.stop()
+        self.pending = None
+        self.shown_image = None
+        self.shown_view = None
+
         #   Emit native sig_pdf_changed on new pdf file, connected to controls pdf_changed.
         self.sig_pdf_changed.emit( self.page_count )
         s.sigman.emit( "sig_pdf_changed", self.page_count )
@@ -560,16 +604,6 @@ class PDFViewer( QWidget ):
         #   WRW 7-Mar-2025 Call refresh() AFTER update page_count, this threw a curve ball when BEFORE.
         self.refresh( False )   # No managed page_changed signal on initial load, called explicitly in calling routine
 
-    # ---------------------------------------------------------------------------------
-    #   Fetch a pixmap for page_number and show it in label.                    
-
-    def OMIT_show_page( self, page_number ):
-        if 0 <= page_number < self.page_count:
-            qpixmap = self.get_image( page_number )         # ******
-            self.label.setPixmap( qpixmap )
-        else:
-            self.label.setText("Page out of range.")
-
     # ---------------------------------------------------------------------------------
 
     def getPageCount( self ):
@@ -625,7 +659,7 @@ class PDFViewer( QWidget ):
 
     #   WRW 31-Mar-2025 - A simple solution for a nagging problem
     #   After return from FullScreen it takes Qt some time for the UI to stabilize. The QTimer.singleShot()
-    #   delays refresh until such is done. Without it the viewport size in get_zoom_from_fit() was the full screen
+    #   delays refresh until such is done. Without it the viewport size in get_view(), was get_zoom_from_fit(), was the full screen
     #   one and the displayed image was much too big. A little help from chat but this was my own solution.
 
     def set_state( self, fit, zoom ):   # 29-Mar-2025
@@ -651,24 +685,104 @@ class PDFViewer( QWidget ):
         self.refresh( True )
 
     # --------------------------------------------------------------
-    #   Return pixmap of given zoom and page
-
-    def get_image( self, page_number):
-
-        if page_number < self.page_count:
-            fitz.TOOLS.mupdf_display_errors(False)  # Suppress error messages in books with alpha-numbered front matter.
-          # self.dlist = self.pdf_document[ page_number ].get_displaylist()
-            fitz.TOOLS.mupdf_display_errors(True)
-            zoom = self.get_zoom_from_fit()
-            matrix = fitz.Matrix( zoom, zoom )
-            page = self.pdf_document[page_number]   # ***** Previously used get_displaylist()
-            scaled_pix = page.get_pixmap( matrix = matrix )
-            qimage = QImage(scaled_pix.samples, scaled_pix.width, scaled_pix.height, scaled_pix.stride, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qimage)
-            return pixmap
+    #   Show page of current view in label.
+    #   WRW 18-Oct-2026 - Was get_image(), which rendered the page here. Now the page comes from
+    #       page_cache when there. Otherwise it is requested from the renderer and shown by
+    #       on_page_rendered() when it arrives, the prior page stays up until then. Either way
+    #       render-ahead of the pages around it is started. The cache is cleared when the view
+    #       changes and in load_pdf(). No PyMuPDF calls here, rendering is in the render processes.
+
+    def show_page( self, page_number ):
+        self.get_view()                     # Sets self.view
+        view = self.view
+
+        if view != self.cache_view:
+            self.page_cache.clear()
+            self.renderer.cancel()
+            self.cache_view = view
+
+        key = ( self.current_file, page_number, view )
+        entry = self.page_cache.get( key )
+
+        if entry:
+            self.pending = None
+            self.set_image( *entry, view )
+            self.render_ahead( page_number, view )
+
+        elif key != self.pending:
+            self.pending = key
+            self.ahead_timer.stop()
+            self.renderer.request( self.current_file, self.pdf_data, page_number, view )
 
-        else:
-            return None
+    # --------------------------------------------------------------
+
+    def set_image( self, qimage, zoom, view ):
+        self.zoom = zoom                    # Zoom of page shown, starting point for zoom_in(), zoom_out()
+        self.shown_image = qimage
+        self.shown_view = view
+        pixmap = QPixmap.fromImage(qimage)
+        self.label.setPixmap( pixmap )      # *** Display PDF file here.
+
+    # --------------------------------------------------------------
+    #   WRW 18-Oct-2026 - Show qimage, e.g., a preview or the image of the prior size, scaled.
+    #       Not shown_image, that is always a full resolution one.
+
+    def set_scaled_image( self, qimage, scale ):
+        size = qimage.size() * scale
+        pixmap = QPixmap.fromImage( qimage.scaled( size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation ))
+        self.label.setPixmap( pixmap )
+
+    # --------------------------------------------------------------
+    #   WRW 18-Oct-2026 - Render the Render_Ahead pages after and before page_number, nearest
+    #       first, that are not already in the cache. Started by ahead_timer, a new page turn
+    #       restarts it.
+
+    def render_ahead( self, page_number, view ):
+        self.ahead_page = ( page_number, view )
+        self.ahead_timer.start()
+
+    def render_ahead_now( self ):
+        page_number, view = self.ahead_page
+        if page_number != self.current_page or view != self.cache_view:     # Stale, e.g., new file or size
+            return
+
+        pages = []
+        for offset in range( 1, Render_Ahead + 1 ):
+            for page in ( page_number + offset, page_number - offset ):
+                if 0 <= page < self.page_count and ( self.current_file, page, view ) not in self.page_cache:
+                    pages.append( page )
+
+        if pages:
+            self.renderer.render_ahead( self.current_file, self.pdf_data, pages, view )
+
+    # --------------------------------------------------------------
+    #   Requested and render-ahead pages from renderer.
+
+    #   WRW 18-Oct-2026 - Preview of requested page shown scaled up until the sharp one arrives.
+
+    @Slot( str, int, object, object, object, bool )
+    def on_page_rendered( self, file, page, view, qimage, zoom, preview ):
+        key = ( file, page, view )
+
+        if qimage is None:
+            if key == self.pending:
+                self.pending = None
+                self.label.setText( f"ERROR: page render failed, page: {page}")
+            return
+
+        if preview:
+            if key == self.pending:
+                self.zoom = zoom
+                self.set_scaled_image( qimage, 1 / Preview_Scale )
+            return
+
+        if file == self.current_file and view == self.cache_view:
+            self.page_cache.put( key, qimage, zoom )
+
+        if key == self.pending:
+            self.pending = None
+            self.set_image( qimage, zoom, view )
+            self.render_ahead( page, view )
     
     # --------------------------------------------------------------
     #   Don't want to send a signal when the page is changed by moving the slider.
@@ -697,24 +811,19 @@ class PDFViewer( QWidget ):
         self.mouse_state = 'up'
 
         if 0 <= self.current_page < self.page_count:            # /// PAGE
-            qpixmap = self.get_image( self.current_page )       # *** Get PDF image here of given size/zoom
-            if qpixmap:
-                self.label.setPixmap( qpixmap )                 # *** Display PDF file here.
-
-                #   /// WRW 7-Mar-2025 - Move following emit outside the 'if send_signal' block.
-                #       to set slider position when pdf loaded
+            self.show_page( self.current_page )                 # *** Get PDF image here of given size/zoom, may arrive later
 
-                # print( "/// calling emit page_changed_signal" )
-                self.page_changed_signal.emit( self.current_page )   # Native - set slider position in controls.
+            #   /// WRW 7-Mar-2025 - Move following emit outside the 'if send_signal' block.
+            #       to set slider position when pdf loaded
 
-                if send_signal:
-                    # /// WRW 7-Mar-2025 - Move following emit inside the 'if send_signal' block.
-                    #   To correct duplicate call to bl_media.py proc_sheet()
+            # print( "/// calling emit page_changed_signal" )
+            self.page_changed_signal.emit( self.current_page )   # Native - set slider position in controls.
 
-                    s.sigman.emit( "sig_pdf_page_changed", self.current_page+1 )  # Managed   /// PAGE Add 1 to return to user numbering
+            if send_signal:
+                # /// WRW 7-Mar-2025 - Move following emit inside the 'if send_signal' block.
+                #   To correct duplicate call to bl_media.py proc_sheet()
 
-            else:
-                self.label.setText( f"ERROR: get_image() failed, page: {self.current_page}")
+                s.sigman.emit( "sig_pdf_page_changed", self.current_page+1 )  # Managed   /// PAGE Add 1 to return to user numbering
 
         else:
             self.label.setText( f"Page '{self.current_page}' out of range '1' - '{self.page_count}'.")
@@ -722,21 +831,39 @@ class PDFViewer( QWidget ):
     # --------------------------------------------------------------
     #   WRW 19-Apr-2025 - Try updating just pdf page, nothing else, call from resize. Try to reduce
     #       number of signals emitted on resize. Maybe packed too much into refresh()
+    #   WRW 18-Oct-2026 - During a burst of resize events show the image of the prior size scaled
+    #       to the new one and render only once, Resize_Delay ms after the last event.
 
     def refresh_size( self ):
         if not self.current_file or self.external_viewer:
             return
 
         if 0 <= self.current_page < self.page_count:            # /// PAGE
-            qpixmap = self.get_image( self.current_page )       # *** Get PDF image here of given size/zoom
-            if qpixmap:
-                self.label.setPixmap( qpixmap )                 # *** Display PDF file here.
+            view = self.get_view()
+
+            if ( self.current_file, self.current_page, view ) in self.page_cache:
+                self.resize_timer.stop()
+                self.show_page( self.current_page )             # *** Get PDF image here of given size/zoom
+                return
+
+            scale = get_view_scale( self.shown_view, view )
+            if self.shown_image is not None and scale:
+                self.set_scaled_image( self.shown_image, scale )
+
+            self.resize_timer.start()
+
+    def refresh_size_done( self ):
+        if 0 <= self.current_page < self.page_count:            # /// PAGE
+            self.show_page( self.current_page )                 # *** Get PDF image here of given size/zoom
 
     # --------------------------------------------------------------
-    #   Get zoom factor from current graph size, not saved graph size, and page size.
-    #   'graph' terminology came from pysimplegui.
+    #   Get the view, ( fit, user zoom, graph width, graph height ), from current graph size,
+    #   not saved graph size. 'graph' terminology came from pysimplegui.
+    #   WRW 18-Oct-2026 - Was get_zoom_from_fit(), which also got the page size and the zoom.
+    #       Those are now got by the render thread with get_zoom_for_page(), self.zoom is set
+    #       when the page is shown.
 
-    def get_zoom_from_fit( self ):
+    def get_view( self ):
         if self.pdf_document:
             # if self.current_page >= self.page_count:
             #     t = f"ERROR: Selected page {self.current_page +1} exceeds document page count {self.page_count +1}"
@@ -761,37 +888,11 @@ class PDFViewer( QWidget ):
 
             # print(f"Visible Area: {visible_rect.width()}x{visible_rect.height()}")
 
-            fitz.TOOLS.mupdf_display_errors(False)  # Suppress error messages in books with alpha-numbered front matter.
-           #  r = self.pdf_document[self.current_page].get_displaylist().rect
-            r = self.pdf_document[self.current_page].rect       # LATER - understand why don't need displaylist from earlier work.
-            fitz.TOOLS.mupdf_display_errors(True)
-            self.page_height = (r.br - r.tr).y
-            self.page_width =  (r.tr - r.tl).x
-
-            if self.fit == 'Full':
-                self.zoom = 1
+            #   User zoom only part of view for fit 'User', otherwise it is the result.
 
-            elif self.fit == 'Height':
-                if self.current_page < self.page_count:
-                    self.zoom = graph_height / self.page_height
-
-            elif self.fit == 'Width':
-                if self.current_page < self.page_count:
-                    self.zoom = graph_width / self.page_width
-
-            elif self.fit == 'Both':
-                if self.current_page < self.page_count:
-                    zoom_width = graph_width / self.page_width
-                    zoom_height = graph_height / self.page_height
-                    self.zoom = min( zoom_width, zoom_height )
-
-            elif self.fit == 'User':        # After user adjusted zoom setting with +/-.
-                return self.zoom
-
-            else:
-                self.zoom = 1
+            self.view = ( self.fit, self.zoom if self.fit == 'User' else None, graph_width, graph_height )
 
-        return self.zoom
+        return self.view
     
     # ---------------------------------------------------------------------------------------
     #   Handle key events ONLY in this widget.
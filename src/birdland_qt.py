@@ -243,6 +243,8 @@ from fb_config import Config
 from fb_utils import FB
 from bl_constants import MT
 from fb_setlist import SetList
+from bl_search_exec import SearchExec
+from bl_title_index import TitleIndex
 from bl_connections import MakeConnections, RegisterNonClassSignals
 from fb_make_desktop import make_desktop
 
@@ -545,6 +547,8 @@ def initialize_modules():
     s.conf.update_dict()                                # OK - Tell data_dict to look at s.driver to add MYSQL-specific options
     s.fb = FB()                                         # OK - appropriate
     s.setlist = SetList()                               # OK - s.setlist required for late initialization
+    s.search_exec = SearchExec()                        # WRW 18-Oct-2026 - Concurrent searches off the GUI thread
+    s.title_index = TitleIndex()                        # WRW 18-Oct-2026 - Search-as-you-type title completions
 
     #   Call media objects to initialize signals and slots
     #   Works OK but should I save return object in permanent storage to keep from going out of scope?
@@ -600,6 +604,9 @@ def do_full_exit():
     if s.sigman.sig_registered( "sig_stopping" ):
         s.sigman.emit( "sig_stopping" )         # Stop/close media. Save tab order. Maybe more later.
 
+    if s.search_exec:
+        s.search_exec.stop()
+
     if s.conn:
         s.conn.close()
 
@@ -646,10 +653,11 @@ class Options():        # Just to hold command-line options
 @click.option( "-r", "--record",                        help="Record user interactions" )
 @click.option( "-R", "--playback",                      help="Playback user interactions" )
 @click.option( "-D", "--debug", is_flag=True,           help="Debug - enable selected messages" )
+@click.option( "--fts", is_flag=True,                   help="Use Sqlite FTS5 full-text search, also set by use_fts_search setting" )
 
-def do_main( confdir, userdatadir, database, progress, verbose, record, playback, debug ):
+def do_main( confdir, userdatadir, database, progress, verbose, record, playback, debug, fts ):
     s = Store()                                 # Global store, short var name since used a lot.
-    QTimer.singleShot(100, lambda: do_main_continue_a( confdir, userdatadir, database, progress, verbose, record, playback, debug ))
+    QTimer.singleShot(100, lambda: do_main_continue_a( confdir, userdatadir, database, progress, verbose, record, playback, debug, fts ))
 
     sys.excepthook = exception_hook         # WRW 16-May-2025 - catch exceptions in event loop.
     sys.exit( s.app.exec() )
@@ -658,11 +666,11 @@ def do_main( confdir, userdatadir, database, progress, verbose, record, playback
 #   This is an attempt to pick up exceptions that occur while the splash screen
 #   is still up and caused a hang.
 
-def do_main_continue_a( confdir, userdatadir, database, progress, verbose, record, playback, debug ):
+def do_main_continue_a( confdir, userdatadir, database, progress, verbose, record, playback, debug, fts ):
     s = Store()                                 # Global store, short var name since used a lot.
 
     try:
-        do_main_continue_b( confdir, userdatadir, database, progress, verbose, record, playback, debug )
+        do_main_continue_b( confdir, userdatadir, database, progress, verbose, record, playback, debug, fts )
 
     except Exception:
         (extype, value, xtraceback) = sys.exc_info()
@@ -691,7 +699,7 @@ def do_main_continue_a( confdir, userdatadir, database, progress, verbose, recor
 # ----------------------------------------------------------
 #   WRW 17-Apr-2025 - Continue with original content of do_main() after a short oneshot enclosure in and try/except.
 
-def do_main_continue_b( confdir, userdatadir, database, progress, verbose, record, playback, debug ):
+def do_main_continue_b( confdir, userdatadir, database, progress, verbose, record, playback, debug, fts ):
     s = Store()                                 # Global store, short var name since used a lot.
     s.splash_pix.progress( "Startup" )
 
@@ -725,6 +733,7 @@ def do_main_continue_b( confdir, userdatadir, database, progress, verbose, recor
     s.Options.record = record
     s.Options.playback = playback
     s.Options.debug = debug
+    s.Options.fts = fts
 
     # --------------------------------------------------------------------
     #   s.driver is used extensively, define it here and preserve it as is even though a little awkward.
@@ -891,6 +900,12 @@ def do_main_continue_b( confdir, userdatadir, database, progress, verbose, recor
 
     s.conf.set_class_variables()
 
+    #   WRW 18-Oct-2026 - Sqlite FTS5 search by option or setting. Falls back to the word
+    #       index or my_match_c() for any table without an FTS table, see get_fulltext().
+
+    if s.driver.sqlite and ( s.Options.fts or s.conf.val( 'use_fts_search' ) ):
+        s.driver.fullword = True
+
     # -----------------------------------------------------------------------
     #   WRW 20-May-2025 - Added for consistency with build_tables.py
     #   Another check for pathological cases. By now
@@ -1180,6 +1195,13 @@ def do_main_continue_b( confdir, userdatadir, database, progress, verbose, recor
         s.sigman.emit( "sig_title_focus" )
 
         # -----------------------------------------------------------
+        #   WRW 18-Oct-2026 - Load the title completion index in the background
+        #       once the splash is down, only if it will be used.
+
+        if s.conf.val( 'search_as_you_type' ):
+            s.title_index.load()
+
+        # -----------------------------------------------------------
 
     QTimer.singleShot(50, finish_splash )
 
@@ -6,6 +6,7 @@
 
 import os
 import sys
+import multiprocessing
 from pathlib import Path
 from contextlib import contextmanager
 import traceback
@@ -38,6 +39,11 @@ def myPrep( source ):
 # -----------------------------------------------------------
 
 def main():
+    #   WRW 18-Oct-2026 - For process pools (build_tables.py, PDF_Browser.py) when frozen. Runs the
+    #       worker and exits when started as one, must precede the argv dispatch. No-op otherwise.
+
+    multiprocessing.freeze_support()
+
     if len( sys.argv ) > 1:
         sys.argv.pop(0)
         if sys.argv[0] == "build_tables":
@@ -22,6 +22,7 @@ import sys
 from pathlib import Path
 import tempfile
 import shutil
+from dataclasses import dataclass
 
 from PySide6.QtCore import Slot, QModelIndex
 from PySide6.QtWidgets import QApplication, QPushButton, QLabel, QVBoxLayout, QWidget
@@ -50,158 +51,164 @@ def _initialize_on_import():
 #   Search - Get search parameters from text boxes, search each of the
 #       primary DB tables, and populate the UI tables.
 
-@Slot( str )
-def search_box_return_pressed( title, composer, lyricist, artist, album, src, canonical, 
-                          xdup_none, xdup_titles, xdup_canonicals, xdup_srcs, join_flag ):
-    s = Store()
+#   WRW 18-Oct-2026 - Split into one function per table so that each can run on a
+#       worker thread, see bl_search_exec.py. Each takes SearchParams and returns
+#       ( data, count ) with data ready for the table. Status and tab selection
+#       moved to report_search_results(), called after all tables have reported.
+
+@dataclass
+class SearchParams:
+    title: str
+    composer: str
+    lyricist: str
+    artist: str
+    album: str
+    src: str
+    canonical: str
+    xdup_none: bool
+    xdup_titles: bool
+    xdup_canonicals: bool
+    xdup_srcs: bool
+    join_flag: bool
 
-    statusText = []
-    selectedTab = None
-
-    # s.selectTab( MT.Index )
-
-    # ------------------------------------------------------------------------------------
-    #   Music Index
+# ------------------------------------------------------------------------------------
+#   Music Index
 
+def search_music_index( p ):
     columns = [ 'title', 'composer', 'canonical', 'page', 'sheet', 'src', 'local', 'file' ]
 
-    data = []
-    if join_flag:
-        rows, pdf_count = fb_search.do_query_music_file_index_with_join( title, composer, lyricist, album, artist, src, canonical )
+    if p.join_flag:
+        rows, pdf_count = fb_search.do_query_music_file_index_with_join( p.title, p.composer, p.lyricist, p.album, p.artist, p.src, p.canonical )
     else:
-        rows, pdf_count = fb_search.do_query_music_file_index_with_join( title, composer, lyricist, None, None, src, canonical )
+        rows, pdf_count = fb_search.do_query_music_file_index_with_join( p.title, p.composer, p.lyricist, None, None, p.src, p.canonical )
 
-    if xdup_titles:
+    if p.xdup_titles:
         rows = fb_search.select_unique_titles( rows )
 
-    elif xdup_canonicals:
+    elif p.xdup_canonicals:
         rows = fb_search.select_unique_canonicals( rows )
 
-    elif xdup_srcs:
+    elif p.xdup_srcs:
         rows = fb_search.select_unique_srcs( rows )
 
-    for row in rows:
-        # irow = [ QStandardItem(row[col]) for col in columns ]
-        irow = [ row[col] for col in columns ]
-        data.append( irow )
+    # irow = [ QStandardItem(row[col]) for col in columns ]
+    data = [ [ row[col] for col in columns ] for row in rows ]
+    return data, pdf_count
 
-    s.sigman.emit( "sig_music_table_data", data )    # WRW 14-Feb-2025 - completely decoupled signal/slot approach.
-    statusText.append( f"<b>Music Index:</b> {pdf_count}" )
-    if not selectedTab and pdf_count:
-        selectedTab = MT.Index
-
-    # ------------------------------------------------------------------------------------
-    #   Audio files
-    #       main_tab_bar.setCurrentIndex(4)
+# ------------------------------------------------------------------------------------
+#   Audio files
 
+def search_audio( p ):
     columns = [ 'title', 'artist', 'album', 'file' ]
+    rows, count = fb_search.do_query_audio_files_index( p.title, p.album, p.artist )
+    data = [ [ row[col] for col in columns ] for row in rows ]
+    return data, count
 
-    rows, count = fb_search.do_query_audio_files_index( title, album, artist )
-    data = []
-    for row in rows:
-        # irow = [ QStandardItem(row[col]) for col in columns ]
-        irow = [ row[col] for col in columns ]
-        data.append( irow )
-
-    s.sigman.emit( "sig_audio_table_data", data )    # WRW 14-Feb-2025 - completely decoupled signal/slot approach.
-    statusText.append( f"<b>Audio:</b> {count}" )
-    if not selectedTab and count:
-        selectedTab = MT.Audio
-
-    # ------------------------------------------------------------------------------------
-    #   Music Files
+# ------------------------------------------------------------------------------------
+#   Music Files
 
+def search_music_files( p ):
     columns = [ 'path', 'file' ]
+    rows, count = fb_search.do_query_music_filename( p.title )
+    data = [ [ row[col] for col in columns ] for row in rows ]
+    return data, count
 
-    rows, count = fb_search.do_query_music_filename( title )
-    data = []
-    for row in rows:
-        # irow = [ QStandardItem( row[col]) for col in columns ]
-        irow = [ row[col] for col in columns ]
-        data.append( irow )
-
-    s.sigman.emit( "sig_music_files_table_data", data )    # WRW 14-Feb-2025 - completely decoupled signal/slot approach.
-    statusText.append( f"<b>Music Files:</b> {count}" )
-    if not selectedTab and count:
-        selectedTab = MT.Files
-
-    # ------------------------------------------------------------------------------------
-    #   Midi Files
+# ------------------------------------------------------------------------------------
+#   Midi Files
 
+def search_midi( p ):
     columns = [ 'title', 'composer', 'path', 'file' ]
+    rows, count = fb_search.do_query_midi_filename( p.title, p.composer )
+    data = [ [ str(row[col]) for col in columns ] for row in rows ]
+    return data, count
 
-    rows, count = fb_search.do_query_midi_filename( title, composer )
-    data = []
-    for row in rows:
-        # irow = [ QStandardItem( row[col]) for col in columns ]
-        irow = [ str(row[col]) for col in columns ]
-        data.append( irow )
-
-    s.sigman.emit( "sig_midi_table_data", data )    # WRW 14-Feb-2025 - completely decoupled signal/slot approach.
-    statusText.append( f"<b>Midi Files:</b> {count}" )
-    if not selectedTab and count:
-        selectedTab = MT.Midi
-
-    # ------------------------------------------------------------------------------------
-    #   ChordPro Files
+# ------------------------------------------------------------------------------------
+#   ChordPro Files
 
+def search_chordpro( p ):
     columns = [ 'title', 'artist', 'file' ]
+    rows, count = fb_search.do_query_chordpro( p.title, p.artist )
+    data = [ [ row[col] for col in columns ] for row in rows ]
+    return data, count
 
-    rows, count = fb_search.do_query_chordpro( title, artist )
-    data = []
-    for row in rows:
-        # irow = [ QStandardItem( row[col]) for col in columns ]
-        irow = [ row[col] for col in columns ]
-        data.append( irow )
-
-    s.sigman.emit( "sig_chordpro_table_data", data )    # WRW 14-Feb-2025 - completely decoupled signal/slot approach.
-    statusText.append( f"<b>ChordPro Files:</b> {count}" )
-    if not selectedTab and count:
-        selectedTab = MT.Chord
-
-    # ------------------------------------------------------------------------------------
-    #   JJazzLab Files
+# ------------------------------------------------------------------------------------
+#   JJazzLab Files
 
+def search_jjazzlab( p ):
     columns = [ 'title', 'file' ]
+    rows, count = fb_search.do_query_jjazz_filename( p.title )
+    data = [ [ row[col] for col in columns ] for row in rows ]
+    return data, count
 
-    rows, count = fb_search.do_query_jjazz_filename( title )
-    data = []
-    for row in rows:
-        # irow = [ QStandardItem( row[col]) for col in columns ]
-        irow = [ row[col] for col in columns ]
-        data.append( irow )
-
-    s.sigman.emit( "sig_jjazzlab_table_data", data )    # WRW 14-Feb-2025 - completely decoupled signal/slot approach.
-    statusText.append( f"<b>JJazzLab Files:</b> {count}" )
-    if not selectedTab and count:
-        selectedTab = MT.JJazz
-
-    # ------------------------------------------------------------------------------------
-    #   YouTube Index
-    #   WRW 23-May-2025 - duration removed
+# ------------------------------------------------------------------------------------
+#   YouTube Index
+#   WRW 23-May-2025 - duration removed
 
+def search_youtube( p ):
     # columns = [ 'title', 'ytitle', 'duration', 'yt_id' ]     # yt_id column is returned but not displayed
     columns = [ 'title', 'ytitle', 'yt_id' ]     # yt_id column is returned but not displayed
+    rows, count = fb_search.do_query_youtube_index( p.title )
+    data = [ [ row[col] for col in columns ] for row in rows ]
+    return data, count
 
-    rows, count = fb_search.do_query_youtube_index( title )
-    data = []
-    for row in rows:
-        # irow = [ QStandardItem( row[col]) for col in columns ]
-        irow = [ row[col] for col in columns ]
-        data.append( irow )
+# ------------------------------------------------------------------------------------
+#   In status bar and tab selection order.
+
+Search_Tables = [
+    # Signal                          Function              Status label         Tab
+    ( "sig_music_table_data",         search_music_index,   "Music Index",       MT.Index ),
+    ( "sig_audio_table_data",         search_audio,         "Audio",             MT.Audio ),
+    ( "sig_music_files_table_data",   search_music_files,   "Music Files",       MT.Files ),
+    ( "sig_midi_table_data",          search_midi,          "Midi Files",        MT.Midi ),
+    ( "sig_chordpro_table_data",      search_chordpro,      "ChordPro Files",    MT.Chord ),
+    ( "sig_jjazzlab_table_data",      search_jjazzlab,      "JJazzLab Files",    MT.JJazz ),
+    ( "sig_youtube_table_data",       search_youtube,       "YouTube Index",     MT.YouTube ),
+]
 
-    s.sigman.emit( "sig_youtube_table_data", data )    # WRW 14-Feb-2025 - completely decoupled signal/slot approach.
-    statusText.append( f"<b>YouTube Index:</b> {count}" )
-    if not selectedTab and count:
-        selectedTab = MT.YouTube
+# ------------------------------------------------------------------------------------
+#   Report search results. Status bar is expected receiver.
+
+def report_search_results( counts ):
+    s = Store()
+
+    statusText = []
+    selectedTab = None
 
-    # ------------------------------------------------------------------------------------
-    #   Report search results. Status bar is expected receiver.
+    for ( signal_name, fcn, label, tab ), count in zip( Search_Tables, counts ):
+        statusText.append( f"<b>{label}:</b> {count}" )
+        if not selectedTab and count:
+            selectedTab = tab
 
     s.sigman.emit( "sig_search_results", ', '.join( statusText ) )
     if selectedTab:
         s.selectTab( selectedTab )
 
+# ------------------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - With sqlite the tables are searched concurrently by s.search_exec,
+#       each table populated as its result arrives. MySQL connections are not shared
+#       across threads, search serially there as before.
+
+@Slot( str )
+def search_box_return_pressed( title, composer, lyricist, artist, album, src, canonical, 
+                          xdup_none, xdup_titles, xdup_canonicals, xdup_srcs, join_flag ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    params = SearchParams( title, composer, lyricist, artist, album, src, canonical,
+                           xdup_none, xdup_titles, xdup_canonicals, xdup_srcs, join_flag )
+
+    if SQLITE:
+        tables = [ ( signal_name, fcn ) for signal_name, fcn, label, tab in Search_Tables ]
+        s.search_exec.start( tables, params, report_search_results )
+
+    else:
+        counts = []
+        for signal_name, fcn, label, tab in Search_Tables:
+            data, count = fcn( params )
+            s.sigman.emit( signal_name, data )    # WRW 14-Feb-2025 - completely decoupled signal/slot approach.
+            counts.append( count )
+        report_search_results( counts )
+
 
 # ==============================================================================
 #   WRW 14-Feb-2025 - signal emitter in bl_tables.py now fetches data, does not send row/col
@@ -345,7 +345,7 @@ class Canon2FileTab( QWidget ):
                 index = model.index(row, 0)
                 proxy_index = proxy_model.mapFromSource(index)
                 selection_model.clearSelection()     # Clear prior, single selection only applies to user interaction.
-                selection_model.select( index, QItemSelectionModel.Select | QItemSelectionModel.Rows ) 
+                selection_model.select( proxy_index, QItemSelectionModel.Select | QItemSelectionModel.Rows )     # WRW 18-Oct-2026 - was index, source model
                 view.scrollTo(proxy_index, QAbstractItemView.PositionAtCenter )
                 break
 
@@ -376,7 +376,7 @@ class Canon2FileTab( QWidget ):
                 index = link_model.index(row, 0)
                 proxy_index = proxy_model.mapFromSource(index)
                 selection_model.clearSelection()     # Clear prior, single selection only applies to user interaction.
-                selection_model.select( index, QItemSelectionModel.Select | QItemSelectionModel.Rows ) 
+                selection_model.select( proxy_index, QItemSelectionModel.Select | QItemSelectionModel.Rows )     # WRW 18-Oct-2026 - was index, source model
                 view.scrollTo(proxy_index, QAbstractItemView.PositionAtCenter )
                 break
 
@@ -170,6 +170,8 @@ class MakeConnections():
             ( "sig_stopping",                           "slot_close_chord" ),
             ( "sig_stopping",                           "slot_close_midi" ),
             ( "sig_stopping",                           "slot_close_youtube" ),
+            ( "sig_stopping",                           "slot_stop_thumbnails" ),          # WRW 18-Oct-2026
+            ( "sig_stopping",                           "slot_stop_renderer" ),            # WRW 18-Oct-2026
 
           # ( "sig_starting",                           "slot_restore_tab_order" ),         # WRW 3-June-2025 no longer used
           # ( "sig_stopping",                           "slot_save_tab_order" ),            # WRW 3-June-2025 no longer used
@@ -142,6 +142,8 @@ class Const( ):
     Local2Canon_File =          'Local2Canon.txt'
     Local_Book_Names_File =     'Local-Book-Names.txt'
     audioFileIndexFile =        'Audio-Index.json.gz'
+    audioTagCacheFile =         'Audio-Tag-Cache.db'        # WRW 18-Oct-2026 - build_tables.py --scan_audio
+    Packed_Index_File =         'Packed-Index.db'           # WRW 18-Oct-2026 - {src}-Packed-Index.db in Music-Index
     Example_Canonical2File =    'Example-Canonical2File.txt'
     Sheet_Offsets_File =        'Sheet-Offsets.txt'
 
@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+# ----------------------------------------------------------------------------
+#   bl_pdf_render.py
+
+#   WRW 18-Oct-2026 - Page image cache and render-ahead for PDFViewer. Every page turn,
+#       slider move, and resize rasterized the page with get_pixmap() on the spot,
+#       100-300 ms for dense fakebook scans.
+
+#   PageCache is an LRU of page QImages keyed by ( file, page, view ) with a memory
+#       budget. view is what the zoom is computed from, ( fit, user zoom, viewport
+#       width, height ), not the zoom itself, which for fit 'Both', 'Width', 'Height'
+#       varies with the size of each page.
+
+#   PageRenderer renders pages on a private pool of render processes, as render_thumbnail().
+#       PyMuPDF holds the GIL while rendering, in a thread it still stalled the GUI. Each
+#       process keeps its own open documents and turns off MuPDF error display once, in
+#       init_render_process(). A process returns the samples, they come back to the main
+#       thread through sig_done (queued connection as PageRenderer lives in the main thread)
+#       and are made into a QImage there.
+
+#   WRW 18-Oct-2026 - Also render the current page here, not on the GUI thread, with
+#       request(). It runs ahead of any render-ahead and a new request() cancels
+#       requests not yet done, e.g., when flipping quickly or dragging the slider. A page
+#       already being rasterized finishes and is cached. cancel() also drops late
+#       results, for a new file or view.
+
+#   WRW 18-Oct-2026 - request() first renders a preview at Preview_Scale of the zoom, quick to
+#       make and shown scaled up until the sharp one arrives. The preview is not cached.
+
+#   WRW 18-Oct-2026 - DocumentPool keeps recently used documents open, keyed by path and
+#       mtime, so going back to a book, e.g., in a setlist, does not parse it again. One for
+#       load_pdf() and one in each render process.
+
+#   WRW 18-Oct-2026 - render_thumbnail() for PDF_Browser.py, run in a process pool. Only fitz,
+#       no Qt objects, the result must be pickled back to the GUI process.
+
+#   Usage:
+#       renderer.sig_rendered.connect( on_rendered )        on_rendered( file, page, view, image, zoom, preview )
+#                                                           image None if rendering failed.
+#       renderer.request( file, data, page, view )          data is pdf bytes if not from file
+#       renderer.render_ahead( file, data, pages, view )
+#       renderer.stop()                                     on exit
+
+# ----------------------------------------------------------------------------
+
+import os
+import sys
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import fitz                 # From PyMuPDF package
+
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QImage
+
+# ----------------------------------------------------------------------------
+
+Page_Cache_Budget = 256 * 1024 * 1024       # bytes
+Render_Ahead = 2                            # pages each side of current page
+Render_Ahead_Delay = 250                    # ms GUI idle after page turn to start render-ahead
+Preview_Scale = 0.25                        # of zoom for preview of requested page
+Resize_Delay = 150                          # ms after last resize event to render new size
+Document_Pool_Size = 6                      # open documents kept
+Render_Processes = 2                        # current page and render-ahead at the same time
+
+# ----------------------------------------------------------------------------
+#   Zoom for page of size rect shown in view. Was inline in PDFViewer.get_zoom_from_fit().
+
+def get_zoom_for_page( rect, view ):
+    fit, zoom, graph_width, graph_height = view
+
+    page_height = (rect.br - rect.tr).y
+    page_width =  (rect.tr - rect.tl).x
+
+    if fit == 'Full':
+        return 1
+
+    elif fit == 'Height':
+        return graph_height / page_height
+
+    elif fit == 'Width':
+        return graph_width / page_width
+
+    elif fit == 'Both':
+        zoom_width = graph_width / page_width
+        zoom_height = graph_height / page_height
+        return min( zoom_width, zoom_height )
+
+    elif fit == 'User':        # After user adjusted zoom setting with +/-.
+        return zoom
+
+    else:
+        return 1
+
+# ----------------------------------------------------------------------------
+#   Approximate scale of a page image shown in old_view to show it in new_view, e.g., while
+#       resizing. None when no sensible scale, e.g., fit changed.
+
+def get_view_scale( old_view, new_view ):
+    if not old_view or not new_view or old_view[0] != new_view[0] or old_view[1] != new_view[1]:
+        return None
+
+    fit, zoom, old_width, old_height = old_view
+    fit, zoom, new_width, new_height = new_view
+
+    if fit == 'Height':
+        return new_height / old_height
+
+    elif fit == 'Width':
+        return new_width / old_width
+
+    elif fit == 'Both':
+        return min( new_width / old_width, new_height / old_height )
+
+    else:
+        return 1
+
+# ----------------------------------------------------------------------------
+#   Rasterize one page at scale of the zoom for view. Returns ( width, height, stride, samples, zoom ),
+#       zoom is the one for view. No Qt objects, run in a render process.
+
+def render_page( doc, page_number, view, scale=1 ):
+    page = doc[ page_number ]
+    zoom = get_zoom_for_page( page.rect, view )
+    pix = page.get_pixmap( matrix = fitz.Matrix( zoom * scale, zoom * scale ) )
+    return pix.width, pix.height, pix.stride, bytes( pix.samples ), zoom
+
+# ----------------------------------------------------------------------------
+
+#   Entries are ( image, zoom ), get() returns one or None.
+
+class PageCache():
+
+    def __init__( self, budget=Page_Cache_Budget ):
+        self.budget = budget
+        self.images = OrderedDict()
+        self.size = 0
+
+    def get( self, key ):
+        entry = self.images.get( key )
+        if entry is not None:
+            self.images.move_to_end( key )
+        return entry
+
+    def put( self, key, image, zoom ):
+        if key in self.images:
+            self.size -= self.images.pop( key )[0].sizeInBytes()
+
+        self.images[ key ] = ( image, zoom )
+        self.size += image.sizeInBytes()
+
+        while self.size > self.budget and len( self.images ) > 1:
+            old_key, ( old_image, old_zoom ) = self.images.popitem( last=False )
+            self.size -= old_image.sizeInBytes()
+
+    def __contains__( self, key ):
+        return key in self.images
+
+    def clear( self ):
+        self.images.clear()
+        self.size = 0
+
+# ----------------------------------------------------------------------------
+#   First page of pdf_path about width pixels wide. Returns ( width, height, stride, alpha, samples ),
+#       raises on a bad file.
+
+def render_thumbnail( pdf_path, width ):
+    doc = fitz.open( pdf_path )
+
+    try:
+        page = doc.load_page( 0 )
+        zoom = width / page.rect.width
+        pix = page.get_pixmap( matrix = fitz.Matrix( zoom, zoom ) )
+        return pix.width, pix.height, pix.stride, pix.alpha, bytes( pix.samples )
+
+    finally:
+        doc.close()
+
+# ----------------------------------------------------------------------------
+#   LRU of open documents keyed by ( file, mtime ). A changed file is opened again.
+#       get() raises as fitz.open() does.
+
+class DocumentPool():
+
+    def __init__( self, size=Document_Pool_Size ):
+        self.size = size
+        self.docs = OrderedDict()
+
+    def get( self, file ):
+        key = ( str( file ), os.stat( file ).st_mtime_ns )
+
+        doc = self.docs.get( key )
+        if doc is not None:
+            self.docs.move_to_end( key )
+            return doc
+
+        for old_key in [ x for x in self.docs if x[0] == key[0] ]:      # Older version of file
+            self.docs.pop( old_key ).close()
+
+        doc = fitz.open( file )
+        self.docs[ key ] = doc
+
+        while len( self.docs ) > self.size:
+            old_key, old_doc = self.docs.popitem( last=False )
+            old_doc.close()
+
+        return doc
+
+    def clear( self ):
+        for doc in self.docs.values():
+            doc.close()
+        self.docs.clear()
+
+# ----------------------------------------------------------------------------
+#   Open documents of a render process, a DocumentPool for files, the last one for data.
+#   Run in the render process, init_render_process() once as it starts.
+
+Process_Docs = None             # DocumentPool
+Process_Data = None             # ( file, data, doc ) for the last pdf from data
+
+def init_render_process():
+    global Process_Docs
+    fitz.TOOLS.mupdf_display_errors(False)  # Suppress error messages in books with alpha-numbered front matter.
+    Process_Docs = DocumentPool()
+
+def get_process_document( file, data ):
+    global Process_Data
+
+    if not data:
+        return Process_Docs.get( file )
+
+    if Process_Data and Process_Data[0] == file and Process_Data[1] == data:
+        return Process_Data[2]
+
+    if Process_Data:
+        Process_Data[2].close()
+
+    doc = fitz.open( stream=data, filetype="pdf" )
+    Process_Data = ( file, data, doc )
+    return doc
+
+def render_process_page( file, data, page_number, view, scale ):
+    return render_page( get_process_document( file, data ), page_number, view, scale )
+
+# ----------------------------------------------------------------------------
+
+class PageRenderer( QObject ):
+    sig_done = Signal( int, str, int, object, bool, object )                  # generation, file, page, view, preview, future, from executor thread
+    sig_rendered = Signal( str, int, object, object, object, bool )           # file, page, view, QImage, zoom, preview
+
+    def __init__( self, parent=None ):
+        super().__init__( parent )
+        self.generation = 0
+        self.request_futures = []
+        self.ahead_futures = []
+        self.pool = self.start_pool()
+        self.sig_done.connect( self.on_done )
+
+    # ----------------------------------------------------------------
+    #   Spawn, not fork, GUI app with threads. Start the processes now, not on the first page.
+
+    def start_pool( self ):
+        pool = ProcessPoolExecutor( max_workers=Render_Processes, mp_context=multiprocessing.get_context( 'spawn' ),
+                                    initializer=init_render_process )
+        for i in range( Render_Processes ):
+            pool.submit( int )
+        return pool
+
+    # ----------------------------------------------------------------
+
+    def submit( self, file, data, page, view, scale ):
+        try:
+            future = self.pool.submit( render_process_page, file, data, page, view, scale )
+
+        except BrokenProcessPool:               # A render process died, e.g., MuPDF crashed on a bad file
+            self.pool.shutdown( wait=False )
+            self.pool = self.start_pool()
+            future = self.pool.submit( render_process_page, file, data, page, view, scale )
+
+        future.add_done_callback( lambda future, generation=self.generation, file=file, page=page, view=view, preview=scale != 1:
+                                  self.sig_done.emit( generation, file, page, view, preview, future ))
+        return future
+
+    # ----------------------------------------------------------------
+    #   Current page, ahead of everything else. Earlier requests and render-ahead are obsolete.
+
+    def request( self, file, data, page, view ):
+        if not self.pool:                       # Stopped
+            return
+
+        self.cancel_futures( 'request_futures' )
+        self.cancel_futures( 'ahead_futures' )
+        self.request_futures = [ self.submit( file, data, page, view, scale ) for scale in ( Preview_Scale, 1 ) ]
+
+    def render_ahead( self, file, data, pages, view ):
+        if not self.pool:
+            return
+
+        self.cancel_futures( 'ahead_futures' )
+        self.ahead_futures = [ self.submit( file, data, page, view, 1 ) for page in pages ]
+
+    #   A page already being rasterized can't be cancelled, it finishes and is cached.
+
+    def cancel_futures( self, name ):
+        for future in getattr( self, name ):
+            future.cancel()
+        setattr( self, name, [] )
+
+    # ----------------------------------------------------------------
+    #   Cancel everything and drop results still to come, for a new file or view.
+
+    def cancel( self ):
+        self.cancel_futures( 'request_futures' )
+        self.cancel_futures( 'ahead_futures' )
+        self.generation += 1
+
+    # ----------------------------------------------------------------
+    #   Rendered page from pool, make the QImage here on the main thread. Copied as it otherwise
+    #       refers to samples.
+
+    @Slot( int, str, int, object, bool, object )
+    def on_done( self, generation, file, page, view, preview, future ):
+        if future.cancelled() or generation != self.generation:
+            return
+
+        try:
+            width, height, stride, samples, zoom = future.result()
+            image = QImage( samples, width, height, stride, QImage.Format_RGB888 ).copy()
+
+        except Exception:
+            (extype, value, traceback) = sys.exc_info()
+            print( f"ERROR on render of page {page} of {file}, type: {extype}, value: {value}", file=sys.stderr )
+            image, zoom = None, None
+
+        self.sig_rendered.emit( file, page, view, image, zoom, preview )
+
+    # ----------------------------------------------------------------
+    #   On exit, by sig_stopping. Drop pages not started yet, don't wait for the others.
+
+    def stop( self ):
+        if self.pool:
+            self.cancel()
+            pool = self.pool
+            self.pool = None
+            pool.shutdown( wait=False, cancel_futures=True )
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# ----------------------------------------------------------------------------
+#   bl_search_exec.py
+
+#   WRW 18-Oct-2026 - Run the per-table searches for search_box_return_pressed()
+#       concurrently off the GUI thread. Previously the seven queries ran one after
+#       another on the main thread and the UI froze for the sum of all of them.
+
+#   Each search runs as a QRunnable on a private QThreadPool. Each pool thread
+#       opens its own read-only sqlite connection, once, and installs its cursor with
+#       s.fb.set_thread_dc() so the fb_search.py queries use it instead of s.dc.
+
+#   Results come back to the main thread through sig_result (queued connection as
+#       SearchExec lives in the main thread) and are sent on with s.sigman.emit()
+#       as each table is ready. A new search bumps the generation, interrupts
+#       the queries still running for the old one, and drops any late results.
+
+#   Usage:
+#       s.search_exec.start( tables, params, finished )
+#           tables:     sequence of ( signal_name, fcn ), fcn( params ) returns ( data, count )
+#           finished:   called on the main thread with list of counts in table order
+#                       after all tables of the current search have reported.
+
+# ----------------------------------------------------------------------------
+
+import os
+import sys
+import sqlite3
+import threading
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from Store import Store
+
+# ----------------------------------------------------------------------------
+#   One read-only connection per pool thread. Reopened if the database file
+#   was replaced, e.g., by a rebuild from the Index Management tab.
+#   Kept by thread id, not in threading.local(), Python drops that for a Qt thread when
+#       each run() returns. check_same_thread off as a thread id may be reused by a
+#       later thread, a connection is still only used by one thread at a time.
+
+Thread_Connections = {}         # thread id : ( key, conn, dc )
+Thread_Connections_Lock = threading.Lock()
+
+def get_thread_connection( path ):
+    s = Store()
+
+    key = ( str(path), os.stat( path ).st_ino )
+    ident = threading.get_ident()
+
+    with Thread_Connections_Lock:
+        old = Thread_Connections.get( ident )
+
+    if old is not None and old[0] == key:
+        s.fb.set_thread_dc( old[2] )
+        return old[1]
+
+    if old is not None:
+        old[1].close()
+
+    conn = sqlite3.connect( f"{Path( path ).as_uri()}?mode=ro", uri=True, check_same_thread=False )
+    conn.create_function( 'my_match_c', 2, s.fb.my_match_c )
+    dc = conn.cursor()
+    dc.row_factory = sqlite3.Row
+
+    with Thread_Connections_Lock:
+        Thread_Connections[ ident ] = ( key, conn, dc )
+
+    s.fb.set_thread_dc( dc )
+    return conn
+
+#   Called after the pool is done, from SearchExec.stop().
+
+def close_thread_connections():
+    with Thread_Connections_Lock:
+        for key, conn, dc in Thread_Connections.values():
+            conn.close()
+        Thread_Connections.clear()
+
+# ----------------------------------------------------------------------------
+
+#   Cancel state of one task, kept apart from the QRunnable, which is owned and
+#   deleted by the pool, so that cancel() can be called on it at any time.
+
+class SearchState():
+
+    def __init__( self ):
+        self.conn = None
+        self.cancelled = False
+        self.lock = threading.Lock()
+
+    # -----------------------------------------------------------------------
+    #   Called from main thread. sqlite3 interrupt() is safe to call from another thread.
+
+    def cancel( self ):
+        with self.lock:
+            self.cancelled = True
+            if self.conn is not None:
+                self.conn.interrupt()
+
+# ----------------------------------------------------------------------------
+
+class SearchTask( QRunnable ):
+
+    def __init__( self, executor, state, generation, index, fcn, params ):
+        super().__init__()
+        self.executor = executor
+        self.state = state
+        self.generation = generation
+        self.index = index
+        self.fcn = fcn
+        self.params = params
+
+    # -----------------------------------------------------------------------
+
+    def run( self ):
+        state = self.state
+
+        with state.lock:
+            if state.cancelled:
+                return
+            try:
+                state.conn = get_thread_connection( self.executor.db_path )
+
+            except Exception:
+                (extype, value, traceback) = sys.exc_info()
+                print( f"ERROR on search connect(), type: {extype}, value: {value}", file=sys.stderr )
+                self.executor.sig_result.emit( self.generation, self.index, [], 0 )
+                return
+
+        try:
+            data, count = self.fcn( self.params )
+
+        except sqlite3.OperationalError:
+            if state.cancelled:                 # interrupt() from cancel(), nobody wants the result.
+                return
+            (extype, value, traceback) = sys.exc_info()
+            print( f"ERROR on search, type: {extype}, value: {value}", file=sys.stderr )
+            data, count = [], 0
+
+        except Exception:
+            (extype, value, traceback) = sys.exc_info()
+            print( f"ERROR on search, type: {extype}, value: {value}", file=sys.stderr )
+            data, count = [], 0
+
+        finally:
+            with state.lock:
+                state.conn = None
+
+        if not state.cancelled:
+            self.executor.sig_result.emit( self.generation, self.index, data, count )
+
+# ----------------------------------------------------------------------------
+
+class SearchExec( QObject ):
+    sig_result = Signal( int, int, object, int )      # generation, table index, data, count
+
+    # ----------------------------------------------------------------
+    #   This is a singleton class.
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr( self, '_initialized' ):
+            return
+        self._initialized = True
+        super().__init__()
+
+        self.db_path = None
+        self.generation = 0
+        self.tables = []
+        self.states = []
+        self.counts = []
+        self.pending = 0
+        self.finished = None
+
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount( max( 2, min( 7, os.cpu_count() or 2 )))
+        self.pool.setExpiryTimeout( -1 )        # Keep threads, and their connections, for the life of the app.
+
+        self.sig_result.connect( self.on_result )
+
+    # ----------------------------------------------------------------
+
+    def start( self, tables, params, finished ):
+        s = Store()
+        self.cancel()
+
+        self.db_path = Path( s.conf.user_data_directory, s.conf.sqlite_database )
+
+        self.generation += 1
+        self.tables = tables
+        self.counts = [ 0 ] * len( tables )
+        self.pending = len( tables )
+        self.finished = finished
+
+        self.states = []
+        for index, ( signal_name, fcn ) in enumerate( tables ):
+            state = SearchState()
+            self.states.append( state )
+            self.pool.start( SearchTask( self, state, self.generation, index, fcn, params ))
+
+    # ----------------------------------------------------------------
+    #   Cancel the search in progress, if any. Tasks not yet started return at once,
+    #   running queries are interrupted. Any results already queued are dropped in
+    #   on_result() by the generation test.
+
+    def cancel( self ):
+        for state in self.states:
+            state.cancel()
+        self.states = []
+        self.generation += 1
+
+    # ----------------------------------------------------------------
+
+    @Slot( int, int, object, int )
+    def on_result( self, generation, index, data, count ):
+        s = Store()
+
+        if generation != self.generation:
+            return
+
+        signal_name, fcn = self.tables[ index ]
+        s.sigman.emit( signal_name, data )
+        self.counts[ index ] = count
+
+        self.pending -= 1
+        if self.pending == 0:
+            self.states = []
+            if self.finished:
+                self.finished( self.counts )
+
+    # ----------------------------------------------------------------
+    #   Called from do_full_exit().
+
+    def stop( self ):
+        self.cancel()
+        self.pool.clear()
+        self.pool.waitForDone()
+        close_thread_connections()
+
+# ----------------------------------------------------------------------------
@@ -2,16 +2,23 @@
 # ----------------------------------------------------------------------------
 #   WRW 13-Jan-2025 - Music search panel widget
 #   WRW 13-Feb-2025 - Migrate away from ObjectNames to object storage in instance.
+#   WRW 18-Oct-2026 - Search as you type in Title box, completions from s.title_index.
 
 # ----------------------------------------------------------------------------
 
-from PySide6.QtCore import Signal, Qt, Slot
+from PySide6.QtCore import Signal, Qt, Slot, QTimer, QStringListModel
 from PySide6.QtWidgets import QApplication, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QLineEdit, QWidget
 from PySide6.QtWidgets import QSizePolicy, QCheckBox, QRadioButton, QComboBox, QButtonGroup
-from PySide6.QtWidgets import QSpacerItem
+from PySide6.QtWidgets import QSpacerItem, QCompleter
 from MyGroupBox import MyGroupBox
 from Store import Store
 
+# ----------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Search as you type. Full search after typing pauses this long.
+
+Search_Delay = 300              # ms
+Completion_Count = 20
+
 # ----------------------------------------------------------------------------
 
 class BL_Search_Panel(QWidget):
@@ -56,6 +63,23 @@ class BL_Search_Panel(QWidget):
         gb_layout.addWidget( self.title  )
         self.title.returnPressed.connect(self.on_return_pressed)
 
+        #   WRW 18-Oct-2026 - Search as you type. textEdited is only for user typing, not setText().
+        #       The completer is unfiltered, the list comes already matched from s.title_index.
+
+        self.completion_model = QStringListModel( self )
+        self.completer = QCompleter( self.completion_model, self )
+        self.completer.setCompletionMode( QCompleter.UnfilteredPopupCompletion )
+        self.completer.setCaseSensitivity( Qt.CaseInsensitive )
+        self.completer.activated[str].connect( self.on_completion_activated )
+        self.title.setCompleter( self.completer )
+
+        self.search_timer = QTimer( self )
+        self.search_timer.setSingleShot( True )
+        self.search_timer.setInterval( Search_Delay )
+        self.search_timer.timeout.connect( self.on_return_pressed )
+
+        self.title.textEdited.connect( self.on_title_edited )
+
         if False:                                   # Styled in bl_style.py
             self.title.setStyleSheet( """           /* OK if False: out */
                 QLineEdit {
@@ -335,10 +359,38 @@ class BL_Search_Panel(QWidget):
         text = self.getTitle()
         self.button_clicked_signal.emit( text )
 
+    # --------------------------------------------------
+    #   WRW 18-Oct-2026 - Search as you type, completions now, full search when typing pauses.
+
+    @Slot( str )
+    def on_title_edited( self, text ):
+        s = Store()
+
+        if not s.conf.val( 'search_as_you_type' ):
+            return
+
+        s.title_index.load()                                # No-op when loaded and current
+        self.completion_model.setStringList( s.title_index.complete( text, Completion_Count ) )
+        if self.completion_model.rowCount():
+            self.completer.complete()
+        else:
+            self.completer.popup().hide()
+
+        if text.strip():
+            self.search_timer.start()
+        else:
+            self.search_timer.stop()
+
+    @Slot( str )
+    def on_completion_activated( self, text ):
+        self.title.setText( text )
+        self.on_return_pressed()
+
     # --------------------------------------------------
     @Slot()
     def on_return_pressed(self):
         s = Store()
+        self.search_timer.stop()                            # WRW 18-Oct-2026 - Don't search again from the timer
         join_flag = self.alsoSearchCheckBox.isChecked()
 
         s.sigman.emit( "sig_search_box_return_pressed",
@@ -354,6 +406,7 @@ class BL_Search_Panel(QWidget):
     # --------------------------------------------------
     @Slot()
     def on_clear_clicked( self ):
+        self.search_timer.stop()
         self.title.clear()
         self.composer.clear()
         self.lyricist.clear()
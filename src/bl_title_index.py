@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# ----------------------------------------------------------------------------
+#   bl_title_index.py
+
+#   WRW 18-Oct-2026 - In-memory prefix index over titles_distinct.title for
+#       search-as-you-type in the Title box of the search panel.
+
+#   Titles are split into words with fullword_tokens(), as the fullword search does,
+#       and joined by single spaces. They are also passed through unidecode() first,
+#       which the fullword search does not do, so that 'cafe' completes 'Cafe' with an
+#       accent. A completion is the original title, the search is then on that, not on
+#       the key, so it matches the title either way. Two sorted arrays of keys:
+#           title_keys  - the whole normalized title, 'blue moon'
+#           word_keys   - the title from each later word on, 'moon', for 'blue moon'
+#       A prefix lookup is a bisect_left() for the prefix and a scan while the keys
+#       start with it. Completions from title_keys come first, then word_keys.
+
+#   Loading is lazy, in a background thread with its own database connection,
+#       read-only for sqlite, so it does not delay start-up or typing. complete()
+#       returns nothing until the index is loaded. The index is reloaded when the
+#       database changes.
+
+#   Usage:
+#       s.title_index.load()                        - start loading, no-op if loaded/loading
+#       s.title_index.complete( text, limit )       - list of titles, best first
+# ----------------------------------------------------------------------------
+
+import sys
+import sqlite3
+import threading
+from bisect import bisect_left
+from pathlib import Path
+
+from unidecode import unidecode
+
+from Store import Store
+from fb_utils import fullword_tokens
+
+# ----------------------------------------------------------------------------
+
+def normalize_title( title ):
+    return ' '.join( fullword_tokens( unidecode( title ) ))
+
+# ----------------------------------------------------------------------------
+
+class TitleIndex():
+
+    # ----------------------------------------------------------------
+    #   This is a singleton class.
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr( self, '_initialized' ):
+            return
+        self._initialized = True
+
+        self.index = None               # ( title_keys, title_vals, word_keys, word_vals ), replaced as a whole
+        self.stamp = None
+        self.loading = False
+        self.lock = threading.Lock()
+
+    # ----------------------------------------------------------------
+    #   Start loading if not loaded, or loaded from an older database.
+
+    def load( self ):
+        s = Store()
+        stamp = s.fb.get_db_stamp()
+
+        with self.lock:
+            if self.loading or ( self.index is not None and self.stamp == stamp ):
+                return
+            self.loading = True
+
+        threading.Thread( target=self.load_thread, args=( stamp, ), daemon=True ).start()
+
+    # ----------------------------------------------------------------
+    #   The connections of the main thread, s.dc, are not shared with threads, open one here.
+    #   A plain cursor for both, rows are tuples. On error the old index is kept, or an empty
+    #   one is set, so it is not tried again on every keystroke until the database changes.
+
+    def load_thread( self, stamp ):
+        s = Store()
+        MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+        index = None
+        try:
+            if SQLITE:
+                path = Path( s.conf.user_data_directory, s.conf.sqlite_database )
+                conn = sqlite3.connect( f"{path.as_uri()}?mode=ro", uri=True )
+            else:
+                import MySQLdb
+                conn = MySQLdb.connect( "localhost", s.conf.val( 'database_user' ), s.conf.val( 'database_password' ), s.conf.mysql_database )
+
+            try:
+                index = self.load_rows( conn.cursor() )
+            finally:
+                conn.close()
+
+        except Exception:
+            (extype, value, traceback) = sys.exc_info()
+            print( f"ERROR on title index load, type: {extype}, value: {value}", file=sys.stderr )
+
+        with self.lock:
+            if index is not None:
+                self.index = index
+            elif self.index is None:
+                self.index = ( [], [], [], [] )
+            self.stamp = stamp
+            self.loading = False
+
+    # ----------------------------------------------------------------
+
+    def load_rows( self, dc ):
+        titles = []
+        words = []
+
+        dc.execute( "SELECT title FROM titles_distinct" )
+
+        for row in dc.fetchall():
+            title = row[0]
+            if not title:
+                continue
+            key = normalize_title( title )
+            titles.append( ( key, title ) )
+
+            pos = key.find( ' ' )
+            while pos != -1:
+                words.append( ( key[ pos+1: ], title ) )
+                pos = key.find( ' ', pos+1 )
+
+        titles.sort()
+        words.sort()
+
+        return ( [ x[0] for x in titles ], [ x[1] for x in titles ],
+                 [ x[0] for x in words ],  [ x[1] for x in words ] )
+
+    # ----------------------------------------------------------------
+    #   Up to limit titles starting with text, then titles with a later word starting with text.
+
+    def complete( self, text, limit=20 ):
+        index = self.index
+        if index is None:
+            return []
+
+        prefix = normalize_title( text )
+        if not prefix:
+            return []
+
+        title_keys, title_vals, word_keys, word_vals = index
+        results = []
+        seen = set()
+
+        for keys, vals in ( ( title_keys, title_vals ), ( word_keys, word_vals ) ):
+            i = bisect_left( keys, prefix )
+            while i < len( keys ) and keys[i].startswith( prefix ):
+                title = vals[i]
+                if title not in seen:
+                    seen.add( title )
+                    results.append( title )
+                    if len( results ) >= limit:
+                        return results
+                i += 1
+
+        return results
+
+# ----------------------------------------------------------------------------
@@ -20,6 +20,8 @@
 
 #   WRW 9-Jan-2025 - a little over 2 minutes to scan entire music library on Smetana.
 #   WRW 17-Mar-2025 - converting to current coding approach.
+#   WRW 18-Oct-2026 - Bulk loading. Rows are collected and inserted with executemany(), one
+#       commit per table, Sqlite bulk pragmas for the build, --timing report per table.
 
 # --------------------------------------------------------------------------
 
@@ -32,10 +34,15 @@ import fitz
 from collections import OrderedDict
 from pathlib import Path
 import gzip
+import glob
+import hashlib
 import sqlite3
 import inspect
 import mutagen
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import Levenshtein
 
 from fb_config import Config
@@ -88,6 +95,63 @@ def execute( cur, txt, data=None ):
             print( f"  Data: {data}", file=sys.stderr, flush=True   )
         print( f"  Called from: {caller_name}, line: {caller_line}", file=sys.stderr, flush=True  )
 
+# ---------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - executemany() counterpart of execute() for bulk inserts.
+
+def executemany( cur, txt, data ):
+    try:
+        cur.executemany( txt, data )
+
+    except Exception as e:
+        all_frames = inspect.stack()
+        caller_frame = all_frames[1]
+        caller_line = caller_frame[2]
+        caller_name = caller_frame[3]
+
+        (extype, value, traceback) = sys.exc_info()
+        print( f"       ERROR on executemany(), type: {extype}, value: {value}", file=sys.stderr, flush=True )
+        print( f"  Txt: {txt}", file=sys.stderr, flush=True    )
+        print( f"  Called from: {caller_name}, line: {caller_line}", file=sys.stderr, flush=True  )
+
+# ---------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Elapsed time of each build_*() function for --timing, reported
+#       by report_timing() at the end of do_main(). Times include the word and FTS
+#       indexes built inside the function.
+
+Timing = []
+
+def timed( fcn ):
+    def wrapper( *args, **kwargs ):
+        start = time.perf_counter()
+        rcode = fcn( *args, **kwargs )
+        Timing.append( ( fcn.__name__, time.perf_counter() - start ) )
+        return rcode
+    return wrapper
+
+def report_timing():
+    if not Timing:
+        return
+
+    print( "\nTiming:", file=sys.stderr, flush=True )
+    for name, elapsed in Timing:
+        print( f"   {name:30} {elapsed:8.2f} s", file=sys.stderr, flush=True )
+    print( f"   {'Total':30} {sum( x[1] for x in Timing ):8.2f} s", file=sys.stderr, flush=True )
+
+# ---------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Sqlite settings for the build only, not persistent. The database is
+#       rebuilt from the index sources so trade crash safety for speed: no rollback journal,
+#       no fsync, temp b-trees for index creation in memory.
+
+def set_bulk_pragmas( c ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    if SQLITE:
+        execute( c, "PRAGMA journal_mode = OFF" )
+        execute( c, "PRAGMA synchronous = OFF" )
+        execute( c, "PRAGMA temp_store = MEMORY" )
+        execute( c, "PRAGMA cache_size = -65536" )          # 64 MB
+
 # ==========================================================================
 
 def old_get_title_tag( file ):
@@ -221,12 +285,100 @@ def do_scan_music_files():
     return 0
 
 # -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Tag cache for do_scan_audio_files(). A sqlite file beside audiofile_index
+#       with the tags of every audio file scanned, keyed by file, mtime, and size. A rescan opens
+#       only files not in it or changed since. Rows are committed as tags are read, so an
+#       interrupted scan resumes where it stopped. title is NULL for a file without tags,
+#       it is not retried until it changes.
+
+def open_audio_tag_cache():
+    s = Store()
+    path = Path( Path( s.conf.val( 'audiofile_index' )).parent, f"{s.Const.Hostname}-{s.Const.audioTagCacheFile}" )
+
+    conn = sqlite3.connect( path )
+    txt = """CREATE TABLE IF NOT EXISTS audio_tags (
+            file TEXT PRIMARY KEY,
+            mtime INTEGER,
+            size INTEGER,
+            title TEXT,
+            artist TEXT,
+            album TEXT )
+        """
+    conn.execute( txt )
+    return conn
+
+# -----------------------------------------------------------------------
+#   Runs in a worker process of do_scan_audio_files().
+
+def scan_audio_file( item ):
+    file, mtime, size = item
+    ( title, artist, album ) = get_title_tag( file )
+    return ( file, mtime, size, title, artist, album )
+
+# -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Streaming audiofile_index format. Was one { 'audio_files' : [ ... ] } json
+#       document, indent=2, built in and loaded into memory whole. Now gzipped json lines, a header
+#       line then one line per audio file, written and read a line at a time. The file name is
+#       unchanged, read_audio_index() also reads the old format.
+
+Audio_Index_Format = 'birdland-audio-index-jsonl'
+
+class AudioIndexWriter():
+
+    def __init__( self, ofile ):
+        self.ofile = ofile
+        self.tmp = f"{ofile}.tmp"           # Replaces ofile on success only, old one kept on failure
+        self.fd = gzip.open( self.tmp, 'wt', encoding='utf-8' )
+        self.write( { 'format' : Audio_Index_Format, 'version' : 1 } )
+
+    def write( self, item ):
+        self.fd.write( json.dumps( item ) + '\n' )
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, extype, value, traceback ):
+        self.fd.close()
+        if extype:
+            os.remove( self.tmp )
+        else:
+            os.replace( self.tmp, self.ofile )
+
+# -----------------------------------------------------------------------
+#   Yield the { title, artist, album, file } items of an audiofile_index, either format.
+
+def read_audio_index( ifile ):
+    with gzip.open( ifile, 'rt', encoding='utf-8' ) as ifd:
+        try:
+            header = json.loads( ifd.readline() )
+
+        except json.JSONDecodeError:
+            header = None                   # Old format, indent=2, first line is '{'
+
+        if isinstance( header, dict ) and header.get( 'format' ) == Audio_Index_Format:
+            for line in ifd:
+                if line.strip():
+                    yield json.loads( line )
+
+        else:
+            ifd.seek( 0 )
+            yield from json.load( ifd )[ 'audio_files' ]
+
+# -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Tags read by up to jobs worker processes, default all cpus, and
+#       through the tag cache, see open_audio_tag_cache().
+
+Audio_Cache_Commit = 500
 
-def do_scan_audio_files():
+def do_scan_audio_files( jobs=None ):
     s = Store()
     print( "\nScanning audio library:", file=sys.stderr, flush=True  )
 
-    table = []
+    cache = open_audio_tag_cache()
+    cached = { file : ( mtime, size, title, artist, album ) for file, mtime, size, title, artist, album in
+               cache.execute( "SELECT file, mtime, size, title, artist, album FROM audio_tags" ) }
+    found = {}                      # file : ( rel_path, ext ) in walk order
+    to_scan = []                    # ( file, mtime, size ) not in cache or changed
 
     error_count = 0
     error_count_by_extension = {}
@@ -243,49 +395,100 @@ def do_scan_audio_files():
     #   WRW 31-May-2025 - use all if folders is empty
     audio_folders = s.conf.val('audio_folders') if s.conf.val('audio_folders') else ['.']
 
+    scanned = []                    # full_path of each folder, for pruning the cache
+
     for path in audio_folders:
         print( f"  {path}", file=sys.stderr, flush=True  )
 
         root = s.conf.val( 'audio_file_root' )
         full_path = str( Path( root, path ).expanduser())
+        scanned.append( full_path )
     
         for file in listfiles( full_path ):
             ext = Path( file ).suffix
             rel_path = str( Path( file ).relative_to( root ))
 
-            if ext.lower() in s.Const.audioFiletypes:
-                ( title, artist, album ) = get_title_tag( file )
+            if ext.lower() in s.Const.audioFileTypes:        # WRW 18-Oct-2026 - was audioFiletypes
+                if file in found:                       # Overlapping folders
+                    continue
 
-                # -------------------------------------------------------------
-                #   WRW 19 Feb 2022 - Trying to track down a couple of funnies in audio_files table
-                #       Two problems: title, artist, album could all be None.        
-                #       Changed fullword_match to acccept Null.
-                #       A few items have '\x00' in them in the vicinity of an ampersand. Deal with that
-                #       when doing the INSERT, not here as this takes a long time to run.
+                try:
+                    st = os.stat( file )
 
-                if title:
-                    table.append( { 'title' : title, 'artist' : artist, 'album' : album, 'file' : rel_path } )
-                    title_count += 1
-                    title_count_by_extension[ext] = title_count_by_extension.setdefault( ext, 0 ) + 1
-                else:
-                    error_count += 1
-                    error_count_by_extension[ext] = error_count_by_extension.setdefault( ext, 0 ) + 1
+                except OSError:
+                    (extype, value, traceback) = sys.exc_info()
+                    print( f"      ERROR on stat(), type: {extype}, value: {value}", file=sys.stderr, flush=True )
+                    continue
+
+                found[ file ] = ( rel_path, ext )
+                old = cached.get( file )
+                if not old or old[0] != st.st_mtime_ns or old[1] != st.st_size:
+                    to_scan.append( ( file, st.st_mtime_ns, st.st_size ) )
 
             else:
                 ignore_count += 1
                 ignore_count_by_extension[ext] = ignore_count_by_extension.setdefault( ext, 0 ) + 1
-    
+
     # ------------------------------------------
-    #   Do we want to save to a location specified on command line? Have not seen need.
+    #   Read tags of new and changed files only, save each to cache as it arrives.
 
-    full_contents = {
-        'audio_files' : table
-    }
+    print( f"   Audio files: {len( found )}, from cache: {len( found ) - len( to_scan )}, to scan: {len( to_scan )}", file=sys.stderr, flush=True  )
+
+    txt = "INSERT OR REPLACE INTO audio_tags ( file, mtime, size, title, artist, album ) VALUES( ?, ?, ?, ?, ?, ? )"
+    jobs = jobs if jobs else os.cpu_count()
+
+    try:
+        if jobs > 1 and len( to_scan ) > 1:
+            pool = ProcessPoolExecutor( max_workers=jobs )
+            results = pool.map( scan_audio_file, to_scan, chunksize=16 )
+        else:
+            pool = None
+            results = map( scan_audio_file, to_scan )
+
+        for count, result in enumerate( results, 1 ):
+            cache.execute( txt, result )
+            cached[ result[0] ] = result[1:]
+            if count % Audio_Cache_Commit == 0:
+                cache.commit()
+                print( f"   Scanned: {count} of {len( to_scan )}", file=sys.stderr, flush=True  )
+
+    finally:
+        cache.commit()
+        if pool:
+            pool.shutdown( cancel_futures=True )
+
+    #   Drop files no longer found under the folders scanned. Entries under other folders,
+    #   e.g., from an earlier run with different audio_folders, are kept.
+
+    prefixes = tuple( os.path.join( x, '' ) for x in scanned )
+    gone = [ ( file, ) for file in cached if file not in found and file.startswith( prefixes ) ]
+    if gone:
+        cache.executemany( "DELETE FROM audio_tags WHERE file = ?", gone )
+        cache.commit()
+    cache.close()
+
+    # ------------------------------------------
+    #   Do we want to save to a location specified on command line? Have not seen need.
 
     ofile = s.conf.val( 'audiofile_index' )
-    json_text = json.dumps( full_contents, indent=2 )
-    with gzip.open( ofile, 'wt', encoding='utf-8' ) as ofd:     # /// ENCODING 23-Mar-2025
-        ofd.write( json_text )
+    with AudioIndexWriter( ofile ) as writer:
+        for file, ( rel_path, ext ) in found.items():
+            mtime, size, title, artist, album = cached[ file ]
+
+            # -------------------------------------------------------------
+            #   WRW 19 Feb 2022 - Trying to track down a couple of funnies in audio_files table
+            #       Two problems: title, artist, album could all be None.
+            #       Changed fullword_match to acccept Null.
+            #       A few items have '\x00' in them in the vicinity of an ampersand. Deal with that
+            #       when doing the INSERT, not here as this takes a long time to run.
+
+            if title:
+                writer.write( { 'title' : title, 'artist' : artist, 'album' : album, 'file' : rel_path } )
+                title_count += 1
+                title_count_by_extension[ext] = title_count_by_extension.setdefault( ext, 0 ) + 1
+            else:
+                error_count += 1
+                error_count_by_extension[ext] = error_count_by_extension.setdefault( ext, 0 ) + 1
 
     # ------------------------------------------
 
@@ -327,19 +530,185 @@ def check_null( s ):
     else:
         return s
 
+# -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - title -> title_id map of titles_distinct. Set by build_titles_distinct()
+#       from the ids it assigns, else loaded with one SELECT on first use. Replaces a
+#       get_title_id_from_title() query per title in build_titles(), build_title2youtube()
+#       and the sub-SELECT per row for raw_index.
+
+Title_Ids = None
+
+def load_title_ids():
+    global Title_Ids
+    s = Store()
+
+    if Title_Ids is None:
+        txt = "SELECT title, title_id FROM titles_distinct"
+        execute( s.dc, txt )
+        Title_Ids = { row[ 'title' ] : row[ 'title_id' ] for row in s.dc.fetchall() }
+
+    return Title_Ids
+
+def get_title_id( title ):
+    global Title_Ids
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    title_id = load_title_ids().get( title )
+
+    #   MySql '=' is case and accent insensitive, fall back to it for anything not matched exactly.
+
+    if title_id is None and MYSQL:
+        title_id = s.fb.get_title_id_from_title( title )
+
+    return title_id
+
+# -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Inverted word index for the my_match_c() searches, see get_fulltext().
+#       One row per ( col, token, row_id ), col is 'table.column', tokens split exactly
+#       as fullword does. Rebuilt for a table each time the table is rebuilt as its rowids change.
+#       Sqlite only, MySQL has its own FULLTEXT indexes.
+
+def build_word_index( c, table ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    if not SQLITE:
+        return 0
+
+    txt = """CREATE TABLE IF NOT EXISTS word_index (
+            col VARCHAR(64),
+            token VARCHAR(255),
+            row_id INTEGER,
+            PRIMARY KEY( col, token, row_id ) )
+            WITHOUT ROWID
+        """
+    execute( c, txt )
+
+    for column in fb_utils.Word_Index_Columns[ table ]:
+        col = f"{table}.{column}"
+
+        txt = "DELETE FROM word_index WHERE col = ?"
+        execute( c, txt, [col] )
+
+        txt = f"SELECT rowid, {column} FROM {table}"
+        execute( c, txt )
+        postings = { ( col, token, row_id ) for row_id, value in c.fetchall() if value
+                                             for token in fb_utils.fullword_tokens( value ) }
+
+        txt = "INSERT INTO word_index ( col, token, row_id ) VALUES( ?, ?, ? )"
+        executemany( c, txt, sorted( postings ) )
+
+        print( f"   Word index {col}: {len( postings )} entries", file=sys.stderr, flush=True  )
+
+    return 0
+
+# -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Sqlite FTS5 index for table, {table}_fts over the word index columns.
+#       External content table on table by rowid, populated with 'rebuild' after table is
+#       loaded, replaces the per-row inserts into separately defined *_fts tables.
+#       Always dropped so a table rebuilt without FTS leaves no stale index behind.
+
+def build_fts_index( c, table ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    if not SQLITE:
+        return 0
+
+    txt = f'DROP TABLE IF EXISTS {table}_fts;'
+    execute( c, txt )
+
+    if not FULLTEXT:
+        return 0
+
+    columns = ', '.join( fb_utils.Word_Index_Columns[ table ] )
+    txt = f"""CREATE VIRTUAL TABLE {table}_fts USING fts5(
+            {columns},
+            content='{table}',
+            tokenize="{fb_utils.Fts_Tokenizer}"
+        )
+        """
+    execute( c, txt )
+
+    txt = f"INSERT INTO {table}_fts( {table}_fts ) VALUES( 'rebuild' )"
+    execute( c, txt )
+
+    print( f"   FTS index {table}_fts: {columns}", file=sys.stderr, flush=True  )
+    return 0
+
+# -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - ( rowid, *word index columns ) of rows of table, for update_word_index().
+
+def get_word_index_rows( c, table, where, data ):
+    columns = ', '.join( fb_utils.Word_Index_Columns[ table ] )
+    txt = f"SELECT rowid, {columns} FROM {table} WHERE {where}"
+    execute( c, txt, data )
+    return c.fetchall()
+
+# -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Incremental counterpart of build_word_index() and build_fts_index() for
+#       --incremental. old_rows are the rows deleted from table and new_rows the rows inserted,
+#       as from get_word_index_rows(). Only their postings and FTS entries are changed.
+#       Falls back to the full builds when there is no index to update yet.
+
+def update_word_index( c, table, old_rows, new_rows ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    if not SQLITE:
+        return 0
+
+    txt = "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ( 'word_index', ? )"
+    execute( c, txt, [ f"{table}_fts" ] )
+    have = { row[0] for row in c.fetchall() }
+
+    columns = fb_utils.Word_Index_Columns[ table ]
+
+    if 'word_index' not in have:
+        build_word_index( c, table )
+
+    else:
+        for i, column in enumerate( columns, start=1 ):
+            col = f"{table}.{column}"
+            old = { ( col, token, row[0] ) for row in old_rows if row[i] for token in fb_utils.fullword_tokens( row[i] ) }
+            new = { ( col, token, row[0] ) for row in new_rows if row[i] for token in fb_utils.fullword_tokens( row[i] ) }
+
+            txt = "DELETE FROM word_index WHERE col = ? AND token = ? AND row_id = ?"
+            executemany( c, txt, sorted( old ) )
+
+            txt = "INSERT OR IGNORE INTO word_index ( col, token, row_id ) VALUES( ?, ?, ? )"
+            executemany( c, txt, sorted( new ) )
+
+            print( f"   Word index {col}: {len( old )} entries removed, {len( new )} added", file=sys.stderr, flush=True  )
+
+    if not FULLTEXT or f"{table}_fts" not in have:
+        build_fts_index( c, table )                 # Drops it when not FULLTEXT
+
+    else:
+        names = ', '.join( columns )
+        marks = ', '.join( [ '?' ] * ( len( columns ) + 1 ) )
+
+        txt = f"INSERT INTO {table}_fts( {table}_fts, rowid, {names} ) VALUES( 'delete', {marks} )"
+        executemany( c, txt, [ tuple( row ) for row in old_rows ] )
+
+        txt = f"INSERT INTO {table}_fts( rowid, {names} ) VALUES( {marks} )"
+        executemany( c, txt, [ tuple( row ) for row in new_rows ] )
+
+        print( f"   FTS index {table}_fts: {len( old_rows )} rows removed, {len( new_rows )} added", file=sys.stderr, flush=True  )
+
+    return 0
+
 # -----------------------------------------------------------------------
 #   WRW 30 Apr 2022 - Build a table mapping file name to page count
 
+@timed
 def build_page_count( dc, c, conn ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
     txt = 'DROP TABLE IF EXISTS page_count;'
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS audio_files_fts;'
-        execute( c, txt )
-
     if MYSQL:
         txt = """CREATE TABLE page_count (
             id INT UNSIGNED AUTO_INCREMENT,
@@ -360,34 +729,24 @@ def build_page_count( dc, c, conn ):
             """
         execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE audio_files_fts USING fts5(
-            file,
-            page_count UNINDEXED,
-            content='page_count',
-            content_rowid='id'
-            )
-            """
-        execute( c, txt )
-
     # ----------------------------------------------------------------
 
     txt = "SELECT file FROM canonical2file ORDER BY file"
     execute( dc, txt )
     rows = dc.fetchall()
     root = s.conf.val( 'music_file_root' )
+    data = []
 
     if rows:
         for row in rows:                    # Build array of all titles
             row[ 'file' ]
             path = Path( root, row['file' ] )
             doc = fitz.open( path )
+            data.append( ( row[ 'file' ], doc.page_count ) )
 
-            txt = "INSERT INTO page_count (file, page_count) VALUES( %s, %s )"
-            data = [ row[ 'file' ], doc.page_count ]
-            txt = fix_query( txt )      # Replaces %s with ? for SQLITE FULLTEXT
-
-            execute( c, txt, data )
+        txt = "INSERT INTO page_count (file, page_count) VALUES( %s, %s )"
+        txt = fix_query( txt )      # Replaces %s with ? for SQLITE FULLTEXT
+        executemany( c, txt, data )
 
     if MYSQL:
         txt = 'ALTER TABLE page_count ADD FULLTEXT( file )'
@@ -397,12 +756,16 @@ def build_page_count( dc, c, conn ):
         txt = "CREATE INDEX page_count_index ON page_count( file )"
         execute( c, txt )
 
+    conn.commit()
     return 0
 
 # -----------------------------------------------------------------------
 #   WRW 19 Feb 2022 - Check and clean up '\x00' in fields before inserting into table.
 
-def build_audio_files( c ):
+Audio_Insert_Batch = 10000
+
+@timed
+def build_audio_files( c, conn ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
     print( "\nBuilding audio_files", file=sys.stderr, flush=True  )
@@ -410,10 +773,6 @@ def build_audio_files( c ):
     txt = 'DROP TABLE IF EXISTS audio_files;'
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS audio_files_fts;'
-        execute( c, txt )
-
     if MYSQL:
         txt = """CREATE TABLE audio_files (
             id INT UNSIGNED AUTO_INCREMENT,
@@ -438,27 +797,22 @@ def build_audio_files( c ):
             """
         execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE audio_files_fts USING fts5(
-            title,
-            artist,
-            album,
-            file UNINDEXED,
-            content='audio_files',
-            content_rowid='id'
-            )
-            """
-        execute( c, txt )
-
     # -----------------------------------------------------------------------
 
     # ifile = Path( s.conf.confdir, s.conf.v.audiofile_index )
+    #   WRW 18-Oct-2026 - Stream from read_audio_index() and insert in batches of Audio_Insert_Batch
+    #       rows, memory does not grow with the size of the library.
+
     ifile = s.conf.val( 'audiofile_index' )
-    with gzip.open( ifile, 'rt', encoding='utf-8' ) as ifd:     # /// WRW 23-Mar-2025 ENCODING
-        audio_data = json.load( ifd )
+
+    txt   = """INSERT INTO audio_files ( title, artist, album, file )
+            VALUES( %s, %s, %s, %s )
+            """
+    txt = fix_query( txt )      # Replaces %s with ? for SQLITE FULLTEXT
 
     audio_file_count = 0
-    for item in audio_data[ 'audio_files' ]:
+    data = []
+    for item in read_audio_index( ifile ):
         audio_file_count += 1
         title = item[ 'title' ]
         artist = item[ 'artist' ]
@@ -469,19 +823,12 @@ def build_audio_files( c ):
         artist = check_null( artist )
         album = check_null( album )         # Don't check file, can't modify that from what found on disk.
 
-        data = ( [ title, artist, album, file ] )
-
-        txt   = """INSERT INTO audio_files ( title, artist, album, file )
-                VALUES( %s, %s, %s, %s )
-                """
-        txt = fix_query( txt )      # Replaces %s with ? for SQLITE FULLTEXT
-        execute( c, txt, data )
+        data.append( ( title, artist, album, file ) )
+        if len( data ) >= Audio_Insert_Batch:
+            executemany( c, txt, data )
+            data = []
 
-        if FULLTEXT and SQLITE:
-            txt   = """INSERT INTO audio_files_fts ( title, artist, album, file )
-                    VALUES( ?, ?, ?, ? )
-                    """
-            execute( c, txt, data )
+    executemany( c, txt, data )
 
     # -----------------------------------------------------------------------
 
@@ -496,8 +843,11 @@ def build_audio_files( c ):
         txt = "CREATE INDEX audio_files_index ON audio_files( title, artist, album )"
         execute( c, txt )
 
+    build_word_index( c, 'audio_files' )
+    build_fts_index( c, 'audio_files' )
     print( f"   Audio files total: {audio_file_count}", file=sys.stderr, flush=True  )
 
+    conn.commit()
     return 0
 
 # -----------------------------------------------------------------------
@@ -536,6 +886,7 @@ def OMIT_do_extract_audio_data( dc ):
 
 # ==========================================================================
 
+@timed
 def build_source_priority( c, conn ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
@@ -563,15 +914,17 @@ def build_source_priority( c, conn ):
     execute( c, txt )
 
     priority = 1
+    data = []
 
     # for src in s.fb.Source_Priority:
     for src in s.conf.val('source_priority'):
-        data = [ src, priority ]
-        txt = 'INSERT INTO src_priority ( src, priority ) VALUES( %s, %s )'
-        txt = fix_query( txt )
-        execute( c, txt, data )
+        data.append( ( src, priority ) )
         priority += 1
 
+    txt = 'INSERT INTO src_priority ( src, priority ) VALUES( %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
+
     if MYSQL:
         txt = "ALTER TABLE src_priority ADD INDEX( src )"
 
@@ -586,6 +939,7 @@ def build_source_priority( c, conn ):
 #   Make table of canonical book names from CanonicalNames.txt file.
 #   WRW 9 Apr 2022 - Add priority and page_of_sheet_1
 
+@timed
 def build_canonicals( c, conn ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
@@ -616,6 +970,8 @@ def build_canonicals( c, conn ):
 
     # ---------------------------------------------
 
+    data = []
+
     # with open( s.fb.Canonicals ) as fd:
     with open( s.conf.val('canonicals'), encoding='utf-8' ) as fd:
         for line in fd:
@@ -631,11 +987,11 @@ def build_canonicals( c, conn ):
                 page_of_sheet_1 = page_of_sheet_1.strip()
                 canonical = canonical.strip()
 
-                data = [ priority, page_of_sheet_1, canonical ]
-                txt = 'INSERT INTO canonicals ( priority, page_of_sheet_1, canonical ) VALUES( %s, %s, %s )'
-                txt = fix_query( txt )
+                data.append( ( priority, page_of_sheet_1, canonical ) )
 
-                execute( c, txt, data )
+    txt = 'INSERT INTO canonicals ( priority, page_of_sheet_1, canonical ) VALUES( %s, %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
 
     # ---------------------------------------------
 
@@ -646,6 +1002,7 @@ def build_canonicals( c, conn ):
 #   Make table from Canonical2File.txt, which was created by hand.
 #   Maps canonical book name to .pdf (possibly other) file containing book.
 
+@timed
 def build_canonical2file( c, conn ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
@@ -674,6 +1031,8 @@ def build_canonical2file( c, conn ):
 
     # ---------------------------------------------
 
+    data = []
+
     # for canonical2file in fb.Canonical2File.split('\n'):
     # for canonical2file in s.fb.Canonical2File:
     for canonical2file in s.conf.val('canonical2file'):
@@ -684,10 +1043,11 @@ def build_canonical2file( c, conn ):
                 canonical = canonical.strip()
                 file = file.strip()
                 if canonical and file:
-                    data = ( canonical, file )
-                    txt = 'INSERT INTO canonical2file ( canonical, file ) VALUES( %s, %s )'
-                    txt = fix_query( txt )
-                    execute( c, txt, data )
+                    data.append( ( canonical, file ) )
+
+    txt = 'INSERT INTO canonical2file ( canonical, file ) VALUES( %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
 
     # ----------------------
 
@@ -704,6 +1064,7 @@ def build_canonical2file( c, conn ):
 # --------------------------------------------------------------------------
 #   Make translation table between local (source-specific) book name and canonical book name.
 
+@timed
 def build_local2canonical( c, conn ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
@@ -712,10 +1073,6 @@ def build_local2canonical( c, conn ):
     txt = 'DROP TABLE IF EXISTS local2canonical;'
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS local2canonical_fts;'
-        execute( c, txt )
-
     if MYSQL:
         txt =  """CREATE TABLE local2canonical (
                canonical VARCHAR(255),
@@ -737,18 +1094,12 @@ def build_local2canonical( c, conn ):
 
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE local2canonical_fts USING fts5(
-            canonical,
-            src UNINDEXED,
-            local UNINDEXED,
-            content='local2canonical',
-            content_rowid='id'
-        )
-        """
-        execute( c, txt )
+    data = []
+    s.fb.traverse_sources( int_build_local2canonical, c=c, data=data )
 
-    s.fb.traverse_sources( int_build_local2canonical, c=c )
+    txt = 'INSERT INTO local2canonical ( src, local, canonical ) VALUES( %s, %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
 
     if MYSQL:
         txt = "ALTER TABLE local2canonical ADD INDEX( src ), ADD INDEX( local ), ADD INDEX( canonical )"
@@ -769,7 +1120,7 @@ def build_local2canonical( c, conn ):
 def int_build_local2canonical( src, **kwargs ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
-    c = kwargs[ 'c' ]
+    data = kwargs[ 'data' ]                             # WRW 18-Oct-2026 - Rows for executemany() in caller
 
     # ifile = os.path.join( "..", "Index-Sources", s.fb.get_source_from_src( src ), s.fb.Local2Canon )
     source = s.fb.get_source_from_src( src )
@@ -785,30 +1136,34 @@ def int_build_local2canonical( src, **kwargs ):
             canonical=canonical.strip()
 
             if local and canonical:
-                data = ( src, local, canonical )
-                txt = 'INSERT INTO local2canonical ( src, local, canonical ) VALUES( %s, %s, %s )'
-                txt = fix_query( txt )
-                execute( c, txt, data )
-
-                if FULLTEXT and SQLITE:
-                    txt = 'INSERT INTO local2canonical_fts ( src, local, canonical ) VALUES( ?, ?, ? )'
-                    execute( c, txt, data )
+                data.append( ( src, local, canonical ) )
 
 # --------------------------------------------------------------------------
 #   Build title table from data in the Index.Json directory.
+#   WRW 18-Oct-2026 - Split into traversal here and table creation and loading in load_titles(),
+#       shared with build_titles_and_titles_distinct().
 
+@timed
 def build_titles( dc, c, conn ):
+    print( "\nBuilding titles", file=sys.stderr, flush=True  )
+
+    data = []
+    index_files = {}
+    traverse_music_index( proc_one_book, c=c, dc=dc, rows=data, index_files=index_files )
+    load_titles( c, data, index_files )
+    conn.commit()
+    return 0
+
+# --------------------------------------------------------------------------
+#   Create titles and insert rows, index_files as collected by proc_one_book().
+
+def load_titles( c, data, index_files ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
-    print( "\nBuilding titles", file=sys.stderr, flush=True  )
 
     txt = 'DROP TABLE IF EXISTS titles;'
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS titles_fts;'
-        execute( c, txt )
-
     if MYSQL:
         #   WRW 4 June 2022 - Changed from MYISAM to INNODB to fix problem sending table to server
         #       that was related to UNIQUE(). OK with no UNIQUE(). OK with INNODB.
@@ -844,21 +1199,7 @@ def build_titles( dc, c, conn ):
         """
         execute( c, txt )
 
-        if FULLTEXT and SQLITE:
-            txt = """CREATE VIRTUAL TABLE titles_fts USING fts5(
-                src,
-                local,
-                title_id,
-                composer UNINDEXED,
-                lyricist UNINDEXED,
-                sheet UNINDEXED,
-                content='titles',
-                content_rowid='id'
-            )
-            """
-            execute( c, txt )
-
-    s.fb.traverse_sources( build_titles_from_one_index_source, c=c, dc=dc )
+    insert_titles( c, data )
 
     if MYSQL:
         txt = "ALTER TABLE titles ADD INDEX( title_id ), ADD INDEX( local ), ADD INDEX( src )"
@@ -867,22 +1208,43 @@ def build_titles( dc, c, conn ):
         txt = "CREATE INDEX titles_index ON titles( title_id, local, src )"
 
     execute( c, txt )
-    conn.commit()
-    return 0
+    build_word_index( c, 'titles' )
+    build_fts_index( c, 'titles' )
+    save_index_manifest( c, index_files )   # WRW 18-Oct-2026 - Baseline for --incremental
 
 # --------------------------------------------------------------------------
+#   Buffalo contains some duplicate data, same title, different call number I think.
+#       INSERT IGNORE to resolve that.
 
-def build_titles_from_one_index_source( src, **kwargs ):
+def insert_titles( c, data ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
-    s.fb.get_music_index_data_by_src( src, proc_one_book, **kwargs )
+
+    if MYSQL:
+        txt = 'INSERT IGNORE INTO titles ( src, local, title_id, composer, lyricist, sheet ) VALUES( %s, %s, %s, %s, %s, %s )'
+
+    if SQLITE:
+        txt = 'INSERT OR IGNORE INTO titles ( src, local, title_id, composer, lyricist, sheet ) VALUES( ?, ?, ?, ?, ?, ? )'
+
+    executemany( c, txt, data )
+
+# --------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Call callback( src, data, file, **kwargs ) for each book of all sources
+#       in music_index_dir.
+
+def traverse_music_index( callback, **kwargs ):
+    s = Store()
+    for src in s.fb.get_srcs_from_index():
+        s.fb.get_music_index_data_by_src( src, callback, **kwargs )
 
 # --------------------------------------------------------------------------
 
 def proc_one_book( src, data, file, **kwargs ):
     s = Store()
-    c = kwargs[ 'c' ]
-    dc = kwargs[ 'dc' ]
+    rows = kwargs[ 'rows' ]                 # WRW 18-Oct-2026 - Rows for executemany() in build_titles()
+    title_id_fcn = kwargs.get( 'title_id_fcn', get_title_id )      # WRW 18-Oct-2026 - See build_titles_and_titles_distinct()
+    if 'index_files' in kwargs:             # WRW 18-Oct-2026 - For save_index_manifest()
+        kwargs[ 'index_files' ][ file ] = data[ 'local' ]
     local = data[ 'local' ]
     source = data[ 'source' ]
     contents = data[ 'contents' ]
@@ -896,7 +1258,7 @@ def proc_one_book( src, data, file, **kwargs ):
 
     for content in contents:
         title = content[ 'title' ]
-        title_id = s.fb.get_title_id_from_title( title )        # dc now passed via Store()
+        title_id = title_id_fcn( title )                        # WRW 18-Oct-2026 - was s.fb.get_title_id_from_title()
 
         sheet = content[ 'sheet' ] if not content[ 'sheet' ] == '-' else None
 
@@ -909,7 +1271,7 @@ def proc_one_book( src, data, file, **kwargs ):
         if lyricist:
             lyricist = lyricist.strip()
 
-        proc_one_book_int( c, src, local, title_id, composer, lyricist, sheet )
+        rows.append( ( src, local, title_id, composer, lyricist, sheet ) )
 
         if sheet:
             sheet = sheet.strip()
@@ -927,8 +1289,8 @@ def proc_one_book( src, data, file, **kwargs ):
         prior_title = title
 
     if False:   # WRW 28-May-2025 - remove _TitleFirst and _TitleLast
-        title_id = s.fb.get_title_id_from_title( '_TitleFirst' )    # removed dc, now passed in Store()
-        proc_one_book_int( c, src, local, title_id, None, None, str(sheet_min) )
+        title_id = get_title_id( '_TitleFirst' )
+        rows.append( ( src, local, title_id, None, None, str(sheet_min) ) )
 
     # page_mid = int( (page_min + page_max)/2)
 
@@ -936,36 +1298,14 @@ def proc_one_book( src, data, file, **kwargs ):
     # proc_one_book_int( c, src, local, title_id, None, None, str(sheet_mid) )
 
     if False:
-        title_id = s.fb.get_title_id_from_title( '_TitleLast' )     # see above
-        proc_one_book_int( c, src, local, title_id, None, None, str(sheet_max) )
+        title_id = get_title_id( '_TitleLast' )
+        rows.append( ( src, local, title_id, None, None, str(sheet_max) ) )
 
     # pages=sorted( pages )
     # print( f"src: {src}, local: {local}" )
     # print( pages )
     # print()
 
-# ----------------------------------------------------------------------------------
-#   Buffalo contains some duplicate data, same title, different call number I think. 
-#       INSERT IGNORE to resolve that.
-
-def proc_one_book_int( c, src, local, title_id, composer, lyricist, sheet ):
-
-    s = Store()
-    MYSQL, SQLITE, FULLTEXT = s.driver.values()
-    data = ( src, local, title_id, composer, lyricist, sheet )
-
-    if MYSQL:
-        txt = 'INSERT IGNORE INTO titles ( src, local, title_id, composer, lyricist, sheet ) VALUES( %s, %s, %s, %s, %s, %s )'
-
-    if SQLITE:
-        txt = 'INSERT OR IGNORE INTO titles ( src, local, title_id, composer, lyricist, sheet ) VALUES( ?, ?, ?, ?, ?, ? )'
-
-    execute( c, txt, data )
-
-    if FULLTEXT and SQLITE:
-        txt = 'INSERT OR IGNORE INTO titles_fts ( src, local, title_id, composer, lyricist, sheet ) VALUES( ?, ?, ?, ?, ?, ? )'
-        execute( c, txt, data )
-
 # ----------------------------------------------------------------------------------
 #   Build titles_distinct table from data in the Index.Json directory.
 #   This is first pass over Index.Json directory. Need titles_distinct to build titles.
@@ -973,18 +1313,31 @@ def proc_one_book_int( c, src, local, title_id, composer, lyricist, sheet ):
 #       SELECT DISTINCT in Sqlite considers all columns distinct, Mysql only the specified column.
 #       No! Doing it the same way for both, working from titles_distinct
 
+#   WRW 18-Oct-2026 - Split as build_titles(), tables created and loaded in load_titles_distinct().
+
+@timed
 def build_titles_distinct( c, conn ):
-    s = Store()
-    MYSQL, SQLITE, FULLTEXT = s.driver.values()
     print( "\nBuilding titles_distinct", file=sys.stderr, flush=True  )
 
     titles_distinct = set()
     raw_index = []
 
-    s.fb.traverse_sources( build_titles_distinct_from_one_index_source, 
-                           c=c,
-                           titles_distinct = titles_distinct,
-                           raw_index = raw_index )              # Builds titles_distinct set()
+    traverse_music_index( proc_one_book_for_titles_distinct,
+                          c=c,
+                          titles_distinct = titles_distinct,
+                          raw_index = raw_index )               # Builds titles_distinct set()
+
+    load_titles_distinct( c, titles_distinct, raw_index )
+    conn.commit()
+    return 0
+
+# --------------------------------------------------------------------------
+#   Create titles_distinct and raw_index, assign title_ids in sorted title order.
+
+def load_titles_distinct( c, titles_distinct, raw_index ):
+    global Title_Ids
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
 
     txt = 'DROP TABLE IF EXISTS raw_index;'
     execute( c, txt )
@@ -992,13 +1345,6 @@ def build_titles_distinct( c, conn ):
     txt = 'DROP TABLE IF EXISTS titles_distinct;'
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS titles_distinct_fts;'
-        execute( c, txt )
-
-        txt = 'DROP TABLE IF EXISTS raw_index_fts;'
-        execute( c, txt )
-
     if MYSQL:
         txt = """CREATE TABLE titles_distinct (
             title VARCHAR(255),
@@ -1042,145 +1388,410 @@ def build_titles_distinct( c, conn ):
         """
         execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE titles_distinct_fts USING fts5(
-            title,
-            title_id,
-            content='titles_distinct',
-            content_rowid='title_id'
-        )
-        """
-        execute( c, txt )
 
-        txt = """CREATE VIRTUAL TABLE raw_index_fts USING fts5(
-            title_id,
-            local,
-            src,
-            file,
-            content='raw_index',
-            content_rowid='id'
-        )
-        """
-        execute( c, txt )
+    # --------------------------------------------------------------
+    #   Build titles_distinct table directly from titles_distinct set instead
+    #       of from an intermediate table. Inserting title_id here, remove AUTO INCREMENT in CREATE.
+
+    Title_Ids = { title : title_id for title_id, title in enumerate( sorted( titles_distinct )) }
+    data = list( Title_Ids.items() )
+
+    txt = 'INSERT INTO titles_distinct ( title, title_id ) VALUES( %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
+
+    # --------------------------------------------------------------
+    #   Add index here as using titles_distinct in get_title_id_from_title(), which is used by
+    #       build_titles() and build_title2youtube(). Cut run time in about half.
+    #       WRW 18-Oct-2026 - Those now use Title_Ids, the index remains for searches.
+    #       add_indexes() adds FULLTEXT index.  Need ordinary index for get_title_id_from_title().
+    #   PRIMARY KEY is automatically indexed, don't need to add another here.
+    #   WRW 4 June 2022 - Realized I have no FULLTEXT index on title in titles_distinct for MySql.
+    #       add_indexes() must have been vestigal. Probably pulled all from that and put inline.
+    #       Made a difference - eliminated noticeable latency.
+
+    if MYSQL:
+        txt = "ALTER TABLE titles_distinct ADD INDEX( title ), ADD INDEX( title_id )"
+        execute( c, txt )
+
+        txt = "ALTER TABLE titles_distinct ADD FULLTEXT( title )"   # WRW 4 June 2022
+        execute( c, txt )
+
+    if SQLITE:
+        txt = "CREATE INDEX titles_distinct_index ON titles_distinct( title, title_id )"
+        execute( c, txt )
+
+    # --------------------------------------------------------------
+    #   WRW 1 Apr 2022 - Build raw_index table after add indexes because of the inner SELECT
+    #   WRW 18-Oct-2026 - title_id from Title_Ids, not an inner SELECT per row. None, as NULL
+    #       from the SELECT, for a falsey title.
+
+    insert_raw_index( c, raw_index )
+
+    # --------------------------------------------------------------
+
+    if MYSQL:
+        txt = "ALTER TABLE raw_index ADD INDEX( src ), ADD INDEX( title_id ), ADD INDEX( local )"
+        execute( c, txt )
+
+    if SQLITE:
+        txt = "CREATE INDEX raw_index_index ON raw_index( src, local, title_id )"
+        execute( c, txt )
+
+    # --------------------------------------------------------------
+
+    build_word_index( c, 'titles_distinct' )
+    build_fts_index( c, 'titles_distinct' )
+
+# --------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - titles_distinct, raw_index, and titles from one pass over the index
+#       files. titles rows are collected with the title in place of the title_id, which
+#       is filled in after load_titles_distinct() assigns them. Was a separate traversal,
+#       reading and parsing every file, for each of build_titles_distinct() and build_titles().
+
+@timed
+def build_titles_and_titles_distinct( dc, c, conn ):
+    print( "\nBuilding titles_distinct and titles", file=sys.stderr, flush=True  )
+
+    titles_distinct = set()
+    raw_index = []
+    rows = []
+    index_files = {}
+
+    traverse_music_index( proc_one_book_for_titles_and_titles_distinct,
+                          c=c, dc=dc,
+                          titles_distinct = titles_distinct,
+                          raw_index = raw_index,
+                          rows = rows,
+                          index_files = index_files,
+                          title_id_fcn = lambda title: title )
+
+    load_titles_distinct( c, titles_distinct, raw_index )
+
+    data = [ ( src, local, Title_Ids.get( title ), composer, lyricist, sheet ) for src, local, title, composer, lyricist, sheet in rows ]
+    load_titles( c, data, index_files )
+
+    conn.commit()
+    return 0
+
+def proc_one_book_for_titles_and_titles_distinct( src, data, file, **kwargs ):
+    proc_one_book_for_titles_distinct( src, data, file, **kwargs )
+    proc_one_book( src, data, file, **kwargs )
+
+# --------------------------------------------------------------------------
+
+def insert_raw_index( c, raw_index ):
+    data = [ ( item[ 'src' ], item[ 'local' ], item[ 'file' ], item[ 'line' ], Title_Ids.get( item[ 'title' ] ) ) for item in raw_index ]
+
+    txt = """INSERT INTO raw_index( src, local, file, line, title_id )
+             VALUES( %s, %s, %s, %s, %s )"""
+
+    txt = fix_query( txt )
+    executemany( c, txt, data )
+
+
+# --------------------------------------------------------------------------
+#   Add each title to titles_distinct set().
+#   WRW 22 Feb 2022 - Was getting a lot of duplicates in titles_distinct.      
+#       Sets do not contain duplicates. Looks like capitalization problem
+#       but that should have been done at add() time. Problem with diacriticals.
+#       Corrected in fb_title_corrections().
+#       Only do corrections in fb_title_corrections() at add time.
+
+def proc_one_book_for_titles_distinct ( src, data, file, **kwargs ):
+
+    c = kwargs[ 'c' ]
+    titles_distinct = kwargs[ 'titles_distinct' ]       # WRW 27 Mar 2022 - Now passing titles_distinct through kwargs[]
+    raw_index = kwargs[ 'raw_index' ]                   # WRW 1 Apr 2022 - Add raw_index
+    contents = data[ 'contents' ]
+    local = data[ 'local' ]                             # WRW 5 Apr 2022 - Need this, too.
+
+    for line, content in enumerate( contents ):
+        title = content[ 'title' ]                                               
+        if title:
+            titles_distinct.add( title )
+        else:
+            print( f"      WARNING: falsey title on line {line+1} of {file}", file=sys.stderr, flush=True  )
+
+        if 'file' in content:
+            file = content[ 'file' ]
+        else:
+            print( f"      WARNING: 'file' not found on line {line+1} of {file}", file=sys.stderr, flush=True  )
+
+        if 'line' in content:
+            line = content[ 'line' ]
+        else:
+            print( f"      WARNING: 'line' not found on line {line+1} of {file}", file=sys.stderr, flush=True  )
+
+        raw_index.append( {'title' : title, 'src' : src, 'local' : local, 'file' : file, 'line' : line } )
+
+    if False:   # WRW 28-May-2025 - remove _TitleFirst and _TitleLast
+        titles_distinct.add( "_TitleFirst"  )
+        titles_distinct.add( "_TitleLast"  )
+
+# ==========================================================================
+#   WRW 18-Oct-2026 - Incremental rebuild of titles_distinct, titles, and raw_index.
+#       index_manifest records the mtime, size, and hash of each index file in
+#       music_index_dir when titles is built. A file is hashed only when its mtime or size
+#       differ from the manifest, so the hash separates touched from changed files. --incremental compares the files with it
+#       and for each changed, new, or removed file deletes and re-inserts only the titles
+#       and raw_index rows of its ( src, local ). New titles are appended to titles_distinct
+#       with new title_ids, existing title_ids are unchanged so other tables remain valid.
+#       Titles no longer referenced stay in titles_distinct until the next full build.
+
+def create_index_manifest( c ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    if MYSQL:
+        txt = """CREATE TABLE IF NOT EXISTS index_manifest (
+                file VARCHAR(255),
+                src VARCHAR(255),
+                local VARCHAR(255),
+                mtime BIGINT,
+                size BIGINT,
+                hash VARCHAR(64),
+                PRIMARY KEY(file) )
+                ENGINE = MYISAM
+                CHARACTER SET 'utf8mb4'
+            """
+    if SQLITE:
+        txt = """CREATE TABLE IF NOT EXISTS index_manifest (
+                file VARCHAR(255),
+                src VARCHAR(255),
+                local VARCHAR(255),
+                mtime INTEGER,
+                size INTEGER,
+                hash VARCHAR(64),
+                PRIMARY KEY(file) )
+            """
+    execute( c, txt )
+
+# --------------------------------------------------------------------------
+#   Index files as { file : src }, file relative to music_index_dir. Same selection
+#       of files by src as get_music_index_data_by_src().
+
+def get_index_files():
+    s = Store()
+    index_dir = s.conf.val( 'music_index_dir' )
+
+    files = {}
+    for src in s.fb.get_srcs_from_index():
+        for file in glob.glob( f"{src}*.json.gz", root_dir=index_dir ):
+            files[ file ] = src
+    return files
+
+def get_file_fingerprint( path ):
+    st = os.stat( path )
+    return st.st_mtime_ns, st.st_size
+
+def get_file_hash( path ):
+    with open( path, 'rb' ) as fd:
+        return hashlib.sha256( fd.read() ).hexdigest()
+
+# --------------------------------------------------------------------------
+
+def read_index_manifest( c ):
+    txt = "SELECT file, src, local, mtime, size, hash FROM index_manifest"
+    execute( c, txt )
+    return { row[0] : row[1:] for row in c.fetchall() }
+
+def write_index_manifest( c, rows ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    if MYSQL:
+        txt = 'REPLACE INTO index_manifest ( file, src, local, mtime, size, hash ) VALUES( %s, %s, %s, %s, %s, %s )'
+
+    if SQLITE:
+        txt = 'INSERT OR REPLACE INTO index_manifest ( file, src, local, mtime, size, hash ) VALUES( ?, ?, ?, ?, ?, ? )'
+
+    executemany( c, txt, rows )
+
+# --------------------------------------------------------------------------
+#   Record all index files after a full build of titles. index_files is { file : local }
+#       as seen by proc_one_book(). The hash is kept from the old manifest when mtime and size match.
+
+def save_index_manifest( c, index_files ):
+    s = Store()
+    index_dir = s.conf.val( 'music_index_dir' )
+
+    create_index_manifest( c )
+    manifest = read_index_manifest( c )
+    execute( c, "DELETE FROM index_manifest" )
+
+    rows = []
+    hashed = 0
+    for file, src in get_index_files().items():
+        path = Path( index_dir, file )
+        local = index_files.get( file )
+        mtime, size = get_file_fingerprint( path )
+        old = manifest.get( file )
+
+        if old and old[2:4] == ( mtime, size ) and old[4]:
+            file_hash = old[4]
+        else:
+            file_hash = get_file_hash( path )
+            hashed += 1
+
+        rows.append( ( file, src, local, mtime, size, file_hash ) )
+
+    print( f"   Index manifest: {len( rows )} files, {hashed} hashed", file=sys.stderr, flush=True  )
 
+    write_index_manifest( c, rows )
 
-    # --------------------------------------------------------------
-    #   Build titles_distinct table directly from titles_distinct set instead
-    #       of from an intermediate table. Inserting title_id here, remove AUTO INCREMENT in CREATE.
+# --------------------------------------------------------------------------
 
-    for title_id, title in enumerate( sorted( titles_distinct )):
+#   deleted, if given, gets the titles rows deleted for update_word_index(), Sqlite only.
 
-        data = ( title, title_id )
+def delete_music_index_rows( c, src, local, deleted=None ):
+    if deleted is not None:
+        deleted.extend( get_word_index_rows( c, 'titles', 'src = ? AND local = ?', [ src, local ] ) )
 
-        txt = 'INSERT INTO titles_distinct ( title, title_id ) VALUES( %s, %s )'
+    for table in [ 'titles', 'raw_index' ]:
+        txt = f"DELETE FROM {table} WHERE src = %s AND local = %s"
         txt = fix_query( txt )
-        execute( c, txt, data )
+        execute( c, txt, [ src, local ] )
 
-        if FULLTEXT and SQLITE:
-            txt = 'INSERT INTO titles_distinct_fts ( title, title_id ) VALUES( ?, ? )'
-            execute( c, txt, data )
+# --------------------------------------------------------------------------
 
-    # --------------------------------------------------------------
-    #   Add index here as using titles_distinct in get_title_id_from_title(), which is used by
-    #       build_titles() and build_title2youtube(). Cut run time in about half.
-    #       add_indexes() adds FULLTEXT index.  Need ordinary index for get_title_id_from_title().
-    #   PRIMARY KEY is automatically indexed, don't need to add another here.
-    #   WRW 4 June 2022 - Realized I have no FULLTEXT index on title in titles_distinct for MySql.
-    #       add_indexes() must have been vestigal. Probably pulled all from that and put inline.
-    #       Made a difference - eliminated noticeable latency.
+@timed
+def build_music_index_incremental( dc, c, conn ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+    print( "\nUpdating titles_distinct, titles, raw_index incrementally", file=sys.stderr, flush=True  )
 
-    if MYSQL:
-        txt = "ALTER TABLE titles_distinct ADD INDEX( title ), ADD INDEX( title_id )"
-        execute( c, txt )
+    index_dir = s.conf.val( 'music_index_dir' )
+    create_index_manifest( c )
+    manifest = read_index_manifest( c )
 
-        txt = "ALTER TABLE titles_distinct ADD FULLTEXT( title )"   # WRW 4 June 2022
-        execute( c, txt )
+    if not manifest:
+        print( "   No index manifest, doing full build", file=sys.stderr, flush=True  )
+        return build_titles_and_titles_distinct( dc, c, conn )
 
-    if SQLITE:
-        txt = "CREATE INDEX titles_distinct_index ON titles_distinct( title, title_id )"
-        execute( c, txt )
+    # ----------------------------------------------------------
+    #   Changed: mtime or size differ and so does the hash. Touched but same content
+    #       just updates the manifest.
 
-    # --------------------------------------------------------------
-    #   WRW 1 Apr 2022 - Build raw_index table after add indexes because of the inner SELECT
+    files = get_index_files()
+    changed = []
+    touched = []
 
-    for item in raw_index:
+    for file, src in sorted( files.items() ):
+        path = Path( index_dir, file )
+        mtime, size = get_file_fingerprint( path )
+        old = manifest.get( file )
 
-        data = ( item[ 'src' ], item[ 'local' ], item[ 'file' ], item[ 'line' ], item[ 'title' ]  )
+        if old and old[2:4] == ( mtime, size ):
+            continue
 
-        txt = """INSERT INTO raw_index( src, local, file, line, title_id )
-                 VALUES( %s, %s, %s, %s,
-                    (SELECT title_id from titles_distinct WHERE title = %s ) 
-                 )"""
+        file_hash = get_file_hash( path )
+        if old and old[4] == file_hash:
+            touched.append( ( file, src, old[1], mtime, size, file_hash ) )
+        else:
+            changed.append( ( file, src, mtime, size, file_hash ) )
 
-        txt = fix_query( txt )
+    removed = sorted( set( manifest ) - set( files ) )
 
-        execute( c, txt, data )
+    print( f"   Index files: {len( files )}, changed or new: {len( changed )}, removed: {len( removed )}", file=sys.stderr, flush=True  )
 
-    # --------------------------------------------------------------
+    write_index_manifest( c, touched )
 
-    if MYSQL:
-        txt = "ALTER TABLE raw_index ADD INDEX( src ), ADD INDEX( title_id ), ADD INDEX( local )"
-        execute( c, txt )
+    if not changed and not removed:
+        conn.commit()
+        return 0
 
-    if SQLITE:
-        txt = "CREATE INDEX raw_index_index ON raw_index( src, local, title_id )"
-        execute( c, txt )
+    # ----------------------------------------------------------
 
-    # --------------------------------------------------------------
+    deleted = [] if SQLITE else None        # titles rows removed, for update_word_index()
 
-    conn.commit()
-    return 0
+    for file in removed:
+        src, local = manifest[ file ][0:2]
+        print( f"   Removed: {file}", file=sys.stderr, flush=True  )
+        delete_music_index_rows( c, src, local, deleted )
 
-# --------------------------------------------------------------------------
+        txt = fix_query( "DELETE FROM index_manifest WHERE file = %s" )
+        execute( c, txt, [ file ] )
 
-def build_titles_distinct_from_one_index_source ( src, **kwargs ):
-    s = Store()
-    MYSQL, SQLITE, FULLTEXT = s.driver.values()
-    s.fb.get_music_index_data_by_src( src, proc_one_book_for_titles_distinct, **kwargs )
+    # ----------------------------------------------------------
 
-# --------------------------------------------------------------------------
-#   Add each title to titles_distinct set().
-#   WRW 22 Feb 2022 - Was getting a lot of duplicates in titles_distinct.      
-#       Sets do not contain duplicates. Looks like capitalization problem
-#       but that should have been done at add() time. Problem with diacriticals.
-#       Corrected in fb_title_corrections().
-#       Only do corrections in fb_title_corrections() at add time.
+    load_title_ids()
+    next_title_id = max( Title_Ids.values(), default=-1 ) + 1
+    new_titles = []
+    raw_index = []
+    titles = []
+    rows = []
 
-def proc_one_book_for_titles_distinct ( src, data, file, **kwargs ):
+    curdir = os.getcwd()
+    os.chdir( index_dir )                   # As in get_music_index_data_by_src(), file in WARNINGs is relative.
 
-    c = kwargs[ 'c' ]
-    titles_distinct = kwargs[ 'titles_distinct' ]       # WRW 27 Mar 2022 - Now passing titles_distinct through kwargs[]
-    raw_index = kwargs[ 'raw_index' ]                   # WRW 1 Apr 2022 - Add raw_index
-    contents = data[ 'contents' ]
-    local = data[ 'local' ]                             # WRW 5 Apr 2022 - Need this, too.
+    for file, src, mtime, size, file_hash in changed:
+        print( f"   Changed: {file}", file=sys.stderr, flush=True  )
 
-    for line, content in enumerate( contents ):
-        title = content[ 'title' ]                                               
-        if title:
-            titles_distinct.add( title )
-        else:
-            print( f"      WARNING: falsey title on line {line+1} of {file}", file=sys.stderr, flush=True  )
+        with gzip.open( file, 'rt', encoding='utf-8' ) as ifd:
+            data = json.load( ifd )
 
-        if 'file' in content:
-            file = content[ 'file' ]
-        else:
-            print( f"      WARNING: 'file' not found on line {line+1} of {file}", file=sys.stderr, flush=True  )
+        local = data[ 'local' ]
+        if file in manifest:
+            delete_music_index_rows( c, *manifest[ file ][0:2], deleted )       # local may have changed in file
+        delete_music_index_rows( c, src, local, deleted )
 
-        if 'line' in content:
-            line = content[ 'line' ]
-        else:
-            print( f"      WARNING: 'line' not found on line {line+1} of {file}", file=sys.stderr, flush=True  )
+        titles_distinct = set()
+        proc_one_book_for_titles_distinct( src, data, file, c=c, titles_distinct=titles_distinct, raw_index=raw_index )
 
-        raw_index.append( {'title' : title, 'src' : src, 'local' : local, 'file' : file, 'line' : line } )
+        for title in sorted( titles_distinct ):
+            if title not in Title_Ids:
+                Title_Ids[ title ] = next_title_id
+                new_titles.append( ( title, next_title_id ) )
+                next_title_id += 1
 
-    if False:   # WRW 28-May-2025 - remove _TitleFirst and _TitleLast
-        titles_distinct.add( "_TitleFirst"  )
-        titles_distinct.add( "_TitleLast"  )
+        titles.append( ( src, data, file ) )
+        rows.append( ( file, src, local, mtime, size, file_hash ) )
+
+    os.chdir( curdir )
+
+    # ----------------------------------------------------------
+    #   Sqlite gives new rows rowids above the largest one left, new_rows from there.
+
+    if SQLITE:
+        last_rowids = {}
+        for table in [ 'titles_distinct', 'titles' ]:
+            execute( c, f"SELECT COALESCE( MAX( rowid ), 0 ) FROM {table}" )
+            last_rowids[ table ] = c.fetchone()[0]
+
+    txt = 'INSERT INTO titles_distinct ( title, title_id ) VALUES( %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, new_titles )
+
+    insert_raw_index( c, raw_index )
+
+    data = []
+    for src, book, file in titles:
+        proc_one_book( src, book, file, c=c, dc=dc, rows=data )
+    insert_titles( c, data )
+
+    write_index_manifest( c, rows )
+
+    print( f"   New titles: {len( new_titles )}, titles rows: {len( data )}", file=sys.stderr, flush=True  )
+
+    # ----------------------------------------------------------
+    #   Word and FTS indexes are by rowid, update them for the rows deleted and inserted.
+    #   titles_distinct rows are only added.
+
+    if SQLITE:
+        for table, old_rows in [ ( 'titles_distinct', [] ), ( 'titles', deleted ) ]:
+            new_rows = get_word_index_rows( c, table, 'rowid > ?', [ last_rowids[ table ] ] )
+            if old_rows or new_rows:
+                update_word_index( c, table, old_rows, new_rows )
+
+    conn.commit()
+    return 0
 
 # ----------------------------------------------------------------------------------
 #   WRW 23-May-2025 - Removed duration, too expensive to obtain in latest youtub library
 #       and of marginal interest.
 
+@timed
 def build_title2youtube( dc, c, conn, show_found, show_not_found ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
@@ -1189,10 +1800,6 @@ def build_title2youtube( dc, c, conn, show_found, show_not_found ):
     txt = 'DROP TABLE IF EXISTS title2youtube;'
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS title2youtube_fts;'
-        execute( c, txt )
-
     #            duration VARCHAR(255),
 
     if MYSQL:
@@ -1216,20 +1823,8 @@ def build_title2youtube( dc, c, conn, show_found, show_not_found ):
             """
     execute( c, txt )
 
-    #        duration UNINDEXED,
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE title2youtube_fts USING fts5(
-            title,
-            ytitle UNINDEXED,
-            title_id UNINDEXED,
-            yt_id UNINDEXED,
-            content='title2youtube',
-            content_rowid='id'
-        )
-        """
-        execute( c, txt )
-
     count_titles_total = count_titles_found = count_titles_not_found = 0
+    rows = []
 
     with gzip.open( s.conf.val( 'youtube_index'), 'rt', encoding='utf-8' ) as ifd:  # /// WRW 23-Mar-2025 ENCODING
         data = json.load( ifd )
@@ -1239,9 +1834,9 @@ def build_title2youtube( dc, c, conn, show_found, show_not_found ):
             title = content[ 'title' ]
             links = content[ 'links' ]
 
-            title_id = s.fb.get_title_id_from_title( title )    # dc passed in Store()
+            title_id = get_title_id( title )                    # WRW 18-Oct-2026 - was s.fb.get_title_id_from_title()
 
-            if title_id:
+            if title_id is not None:                            # WRW 18-Oct-2026 - was 'if title_id:', dropped title_id 0
                 if show_found:
                     print( title, file=sys.stderr, flush=True  )
                 count_titles_found += 1
@@ -1255,23 +1850,18 @@ def build_title2youtube( dc, c, conn, show_found, show_not_found ):
 
                     yt_id = link[ 'id' ]
                     # data = ( title_id, ytitle, duration, yt_id )
-                    data = ( title_id, ytitle, yt_id )
-
-                    # txt = 'INSERT INTO title2youtube ( title_id, ytitle, duration, yt_id ) VALUES( %s, %s, %s, %s )'
-                    txt = 'INSERT INTO title2youtube ( title_id, ytitle, yt_id ) VALUES( %s, %s, %s )'
-                    txt = fix_query( txt )
-                    execute( c, txt, data )
-
-                    if FULLTEXT and SQLITE:
-                        # txt = 'INSERT INTO title2youtube_fts ( title_id, ytitle, duration, yt_id ) VALUES( ?, ?, ?, ? )'
-                        txt = 'INSERT INTO title2youtube_fts ( title_id, ytitle, yt_id ) VALUES( ?, ?, ? )'
-                        execute( c, txt, data )
+                    rows.append( ( title_id, ytitle, yt_id ) )
 
             else:
                 count_titles_not_found += 1
                 if show_not_found:
                     print( title, file=sys.stderr, flush=True  )
 
+    # txt = 'INSERT INTO title2youtube ( title_id, ytitle, duration, yt_id ) VALUES( %s, %s, %s, %s )'
+    txt = 'INSERT INTO title2youtube ( title_id, ytitle, yt_id ) VALUES( %s, %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, rows )
+
     # ----------------------
 
     if MYSQL:
@@ -1298,6 +1888,7 @@ def build_title2youtube( dc, c, conn, show_found, show_not_found ):
 #   WRW 5 Apr 2022 - get_page_from_sheet() was not working using sqlite. Looks
 #       like problem is trying to use primary key 'id'. Add separate counter 'offset_id'.
 
+@timed
 def build_sheet_offsets( c, conn ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
@@ -1330,7 +1921,12 @@ def build_sheet_offsets( c, conn ):
             """
     execute( c, txt )
 
-    s.fb.traverse_sources( int_build_sheet_offsets, c=c )
+    data = []
+    s.fb.traverse_sources( int_build_sheet_offsets, c=c, data=data )
+
+    txt = 'INSERT INTO sheet_offsets ( src, local, sheet_start, sheet_offset, offset_id ) VALUES( %s, %s, %s, %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
 
     if MYSQL:
         txt = "ALTER TABLE sheet_offsets ADD INDEX( src ), ADD INDEX( local ), ADD INDEX( sheet_start)"
@@ -1350,7 +1946,7 @@ def build_sheet_offsets( c, conn ):
 
 def int_build_sheet_offsets( src, **kwargs ):
     s = Store()
-    c = kwargs[ 'c' ]
+    data = kwargs[ 'data' ]                             # WRW 18-Oct-2026 - Rows for executemany() in caller
 
     print( f"   {src} {s.fb.get_source_from_src( src )}", file=sys.stderr, flush=True  )
     source = s.fb.get_source_from_src( src )
@@ -1377,10 +1973,7 @@ def int_build_sheet_offsets( src, **kwargs ):
                 sheet_start = int( mo.group(1).strip() )
                 sheet_offset = int( mo.group(2).strip() )
 
-                data = ( src, local, sheet_start, sheet_offset, offset_id )
-                txt = 'INSERT INTO sheet_offsets ( src, local, sheet_start, sheet_offset, offset_id ) VALUES( %s, %s, %s, %s, %s )'
-                txt = fix_query( txt )
-                execute( c, txt, data )
+                data.append( ( src, local, sheet_start, sheet_offset, offset_id ) )
                 offset_id += 1
 
 # --------------------------------------------------------------------------
@@ -1393,22 +1986,187 @@ def old_listfiles( folder ):
             yield (root, file)
             # yield os.path.join(root, file)
 
+# --------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Directory snapshots for incremental rescans of the music, midi, chordpro,
+#       and jjazz file trees. For each directory dir_snapshot has its mtime and the names of
+#       its files and subdirectories. A directory's mtime changes when an entry in it is added,
+#       removed, or renamed, so when it has not changed the saved names are used and the
+#       directory is not listed again. Only a stat() per directory on the (slow NAS) file system.
+
+#   Usage in a build_*_files():
+#       snapshot = DirSnapshot( c, table, incremental )
+#       for root, file in snapshot.listfiles( path, tag ):     - as fb.listfiles(), only new or changed dirs
+#       for root, old_files in snapshot.stale_dirs():           - delete rows for these
+#       snapshot.save()
+
+#   A directory reached again from an overlapping top, e.g., 'Books' after 'Books/Fakebooks',
+#       is skipped with its subtree, it belongs to the first walk. Walk nested tops deepest
+#       first when their tags differ so the deepest top decides, see build_music_files().
+
+#   tag is extra state the rows of a directory depend on, e.g., fb_flag. Rows of files whose
+#       content changed but not their names are not updated, e.g., a midi sidecar edited in place.
+
+class DirSnapshot():
+
+    def __init__( self, c, table, incremental ):
+        self.c = c
+        self.table = table
+        self.old = {}                   # dir : ( mtime, files, subdirs, tag )
+        self.new = {}
+        self.changed = []               # ( dir, old_files ) rescanned
+        self.skipped = 0
+
+        create_dir_snapshot( c )
+        if incremental:
+            txt = fix_query( "SELECT dir, mtime, files, subdirs, tag FROM dir_snapshot WHERE tbl = %s" )
+            execute( c, txt, [ table ] )
+            for dir, mtime, files, subdirs, tag in c.fetchall():
+                self.old[ dir ] = ( mtime, json.loads( files ), json.loads( subdirs ), tag )
+
+    # ----------------------------------------------------------------------
+    #   Walk top like os.walk(), yield ( root, file ) for files in new or changed dirs only.
+    #       As os.walk(), symlinks to directories are listed as files, not followed.
+
+    def listfiles( self, top, tag='' ):
+        stack = [ str( top ) ]
+
+        while stack:
+            dir = stack.pop()
+            if dir in self.new:                 # Overlapping folders, already done by an earlier top
+                continue
+
+            try:
+                mtime = os.stat( dir ).st_mtime_ns
+
+            except OSError:
+                continue
+
+            old = self.old.get( dir )
+
+            if old and old[0] == mtime and old[3] == tag:
+                files, subdirs = old[1], old[2]
+                self.skipped += 1
+                changed = False
+
+            else:
+                files = []
+                subdirs = []
+                try:
+                    with os.scandir( dir ) as it:
+                        for entry in it:
+                            if entry.is_dir() and not entry.is_symlink():
+                                subdirs.append( entry.name )
+                            elif not entry.is_dir():
+                                files.append( entry.name )
+
+                except OSError:
+                    (extype, value, traceback) = sys.exc_info()
+                    print( f"      ERROR on scandir(), type: {extype}, value: {value}", file=sys.stderr, flush=True )
+
+                files.sort()
+                subdirs.sort()
+                self.changed.append( ( dir, old[1] if old else [] ) )
+                changed = True
+
+            self.new[ dir ] = ( mtime, files, subdirs, tag )
+
+            if changed:
+                for file in files:
+                    yield dir, file
+
+            stack.extend( str( Path( dir, x )) for x in reversed( subdirs ))
+
+    # ----------------------------------------------------------------------
+    #   Directories whose old rows must be deleted: rescanned ones and ones that are gone.
+
+    def stale_dirs( self ):
+        removed = [ ( dir, old[1] ) for dir, old in self.old.items() if dir not in self.new ]
+        return [ x for x in self.changed if x[1] ] + removed
+
+    # ----------------------------------------------------------------------
+
+    def save( self ):
+        txt = fix_query( "DELETE FROM dir_snapshot WHERE tbl = %s" )
+        execute( self.c, txt, [ self.table ] )
+
+        data = [ ( self.table, dir, mtime, json.dumps( files ), json.dumps( subdirs ), tag )
+                 for dir, ( mtime, files, subdirs, tag ) in self.new.items() ]
+
+        txt = fix_query( "INSERT INTO dir_snapshot ( tbl, dir, mtime, files, subdirs, tag ) VALUES( %s, %s, %s, %s, %s, %s )" )
+        executemany( self.c, txt, data )
+
+        removed = sum( 1 for dir in self.old if dir not in self.new )
+        print( f"   Directories: {len( self.new )}, unchanged skipped: {self.skipped}, rescanned: {len( self.changed )}, removed: {removed}", file=sys.stderr, flush=True  )
+
+# --------------------------------------------------------------------------
+
+def create_dir_snapshot( c ):
+    s = Store()
+    MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+    if MYSQL:
+        txt = """CREATE TABLE IF NOT EXISTS dir_snapshot (
+                tbl VARCHAR(64),
+                dir TEXT,
+                mtime BIGINT,
+                files MEDIUMTEXT,
+                subdirs MEDIUMTEXT,
+                tag VARCHAR(16),
+                INDEX( tbl ) )
+                ENGINE = MYISAM
+                CHARACTER SET 'utf8mb4'
+            """
+        execute( c, txt )
+
+    if SQLITE:
+        txt = """CREATE TABLE IF NOT EXISTS dir_snapshot (
+                tbl VARCHAR(64),
+                dir TEXT,
+                mtime INTEGER,
+                files TEXT,
+                subdirs TEXT,
+                tag VARCHAR(16) )
+            """
+        execute( c, txt )
+
+        txt = "CREATE INDEX IF NOT EXISTS dir_snapshot_index ON dir_snapshot( tbl )"
+        execute( c, txt )
+
+# --------------------------------------------------------------------------
+#   True if table and a snapshot for it exist so table can be updated in place.
+
+def have_dir_snapshot( c, table ):
+    try:
+        c.execute( f"SELECT 1 FROM {table} LIMIT 1" )
+        c.fetchall()
+        c.execute( fix_query( "SELECT COUNT(*) FROM dir_snapshot WHERE tbl = %s" ), [ table ] )
+        return c.fetchone()[0] > 0
+
+    except Exception:
+        return False
+
+# --------------------------------------------------------------------------
+
+def count_rows( c, table ):
+    execute( c, f"SELECT COUNT(*) FROM {table}" )
+    return c.fetchone()[0]
+
 # -----------------------------------------------------------------------
+#   WRW 18-Oct-2026 - incremental, rescan only changed directories, see DirSnapshot.
 
-def build_music_files( c, conn ):
+@timed
+def build_music_files( c, conn, incremental=False ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
     print( "\nBuilding music_files", file=sys.stderr, flush=True  )
 
-    txt = 'DROP TABLE IF EXISTS music_files;'
-    execute( c, txt )
-
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS music_files_fts;'
+    incremental = incremental and have_dir_snapshot( c, 'music_files' )
+    if not incremental:
+        txt = 'DROP TABLE IF EXISTS music_files;'
         execute( c, txt )
 
     if MYSQL:
-        txt = """CREATE TABLE music_files(
+        txt = """CREATE TABLE IF NOT EXISTS music_files(
                 rpath VARCHAR(255),
                 file VARCHAR(255),
                 fb_flag CHAR(1),
@@ -1418,7 +2176,7 @@ def build_music_files( c, conn ):
                 CHARACTER SET 'utf8mb4'
             """
     if SQLITE:
-        txt = """CREATE TABLE music_files(
+        txt = """CREATE TABLE IF NOT EXISTS music_files(
                 rpath VARCHAR(255),
                 file VARCHAR(255),
                 fb_flag VARCHAR(1),
@@ -1427,19 +2185,10 @@ def build_music_files( c, conn ):
             """
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE music_files_fts USING fts5(
-            rpath,
-            file,
-            fb_flag,
-            content='music_files',
-            content_rowid='id'
-        )
-        """
-        execute( c, txt )
-
     file_count = 0
     file_count_by_ext = {}
+    data = []
+    snapshot = DirSnapshot( c, 'music_files', incremental )
 
     # ------------------------------------------------------------------------
     #   WRW 2 Mar 2022 - Recode this using Path() and add fakebook_folder flag.
@@ -1450,40 +2199,57 @@ def build_music_files( c, conn ):
 
     fakebook_folders = s.conf.val( 'c2f_editable_music_folders' )           # Starting point for canon2file editing.
 
+    #   WRW 18-Oct-2026 - Nested folders, e.g., 'Books' and 'Books/Fakebooks', deepest first so
+    #       that the files under the deeper one get its fb_flag. Each file is listed once.
+
     root = Path( s.conf.val( 'music_file_root' )).expanduser()
-    for folder in music_folders:
+    for folder in sorted( music_folders, key=lambda x: len( Path( x ).parts ), reverse=True ):
 
         if folder in fakebook_folders:
             fb_flag = 'y'
         else:
             fb_flag = 'n'
 
-        for file in Path( root, folder ).glob( '**/*.[pP][dD][fF]' ):
+        # for file in Path( root, folder ).glob( '**/*.[pP][dD][fF]' ):
+        for dir, name in snapshot.listfiles( Path( root, folder ), fb_flag ):
+            file = Path( dir, name )
+            if file.suffix.lower() != '.pdf':
+                continue
             rpath = str( file.relative_to( root ).parent)
-            data = (rpath, file.name, fb_flag )
-            txt = 'INSERT INTO music_files ( rpath, file, fb_flag ) VALUES( %s, %s, %s )'
-            txt = fix_query( txt )
-            execute( c, txt, data )
-
-            if FULLTEXT and SQLITE:
-                txt = 'INSERT INTO music_files_fts ( rpath, file, fb_flag ) VALUES( ?, ?, ? )'
-                execute( c, txt, data )
+            data.append( ( rpath, file.name, fb_flag ) )
 
             file_count += 1
             file_count_by_ext[ file.suffix ] = file_count_by_ext.setdefault( file.suffix, 0 ) + 1
 
+    stale = snapshot.stale_dirs()
+    txt = 'DELETE FROM music_files WHERE rpath = %s'
+    txt = fix_query( txt )
+    executemany( c, txt, [ ( str( Path( dir ).relative_to( root )), ) for dir, old_files in stale ] )
+
+    txt = 'INSERT INTO music_files ( rpath, file, fb_flag ) VALUES( %s, %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
+    snapshot.save()
+
     # ----------------------
 
-    if MYSQL:
+    if MYSQL and not incremental:
         txt = "ALTER TABLE music_files ADD FULLTEXT( rpath ), ADD FULLTEXT( file )"
         execute( c, txt )
 
+    if SQLITE:
+        txt = "CREATE INDEX IF NOT EXISTS music_files_index ON music_files( rpath )"
+        execute( c, txt )
+
     # ----------------------
 
-    print( f"   Music files total: {file_count}", file=sys.stderr, flush=True  )
+    print( f"   Music files total: {count_rows( c, 'music_files' )}, added from rescanned directories: {file_count}", file=sys.stderr, flush=True  )
     # for ext in file_count_by_ext:
     #     print( f"      {ext}: {file_count_by_ext[ ext ]}", file=sys.stderr, flush=True  )
 
+    if not incremental or stale or data:
+        build_word_index( c, 'music_files' )
+        build_fts_index( c, 'music_files' )
     conn.commit()
     return 0
 
@@ -1491,20 +2257,19 @@ def build_music_files( c, conn ):
 #   WRW 17-Mar-2025 - Add support for piano-roll midi files containing
 #       sidecar metadata
 
-def build_midi_files( c, conn ):
+@timed
+def build_midi_files( c, conn, incremental=False ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
     print( "\nBuilding midi_files", file=sys.stderr, flush=True  )
 
-    txt = 'DROP TABLE IF EXISTS midi_files;'
-    execute( c, txt )
-
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS midi_files_fts;'
+    incremental = incremental and have_dir_snapshot( c, 'midi_files' )
+    if not incremental:
+        txt = 'DROP TABLE IF EXISTS midi_files;'
         execute( c, txt )
 
     if MYSQL:
-        txt = """CREATE TABLE midi_files(
+        txt = """CREATE TABLE IF NOT EXISTS midi_files(
                 rpath VARCHAR(255),
                 file VARCHAR(255),
                 title VARCHAR(255),
@@ -1516,7 +2281,7 @@ def build_midi_files( c, conn ):
             """
 
     if SQLITE:
-        txt = """CREATE TABLE midi_files(
+        txt = """CREATE TABLE IF NOT EXISTS midi_files(
                 rpath VARCHAR(255),
                 file VARCHAR(255),
                 title VARCHAR(255),
@@ -1526,19 +2291,9 @@ def build_midi_files( c, conn ):
             """
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE midi_files_fts USING fts5(
-            rpath,
-            file,
-            title,
-            composer,
-            content='midi_files',
-            content_rowid='id'
-        )
-        """
-        execute( c, txt )
-
     file_count = 0
+    data = []
+    snapshot = DirSnapshot( c, 'midi_files', incremental )
 
     #   WRW 31-May-2025 - use all if folders is empty
     folders = s.conf.val('midi_folders') if s.conf.val('midi_folders') else ['.']
@@ -1549,7 +2304,7 @@ def build_midi_files( c, conn ):
         print( f"   Folder: {folder}", file=sys.stderr, flush=True  )
         # print( f"  Midi_File_Root: {s.fb.Midi_File_Root},    path: {path}" )
 
-        for root, file in s.fb.listfiles( path ):         # fb.listfiles() is doing os.walk()
+        for root, file in snapshot.listfiles( path ):     # Was s.fb.listfiles(), os.walk()
             # _, ext = os.path.splitext( file )
             ext = Path( file ).suffix
 
@@ -1596,45 +2351,54 @@ def build_midi_files( c, conn ):
                 title = title.replace( '_', ' ' )
                 title = title.replace( ext, '' )
 
-                data = (rpath, file, title, composer )
-                txt = 'INSERT INTO midi_files ( rpath, file, title, composer ) VALUES( %s, %s, %s, %s )'
-                txt = fix_query( txt )
-                execute( c, txt, data )
-
-                if FULLTEXT and SQLITE:
-                    txt = 'INSERT INTO midi_files_fts ( rpath, file, title, composer ) VALUES( ?, ?, ?, ? )'
-                    execute( c, txt, data )
+                data.append( ( rpath, file, title, composer ) )
 
                 file_count += 1
 
             # ---------------------------------------------------------
 
-    print( f"   Midi files total: {file_count}", file=sys.stderr, flush=True  )
+    stale = snapshot.stale_dirs()
+    txt = 'DELETE FROM midi_files WHERE rpath = %s'
+    txt = fix_query( txt )
+    executemany( c, txt, [ ( str( Path( dir ).relative_to( Path( s.conf.val('midi_file_root') ))), ) for dir, old_files in stale ] )
 
-    if MYSQL:
+    txt = 'INSERT INTO midi_files ( rpath, file, title, composer ) VALUES( %s, %s, %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
+    snapshot.save()
+
+    print( f"   Midi files total: {count_rows( c, 'midi_files' )}, added from rescanned directories: {file_count}", file=sys.stderr, flush=True  )
+
+    if MYSQL and not incremental:
         txt = "ALTER TABLE midi_files ADD FULLTEXT( rpath ), ADD FULLTEXT( file ), ADD FULLTEXT( title ), ADD FULLTEXT( composer )"
         execute( c, txt )
 
+    if SQLITE:
+        txt = "CREATE INDEX IF NOT EXISTS midi_files_index ON midi_files( rpath )"
+        execute( c, txt )
+
+    if not incremental or stale or data:
+        build_word_index( c, 'midi_files' )
+        build_fts_index( c, 'midi_files' )
     conn.commit()
     return 0
 
 # --------------------------------------------------------------------------
 #   WRW 27 Apr 2022 - Dinking around with chordpro and jjazz lab files
 
-def build_chordpro_files( c, conn ):
+@timed
+def build_chordpro_files( c, conn, incremental=False ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
     print( "\nBuilding chordpro_files", file=sys.stderr, flush=True  )
 
-    txt = 'DROP TABLE IF EXISTS chordpro_files;'
-    execute( c, txt )
-
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS chordpro_files_fts;'
+    incremental = incremental and have_dir_snapshot( c, 'chordpro_files' )
+    if not incremental:
+        txt = 'DROP TABLE IF EXISTS chordpro_files;'
         execute( c, txt )
 
     if MYSQL:
-        txt = """CREATE TABLE chordpro_files(
+        txt = """CREATE TABLE IF NOT EXISTS chordpro_files(
                 title VARCHAR(255),
                 artist VARCHAR(255),
                 file VARCHAR(255),
@@ -1645,7 +2409,7 @@ def build_chordpro_files( c, conn ):
             """
 
     if SQLITE:
-        txt = """CREATE TABLE chordpro_files(
+        txt = """CREATE TABLE IF NOT EXISTS chordpro_files(
                 title VARCHAR(255),
                 artist VARCHAR(255),
                 file VARCHAR(255),
@@ -1654,18 +2418,9 @@ def build_chordpro_files( c, conn ):
             """
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE chordpro_files_fts USING fts5(
-            title,
-            artist,
-            file,
-            content='chordpro_files',
-            content_rowid='id'
-        )
-        """
-        execute( c, txt )
-
     file_count = 0
+    data = []
+    snapshot = DirSnapshot( c, 'chordpro_files', incremental )
 
     #   WRW 31-May-2025 - use all if folders is empty
     chordpro_folders = s.conf.val('chordpro_folders') if s.conf.val('chordpro_folders') else ['.']
@@ -1675,7 +2430,7 @@ def build_chordpro_files( c, conn ):
 
         print( f"   {folder}", file=sys.stderr, flush=True  )
 
-        for root, file in s.fb.listfiles( path ):         # fb.listfiles() is doing os.walk()
+        for root, file in snapshot.listfiles( path ):     # Was s.fb.listfiles(), os.walk()
             ext = Path( file ).suffix
 
             rpath = str( Path( root ).relative_to( Path( s.conf.val( 'chordpro_file_root' )) ))
@@ -1698,45 +2453,54 @@ def build_chordpro_files( c, conn ):
                 title = ' '.join( parts )
 
                 if title or artist:                           # Some zero len
-                    data = (title, artist, rfile)
-                    txt = 'INSERT INTO chordpro_files ( title, artist, file ) VALUES( %s, %s, %s )'
-                    txt = fix_query( txt )
-                    execute( c, txt, data )
-
-                    if FULLTEXT and SQLITE:
-                        txt = 'INSERT INTO chordpro_files_fts ( title, artist, file ) VALUES( ?, ?, ? )'
-                        execute( c, txt, data )
-
+                    data.append( ( title, artist, rfile ) )
                     file_count += 1
 
             # ---------------------------------------------------------
 
-    print( f"   Chordpro files total: {file_count}", file=sys.stderr, flush=True  )
+    stale = snapshot.stale_dirs()
+    root = Path( s.conf.val( 'chordpro_file_root' ))
+    txt = 'DELETE FROM chordpro_files WHERE file = %s'
+    txt = fix_query( txt )
+    executemany( c, txt, [ ( str( Path( Path( dir ).relative_to( root ), file )), ) for dir, old_files in stale for file in old_files ] )
 
-    if MYSQL:
+    txt = 'INSERT INTO chordpro_files ( title, artist, file ) VALUES( %s, %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
+    snapshot.save()
+
+    print( f"   Chordpro files total: {count_rows( c, 'chordpro_files' )}, added from rescanned directories: {file_count}", file=sys.stderr, flush=True  )
+
+    if MYSQL and not incremental:
         txt = "ALTER TABLE chordpro_files ADD FULLTEXT( title ), ADD FULLTEXT( file )"
         execute( c, txt )
 
+    if SQLITE:
+        txt = "CREATE INDEX IF NOT EXISTS chordpro_files_index ON chordpro_files( file )"
+        execute( c, txt )
+
+    if not incremental or stale or data:
+        build_word_index( c, 'chordpro_files' )
+        build_fts_index( c, 'chordpro_files' )
     conn.commit()
     return 0
 
 # --------------------------------------------------------------------------
 #   WRW 27 Apr 2022 - Dinking around with chordpro and jjazz lab files
 
-def build_jjazz_files( c, conn ):
+@timed
+def build_jjazz_files( c, conn, incremental=False ):
     s = Store()
     MYSQL, SQLITE, FULLTEXT = s.driver.values()
     print( "\nBuilding jjazz_files", file=sys.stderr, flush=True  )
 
-    txt = 'DROP TABLE IF EXISTS jjazz_files;'
-    execute( c, txt )
-
-    if FULLTEXT and SQLITE:
-        txt = 'DROP TABLE IF EXISTS jjazz_files_fts;'
+    incremental = incremental and have_dir_snapshot( c, 'jjazz_files' )
+    if not incremental:
+        txt = 'DROP TABLE IF EXISTS jjazz_files;'
         execute( c, txt )
 
     if MYSQL:
-        txt = """CREATE TABLE jjazz_files(
+        txt = """CREATE TABLE IF NOT EXISTS jjazz_files(
                 title VARCHAR(255),
                 file VARCHAR(255),
                 id MEDIUMINT UNSIGNED AUTO_INCREMENT,
@@ -1746,7 +2510,7 @@ def build_jjazz_files( c, conn ):
             """
 
     if SQLITE:
-        txt = """CREATE TABLE jjazz_files(
+        txt = """CREATE TABLE IF NOT EXISTS jjazz_files(
                 title VARCHAR(255),
                 file VARCHAR(255),
                 id MEDIUMINT AUTO_INCREMENT,
@@ -1754,17 +2518,9 @@ def build_jjazz_files( c, conn ):
             """
     execute( c, txt )
 
-    if FULLTEXT and SQLITE:
-        txt = """CREATE VIRTUAL TABLE jjazz_files_fts USING fts5(
-            title,
-            file,
-            content='jjazz_files',
-            content_rowid='id'
-        )
-        """
-        execute( c, txt )
-
     file_count = 0
+    data = []
+    snapshot = DirSnapshot( c, 'jjazz_files', incremental )
 
     #   WRW 31-May-2025 - use all if folders is empty
     jjazz_folders = s.conf.val('jjazz_folders') if s.conf.val('jjazz_folders') else ['.']
@@ -1774,7 +2530,7 @@ def build_jjazz_files( c, conn ):
 
         print( f"   {folder}", file=sys.stderr, flush=True  )
 
-        for root, file in s.fb.listfiles( path ):         # fb.listfiles() is doing os.walk()
+        for root, file in snapshot.listfiles( path ):     # Was s.fb.listfiles(), os.walk()
             ext = Path( file ).suffix
 
             rpath = Path( root ).relative_to( str( Path( s.conf.val( 'jjazz_file_root' )) ))
@@ -1793,25 +2549,35 @@ def build_jjazz_files( c, conn ):
                 title = ' '.join( parts )
 
                 if title:                               # Some zero len
-                    data = (title, rfile)
-                    txt = 'INSERT INTO jjazz_files ( title, file ) VALUES( %s, %s )'
-                    txt = fix_query( txt )
-                    execute( c, txt, data )
-
-                    if FULLTEXT and SQLITE:
-                        txt = 'INSERT INTO jjazz_files_fts ( title, file ) VALUES( ?, ? )'
-                        execute( c, txt, data )
-
+                    data.append( ( title, rfile ) )
                     file_count += 1
 
             # ---------------------------------------------------------
 
-    print( f"   JJazzLab files total: {file_count}", file=sys.stderr, flush=True  )
+    stale = snapshot.stale_dirs()
+    root = Path( s.conf.val( 'jjazz_file_root' ))
+    txt = 'DELETE FROM jjazz_files WHERE file = %s'
+    txt = fix_query( txt )
+    executemany( c, txt, [ ( str( Path( Path( dir ).relative_to( root ), file )), ) for dir, old_files in stale for file in old_files ] )
 
-    if MYSQL:
+    txt = 'INSERT INTO jjazz_files ( title, file ) VALUES( %s, %s )'
+    txt = fix_query( txt )
+    executemany( c, txt, data )
+    snapshot.save()
+
+    print( f"   JJazzLab files total: {count_rows( c, 'jjazz_files' )}, added from rescanned directories: {file_count}", file=sys.stderr, flush=True  )
+
+    if MYSQL and not incremental:
         txt = "ALTER TABLE jjazz_files ADD FULLTEXT( title ), ADD FULLTEXT( file )"
         execute( c, txt )
 
+    if SQLITE:
+        txt = "CREATE INDEX IF NOT EXISTS jjazz_files_index ON jjazz_files( file )"
+        execute( c, txt )
+
+    if not incremental or stale or data:
+        build_word_index( c, 'jjazz_files' )
+        build_fts_index( c, 'jjazz_files' )
     conn.commit()
     return 0
 
@@ -1831,8 +2597,11 @@ def build_jjazz_files( c, conn ):
 #   WRW 13 March 2022 - Set PYTHONPATH so source-specific do_*.py scripts can find the modules here.
 #   Removed conf.set_cwd( f"{os.getcwd()}/../../bin" ) in do_*.py files.
 #   WRW 21-May-2025 - remove '--src' src, add confdir, userdatadir in call to do_*.py files.
+#   WRW 18-Oct-2026 - Add jobs. The converters are independent, each writes only its own
+#       {src}-*.json.gz files, so with jobs > 1 run up to jobs of them at once. Output
+#       then prefixed by src, a line at a time. Return count of converters that failed.
 
-def convert_raw_source( confdir, userdatadir ):
+def convert_raw_source( confdir, userdatadir, jobs=1 ):
     s = Store()
 
     # if conf.Package_Type == 'PyInstaller' or conf.Package_Type == 'Nuitka':
@@ -1843,6 +2612,8 @@ def convert_raw_source( confdir, userdatadir ):
 
     os.environ[ 'PYTHONPATH' ] = str( Path( __file__ ).parent.resolve())
 
+    converters = []                 # ( src, full_command, cwd )
+
     sources = s.conf.get_sources()
     for source in sources:
 
@@ -1852,7 +2623,6 @@ def convert_raw_source( confdir, userdatadir ):
 
         command = s.conf.val( 'command', source )
         src_executable = Path( s.Const.Package_Data_Directory, s.Const.Index_Source_Dir, source, command )
-        print( f"Processing: {path.name}", flush=True )
 
         # ---------------------------------------------------------
 
@@ -1862,36 +2632,16 @@ def convert_raw_source( confdir, userdatadir ):
 
             # full_command = [ s.python, command, '--src', src ]  # WRW 22-Mar-2025 - Added s.python.
             full_command = [ s.python, command, confdir, userdatadir ]  # WRW 22-Mar-2025 - Added s.python.
-
-            extcmd_popen = subprocess.Popen( full_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True )
-            for line in extcmd_popen.stdout:
-                print( line, end='', flush=True )
-
-            extcmd_popen.stdout.close()
-            rcode = extcmd_popen.wait()
-            print( '', flush=True )
+            converters.append( ( src, path, full_command, None ) )
 
         # ---------------------------------------------------------
 
         else:
             if path.is_dir():
-                os.chdir( path )
-                print( os.getcwd() )
-
                 if( os.access( src_executable, os.X_OK) ):
                     # full_command = [ s.python, src_executable, '--src', src ]  # WRW 22-Mar-2025 - Added s.python.
                     full_command = [ s.python, src_executable, confdir, userdatadir ]  # WRW 22-Mar-2025 - Added s.python.
-
-                    #   WRW 15 Mar 2022 - Replaced run with popen so can capture output when running as package.
-                    #   popen = subprocess.run( full_command, text=True )
-
-                    extcmd_popen = subprocess.Popen( full_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True )
-                    for line in extcmd_popen.stdout:
-                        print( line, end='', flush=True )
-
-                    extcmd_popen.stdout.close()
-                    rcode = extcmd_popen.wait()
-                    print( '', flush=True )
+                    converters.append( ( src, path, full_command, path ) )      # Runs in path, was os.chdir( path )
 
                 else:
                     print( f"      ERROR-DEV: command {command} not found or not executable in build_tables.py -> convert_raw_source()", flush=True )
@@ -1905,6 +2655,79 @@ def convert_raw_source( confdir, userdatadir ):
 
         # ---------------------------------------------------------
 
+    if jobs > 1:
+        with ThreadPoolExecutor( max_workers=jobs ) as pool:
+            rcodes = list( pool.map( lambda x: run_converter( *x, prefix=f"{x[0]}: " ), converters ))
+
+    else:
+        rcodes = [ run_converter( *x ) for x in converters ]
+
+    failed = [ x[0] for x, rcode in zip( converters, rcodes ) if rcode ]
+    if failed:
+        print( f"      ERROR: index source conversion failed for: {', '.join( failed )}", flush=True )
+
+    return len( failed )
+
+# --------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Run one converter for convert_raw_source(), return its exit code.
+#   WRW 15 Mar 2022 - Replaced run with popen so can capture output when running as package.
+#       popen = subprocess.run( full_command, text=True )
+#   Print_Lock keeps lines of concurrent converters from mixing.
+
+Print_Lock = threading.Lock()
+
+def run_converter( src, path, full_command, cwd, prefix='' ):
+    with Print_Lock:
+        print( f"{prefix}Processing: {path.name}", flush=True )
+        if cwd:
+            print( f"{prefix}{cwd.resolve()}", flush=True )
+
+    try:
+        extcmd_popen = subprocess.Popen( full_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=cwd )
+
+    except Exception:
+        (extype, value, traceback) = sys.exc_info()
+        with Print_Lock:
+            print( f"{prefix}      ERROR on converter Popen(), type: {extype}, value: {value}", flush=True )
+        return 1
+
+    for line in extcmd_popen.stdout:
+        with Print_Lock:
+            print( f"{prefix}{line}", end='', flush=True )
+
+    extcmd_popen.stdout.close()
+    rcode = extcmd_popen.wait()
+
+    with Print_Lock:
+        if rcode:
+            print( f"{prefix}      ERROR: exit code {rcode}", flush=True )
+        if not prefix:
+            print( '', flush=True )
+
+    return rcode
+
+# --------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Build the packed index of each src, see FB.pack_music_index().
+#       With existing_only just remake the ones already there, after --convert_raw.
+
+def pack_music_index( existing_only=False ):
+    s = Store()
+    print( "\nPacking music index", file=sys.stderr, flush=True  )
+
+    for src in sorted( s.fb.get_srcs_from_index() ):
+        if existing_only and not s.fb.get_packed_index_path( src ).is_file():
+            continue
+
+        try:
+            count = s.fb.pack_music_index( src )
+
+        except Exception:
+            (extype, value, traceback) = sys.exc_info()
+            print( f"      ERROR packing {src}, type: {extype}, value: {value}", file=sys.stderr, flush=True )
+            return 1
+
+        print( f"   {src}: {count} books", file=sys.stderr, flush=True  )
+
     return 0
 
 # --------------------------------------------------------------------------
@@ -2063,6 +2886,7 @@ def OMIT_do_extract_audio( conn ):
 @click.option( "-d", "--database",              help="Use database sqlite or mysql, default sqlite", default='sqlite' )
 
 @click.option( "--convert_raw", is_flag=True, help="Convert raw index source files" )
+@click.option( "--pack_index", is_flag=True, help="Pack music index files into one file per source, faster to read" )
 
 @click.option( "--src_priority", is_flag=True, help="* Build src_priority table" )
 @click.option( "--midi", is_flag=True, help="* Scan midi_files and build midi table" )
@@ -2083,6 +2907,11 @@ def OMIT_do_extract_audio( conn ):
 @click.option( "--scan_audio", is_flag=True, help="Build json table from audio file scan. *** Avoid, may take a long time." )
 
 @click.option( "--page_count", is_flag=True, help="Build page_count table from canonical2file table" )
+@click.option( "--word_index", is_flag=True, help="Build word index and FTS index for existing tables, also built with each table" )
+@click.option( "--fts", is_flag=True, help="Use Sqlite FTS5 full-text search, also set by use_fts_search setting" )
+@click.option( "--timing", is_flag=True, help="Report elapsed time for each table built" )
+@click.option( "-j", "--jobs", type=int, default=None, help="Number of index source converters to run at once with --convert_raw, default 1, or audio tag readers with --scan_audio, default all cpus" )
+@click.option( "--incremental", is_flag=True, help="Update music index tables for changed index files only and rescan only changed directories for music, midi, chordpro, jjazz files, also with --all" )
 # @click.option( "--extract_audio", is_flag=True, help="Build json table from existing MySql Database (transition only)" )
 @click.option( "--fail", is_flag=True, help="Return failure for testing" )
 
@@ -2091,7 +2920,7 @@ def OMIT_do_extract_audio( conn ):
 def do_main( all, database, offset, canonical, midi, canon2file, local2canon, title2youtube,
              src_priority, music_files, titles_distinct, titles,
              scan_audio, audio_files, confdir, userdatadir, convert_raw, corrections, the_corrections, fail,
-             jjazz, chordpro, page_count
+             jjazz, chordpro, page_count, word_index, fts, timing, jobs, incremental, pack_index
             ):
 
     s = Store()
@@ -2115,7 +2944,7 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
     if database == 'sqlite':
         MYSQL = False
         SQLITE = True
-        FULLTEXT = False     # True to include Sqlite fulltext index. Only meaningful if get it working better.
+        FULLTEXT = fts       # WRW 18-Oct-2026 - True to include Sqlite FTS5 index, also from use_fts_search setting below.
 
     elif database == 'mysql':
         MYSQL = True
@@ -2169,6 +2998,9 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
     s.conf.get_config()
     s.conf.set_class_variables( )     # Update conf.v data and source <--> src mapping.
 
+    if SQLITE and s.conf.val( 'use_fts_search' ):       # WRW 18-Oct-2026
+        s.driver.fullword = True
+
     # ---------------------------------------------------------------
 
     results, success = s.conf.check_hostname_config()
@@ -2201,13 +3033,18 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
     #   Run all the Index-Source/do_*.py files      # Do before all, titles_distinct and titles so can do in one call.
 
     if convert_raw:
-        rcode += convert_raw_source( confdir, userdatadir )
+        rcode += convert_raw_source( confdir, userdatadir, jobs or 1 )
+        rcode += pack_music_index( existing_only=True )         # WRW 18-Oct-2026
+        return rcode
+
+    if pack_index:
+        rcode += pack_music_index()
         return rcode
 
     # ---------------------------------
 
     if scan_audio:                          # This takes a long time. Use sparingly. Keep separate from --all.
-        rcode += do_scan_audio_files()      # Keep above build_audio_files() so can do both in one invocation.
+        rcode += do_scan_audio_files( jobs )    # Keep above build_audio_files() so can do both in one invocation.
         return rcode
 
     # ---------------------------------
@@ -2240,6 +3077,7 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
         s.c = c = conn.cursor()
         s.dc = dc = conn.cursor()
         dc.row_factory = sqlite3.Row
+        set_bulk_pragmas( c )                   # WRW 18-Oct-2026
 
     else:
         print( "      ERROR: No database type specified", file=sys.stderr, flush=True  )
@@ -2251,27 +3089,29 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
 
     if all:
         rcode += build_source_priority( c, conn )
-        rcode += build_midi_files( c, conn )
-        rcode += build_chordpro_files( c, conn )
-        rcode += build_jjazz_files( c, conn )
-        rcode += build_music_files( c, conn )
+        rcode += build_midi_files( c, conn, incremental )
+        rcode += build_chordpro_files( c, conn, incremental )
+        rcode += build_jjazz_files( c, conn, incremental )
+        rcode += build_music_files( c, conn, incremental )
         rcode += build_sheet_offsets( c, conn )
         rcode += build_local2canonical( c, conn )
         rcode += build_canonicals( c, conn )
         rcode += build_canonical2file( c, conn )
         rcode += build_page_count( dc, c, conn )
-        rcode += build_titles_distinct( c, conn )
-        rcode += build_titles( dc, c, conn )                     # After build_titles_distinct()
+        if incremental:                                          # WRW 18-Oct-2026
+            rcode += build_music_index_incremental( dc, c, conn )
+        else:
+            rcode += build_titles_and_titles_distinct( dc, c, conn )    # WRW 18-Oct-2026 - One pass, was separate
         rcode += build_title2youtube( dc, c, conn, False, False )       # dc, Ifile, show_found, show_not_found
-        rcode += build_audio_files( c )
+        rcode += build_audio_files( c, conn )
 
     # ---------------------------------
 
     if audio_files:
-        rcode += build_audio_files( c )
+        rcode += build_audio_files( c, conn )
 
     if music_files:
-        rcode += build_music_files( c, conn )
+        rcode += build_music_files( c, conn, incremental )
 
     if src_priority:
         rcode += build_source_priority( c, conn )
@@ -2280,13 +3120,13 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
         rcode += build_sheet_offsets( c, conn )         # Does its own create and indexes.
 
     if midi:
-        rcode += build_midi_files( c, conn )         # Does its own create and indexes.
+        rcode += build_midi_files( c, conn, incremental )         # Does its own create and indexes.
 
     if chordpro:
-        rcode += build_chordpro_files( c, conn )      # Does its own create and indexes.
+        rcode += build_chordpro_files( c, conn, incremental )      # Does its own create and indexes.
 
     if jjazz:
-        rcode += build_jjazz_files( c, conn )         # Does its own create and indexes.
+        rcode += build_jjazz_files( c, conn, incremental )         # Does its own create and indexes.
 
     if canonical:
         rcode += build_canonicals( c, conn )
@@ -2297,7 +3137,10 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
     if local2canon:
         rcode += build_local2canonical( c, conn )
 
-    if titles_distinct:
+    if titles_distinct and titles:                      # WRW 18-Oct-2026 - One pass for both
+        rcode += build_titles_and_titles_distinct( dc, c, conn )
+
+    elif titles_distinct:
         rcode += build_titles_distinct( c, conn )
 
     if corrections:
@@ -2306,15 +3149,23 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
     if the_corrections:
         rcode += build_the_corrections_file( dc, conn )
 
-    if titles:
+    if titles and not titles_distinct:
         rcode += build_titles( dc, c, conn )
 
+    if incremental and not all:
+        rcode += build_music_index_incremental( dc, c, conn )
+
     if page_count:
         rcode += build_page_count( dc, c, conn )
 
     if title2youtube:
         rcode += build_title2youtube( dc, c, conn, False, True )       # dc, Ifile, show_found, show_not_found
 
+    if word_index:
+        for table in fb_utils.Word_Index_Columns:
+            rcode += build_word_index( c, table )
+            rcode += build_fts_index( c, table )
+
     # ---------------------------------
     #   This always reads from MySql DB. Needed during transition from MySql to Sqlite to extract audio_files
     #       from MySql into Sqlite DB to save time of scanning audio files. Always follow with build_audio_files().
@@ -2329,6 +3180,9 @@ def do_main( all, database, offset, canonical, midi, canon2file, local2canon, ti
 
     # ---------------------------------
 
+    if timing:
+        report_timing()
+
     return rcode
 
 # --------------------------------------------------------------------------
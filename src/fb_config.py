@@ -176,6 +176,9 @@ class configDataDict( ):
 
     #   name: Hard-wired name of file associated with 's' item.
 
+    #   default: WRW 18-Oct-2026 - Value used when item missing from config file, for items
+    #         added after the user's config file was created. Without it missing item is an error.
+
     #   ptype: Picker type for single-line edit boxes
     #       'none' - no picker, just text
     #       'file' - file picker
@@ -239,6 +242,8 @@ class configDataDict( ):
             'show_index_mgmt_tabs':             { 'loc' : '-', 'type' : 'B', 'col' : 'R', 'show' : True, 'section' : 'System', 'title' : 'Show index management tab' },
             'show_canon2file_tab':              { 'loc' : '-', 'type' : 'B', 'col' : 'R', 'show' : True, 'section' : 'System', 'title' : 'Show Edit Canonoical->File tab' },
             'include_titles_missing_file':      { 'loc' : '-', 'type' : 'B', 'col' : 'R', 'show' : True, 'section' : 'System', 'title' : 'Include titles missing in music files' },
+            'use_fts_search':                   { 'loc' : '-', 'type' : 'B', 'col' : 'R', 'show' : True, 'section' : 'System', 'title' : 'Use Sqlite FTS5 search (rebuild index)', 'default' : 'False' },
+            'search_as_you_type':               { 'loc' : '-', 'type' : 'B', 'col' : 'R', 'show' : True, 'section' : 'System', 'title' : 'Search as you type in Title', 'default' : 'False' },
          # for index-mgmt    'ci_canon_select': { 'loc' : '-', 'type' : 'C', 'col' : 'R', 'show' : True, 'section' : 'System', 'title' : 'Create Index Canonicals (restart reqd)', 'aux2': self.ci_canon_select },
 
             'label4' :                          { 'loc' : '-', 'type' : 'L', 'col' : 'R', 'show' : True, 'section' : 'Host',   'title' : 'Appearance' },
@@ -834,12 +839,13 @@ class ConfigPopup( QDialog ):
             # -------------------------
             #   Get current value of option, some are host-specific
             #   Labels have no value and don't appear in settings file.
+            #   WRW 18-Oct-2026 - Default for settings added after the user's config file was created.
 
             if dd[ 'type' ] != 'L':
                 if dd[ 'section' ] == 'Host':
-                    val = config['Host'][ hostname ][ item ]
+                    val = config['Host'][ hostname ].get( item, dd.get( 'default' ) )
                 else:
-                    val = config[ dd['section'] ][ item ]
+                    val = config[ dd['section'] ].get( item, dd.get( 'default' ) )
     
             # -------------------------
             #   Column left or right specified in data dict.
@@ -1543,11 +1549,15 @@ class Config():
                     val = config[ dd['section'] ][ item ]               # *** Obtain val from config dict.
 
             except KeyError as e:
-                t = Path( self.confdir, self.config_file )
+                if 'default' in dd:         # WRW 18-Oct-2026 - Setting added after user's config file was created.
+                    val = dd[ 'default' ]
 
-                s.msgCritical( f"Your configuration file '{t}' is missing {e} setting" )
-                print( f"ERROR Your configuration file '{t}' is missing {e} setting", file=sys.stderr )
-                sys.exit(1)
+                else:
+                    t = Path( self.confdir, self.config_file )
+
+                    s.msgCritical( f"Your configuration file '{t}' is missing {e} setting" )
+                    print( f"ERROR Your configuration file '{t}' is missing {e} setting", file=sys.stderr )
+                    sys.exit(1)
 
             # -------------------------------------------
 
@@ -0,0 +1,23 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------
+#   fb_fullword.py
+
+#   WRW 18-Oct-2026 - Python counterpart of the word splitting in the fullword C module.
+#       No imports so that Fullword-Match/test_fullword.py can check it against the
+#       module without PySide6 and the rest of fb_utils.py.
+# ---------------------------------------------------------------------------
+
+#   Split text into words exactly as copy_to_buffer() and partition_buffer() do in
+#       Fullword-Match/fullwordmodule.c: ASCII-only lower case (C tolower()), drop ignore_chars,
+#       break on break_chars and space only. Keep these in step with the C code.
+
+Fullword_Translate = str.maketrans(
+    { **{ chr(c) : chr(c + 32) for c in range( ord('A'), ord('Z') + 1 ) },
+      **{ c : None for c in '"!?()' },              # ignore_chars
+      **{ c : ' ' for c in '_-/,.' } }              # break_chars
+)
+
+def fullword_tokens( text ):
+    return [ x for x in text.translate( Fullword_Translate ).split( ' ' ) if x ]
+
+# ---------------------------------------------------------------------------
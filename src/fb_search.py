@@ -137,14 +137,9 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
             data.append( title )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( f"""titles_distinct_fts.title MATCH ?""" )
-                data.append( title )
-
-            else:
-                w, d = s.fb.get_fulltext( "titles_distinct.title", title )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "titles_distinct.title", title )
+            wheres.append( w )
+            data.extend( d )
 
     if composer:
         if MYSQL:
@@ -152,13 +147,9 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
             data.append( composer )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( "composer MATCH ?" )
-                data.append( composer )
-            else:
-                w, d = s.fb.get_fulltext( "composer", composer )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "titles.composer", composer )
+            wheres.append( w )
+            data.extend( d )
 
     if lyricist:
         if MYSQL:
@@ -166,13 +157,9 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
             data.append( lyricist )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( f"""lyricist MATCH ?""" )
-                data.append( lyricist )
-            else:
-                w, d = s.fb.get_fulltext( "lyricist", lyricist )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "titles.lyricist", lyricist )
+            wheres.append( w )
+            data.extend( d )
 
     if src:
         if MYSQL:
@@ -180,13 +167,9 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
             data.append( src )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( f"""titles.src MATCH ?""" )
-                data.append( src )
-            else:
-                w, d = s.fb.get_fulltext( "titles.src", src )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "titles.src", src )
+            wheres.append( w )
+            data.extend( d )
 
     if canonical:
         if MYSQL:
@@ -194,13 +177,9 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
             data.append( canonical )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( f"""local2canonical.canonical MATCH ?""" )
-                data.append( canonical )
-            else:
-                w, d = s.fb.get_fulltext( "local2canonical.canonical", canonical )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "local2canonical.canonical", canonical )
+            wheres.append( w )
+            data.extend( d )
 
     if album:
         if MYSQL:
@@ -211,17 +190,11 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
             data.append( album )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( """titles_distinct.title IN
-                    ( SELECT title FROM audio_files
-                      WHERE album MATCH ? ) """ )
-                data.append( album )
-            else:
-                w, d = s.fb.get_fulltext( "album", album )
-                wheres.append( f"""titles_distinct.title IN
-                                   ( SELECT title FROM audio_files WHERE {w} )
-                                """ )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "audio_files.album", album )
+            wheres.append( f"""titles_distinct.title IN
+                               ( SELECT title FROM audio_files WHERE {w} )
+                            """ )
+            data.extend( d )
 
     if artist:
         if MYSQL:
@@ -232,17 +205,11 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
             data.append( artist )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( """titles_distinct.title IN
-                    ( SELECT title FROM audio_files
-                      WHERE artist MATCH ? ) """ )
-                data.append( album )
-            else:
-                w, d = s.fb.get_fulltext( "artist", artist )
-                wheres.append( f"""titles_distinct.title IN
-                                   ( SELECT title FROM audio_files WHERE {w} )
-                                """ )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "audio_files.artist", artist )
+            wheres.append( f"""titles_distinct.title IN
+                               ( SELECT title FROM audio_files WHERE {w} )
+                            """ )
+            data.extend( d )
 
 
     # -----------------------------------------------------------------------
@@ -267,7 +234,8 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
             query = f"""
                 SELECT titles_distinct.title, titles.composer, titles.sheet, titles.src, titles.local,
                 local2canonical.canonical, canonical2file.file,
-                src_priority.priority AS src_priority, canonicals.priority AS canonical_priority /* WRW 9 Apr 2022 - added */
+                src_priority.priority AS src_priority, canonicals.priority AS canonical_priority, /* WRW 9 Apr 2022 - added */
+                COUNT(*) OVER() AS cnt
                 FROM titles_distinct
                 JOIN titles USING( title_id )
                 JOIN src_priority ON src_priority.src = titles.src                      /* WRW 9 Apr 2022 - added */
@@ -288,39 +256,25 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
         #   order of JOIN to resolve.
 
         if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT titles_distinct_fts.title,
-                    titles.composer, titles.sheet, titles.src, titles.local,
-                    local2canonical.canonical, canonical2file.file,
-                    src_priority.priority AS src_priority, canonicals.priority AS canonical_priority /* WRW 9 Apr 2022 - added */
-                    FROM titles_distinct_fts
-                    JOIN titles USING( title_id )
-                    JOIN src_priority ON src_priority.src = titles.src                      /* WRW 9 Apr 2022 - added */
-                    {local2canonical_join}
-                    JOIN canonicals ON canonicals.canonical = local2canonical.canonical     /* WRW 9 Apr 2022 - added */
-                    {canonical2file_join}
-                    {where_clauses}
-                    ORDER BY rank
-                    LIMIT {Select_Limit}
-                """
-
-            else:
-                query = f"""
-                    SELECT titles_distinct.title,
-                    titles.composer, titles.sheet, titles.src, titles.local,
-                    local2canonical.canonical, canonical2file.file,
-                    src_priority.priority AS src_priority, canonicals.priority AS canonical_priority    /* WRW 9 Apr 2022 - added */
-                    FROM titles_distinct
-                    JOIN titles USING( title_id )
-                    JOIN src_priority ON src_priority.src = titles.src                      /* WRW 9 Apr 2022 - added */
-                    {local2canonical_join}
-                    JOIN canonicals ON canonicals.canonical = local2canonical.canonical     /* WRW 9 Apr 2022 - added */
-                    {canonical2file_join}
-                    {where_clauses}
-                    ORDER BY titles_distinct.title, local2canonical.canonical, titles.src   
-                    LIMIT {Select_Limit}
-                """
+            r, rd = s.fb.get_fulltext_rank( "titles_distinct.title", title )
+            data.extend( rd )
+
+            query = f"""
+                SELECT titles_distinct.title,
+                titles.composer, titles.sheet, titles.src, titles.local,
+                local2canonical.canonical, canonical2file.file,
+                src_priority.priority AS src_priority, canonicals.priority AS canonical_priority,   /* WRW 9 Apr 2022 - added */
+                COUNT(*) OVER() AS cnt
+                FROM titles_distinct
+                JOIN titles USING( title_id )
+                JOIN src_priority ON src_priority.src = titles.src                      /* WRW 9 Apr 2022 - added */
+                {local2canonical_join}
+                JOIN canonicals ON canonicals.canonical = local2canonical.canonical     /* WRW 9 Apr 2022 - added */
+                {canonical2file_join}
+                {where_clauses}
+                ORDER BY {r}titles_distinct.title, local2canonical.canonical, titles.src   
+                LIMIT {Select_Limit}
+            """
 
         query = fix_query( query )      # Replace %s with ? for SQLITE
 
@@ -332,14 +286,19 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
         #   WRW 10 Apr 2022 - switch from list to dict.
         #   Only sheet, not page, is in the titles table.
         #   Populate page column of table with results of get_page_from_sheet.
+        #   WRW 18-Oct-2026 - Resolve pages for all rows in one pass with get_pages_from_sheets(),
+        #       was one query per row.
 
-        s.dc.execute( query, data )
-        rows = s.dc.fetchall()
+        dc = s.fb.get_dc()          # WRW 18-Oct-2026 - Worker thread cursor when run by SearchExec
+        dc.execute( query, data )
+        rows = dc.fetchall()
 
         # headings = [ "Title", "Composer", "Canonical Book Name", "Page", "Sheet", "Source", "Local Book Name", "File" ],
 
         if rows:
-            for row in rows:
+            pages = s.fb.get_pages_from_sheets( [ (row[ 'sheet' ], row[ 'src' ], row[ 'local' ]) for row in rows ] )
+
+            for row, page in zip( rows, pages ):
                 # title = row[ 'title' ]
                 # composer = row[ 'composer' ]
                 # canonical = row[ 'canonical' ]
@@ -351,7 +310,6 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
                 # canonical_priority = row[ 'canonical_priority' ]                              # WRW 9 Apr 2022 - added
 
                 # page = s.fb.get_page_from_sheet( sheet, src, local )
-                page = s.fb.get_page_from_sheet( row[ 'sheet' ], row[ 'src' ], row[ 'local' ] )
 
                 # table.append( [ src_priority, canonical_priority, title, composer, canonical, page, sheet, src, local, file ] )
 
@@ -367,35 +325,8 @@ def do_query_music_file_index_with_join( title, composer, lyricist, album, artis
                                 'file' : row[ 'file' ]
                                } )
 
-        if MYSQL:
-            query = f"""
-                SELECT count(*) cnt
-                FROM titles_distinct
-                JOIN titles USING( title_id )
-                {local2canonical_join}
-                {where_clauses}
-            """
-        if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT count(*) cnt
-                    FROM titles_distinct_fts
-                    JOIN titles USING( title_id )
-                    {local2canonical_join}
-                    {where_clauses}
-                """
-            else:
-                query = f"""
-                    SELECT count(*) cnt
-                    FROM titles_distinct
-                    JOIN titles USING( title_id )
-                    {local2canonical_join}
-                    {where_clauses}
-                """
-
-        query = fix_query( query )
-        s.dc.execute( query, data )
-        count = s.dc.fetchone()[ 'cnt' ]
+        #   WRW 18-Oct-2026 - count comes from COUNT(*) OVER() in the row query, was a second scan.
+        count = rows[0][ 'cnt' ] if rows else 0
 
     return (table, count)
 
@@ -430,14 +361,9 @@ def do_query_audio_files_index( title, album, artist ):
             data.append( title )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( f"""title MATCH ?""" )
-                data.append( title )
-
-            else:
-                w, d = s.fb.get_fulltext( "title", title )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "audio_files.title", title )
+            wheres.append( w )
+            data.extend( d )
 
     if album:
         if MYSQL:
@@ -445,13 +371,9 @@ def do_query_audio_files_index( title, album, artist ):
             data.append( album )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( f"""album MATCH ?""" )
-                data.append( album )
-            else:
-                w, d = s.fb.get_fulltext( "album", album )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "audio_files.album", album )
+            wheres.append( w )
+            data.extend( d )
 
     if artist:
         if MYSQL:
@@ -459,13 +381,9 @@ def do_query_audio_files_index( title, album, artist ):
             data.append( artist)
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( f"""artist MATCH ?""" )
-                data.append( artist )
-            else:
-                w, d = s.fb.get_fulltext( "artist", artist )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "audio_files.artist", artist )
+            wheres.append( w )
+            data.extend( d )
 
     # ---------------------------------------------------
 
@@ -474,33 +392,28 @@ def do_query_audio_files_index( title, album, artist ):
 
         if MYSQL:
             query = f"""
-                SELECT title, artist, album, file
+                SELECT title, artist, album, file, COUNT(*) OVER() AS cnt
                 FROM audio_files
                 {where}
                 ORDER BY title, artist   
                 LIMIT {Select_Limit}
             """
         if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT title, artist, album, file
-                    FROM audio_files_fts
-                    {where}
-                    ORDER BY title, artist   
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT title, artist, album, file
-                    FROM audio_files
-                    {where}
-                    ORDER BY title, artist   
-                    LIMIT {Select_Limit}
-                """
+            r, rd = s.fb.get_fulltext_rank( "audio_files.title", title )
+            data.extend( rd )
+
+            query = f"""
+                SELECT title, artist, album, file, COUNT(*) OVER() AS cnt
+                FROM audio_files
+                {where}
+                ORDER BY {r}title, artist   
+                LIMIT {Select_Limit}
+            """
 
         query = fix_query( query )
-        s.dc.execute( query, data )
-        rows = s.dc.fetchall()
+        dc = s.fb.get_dc()
+        dc.execute( query, data )
+        rows = dc.fetchall()
 
         if rows:
             for row in rows:
@@ -509,29 +422,8 @@ def do_query_audio_files_index( title, album, artist ):
                                 'album' : row[ 'album' ],
                                 'file' : row[ 'file' ],
                                } )
-        if MYSQL:
-            query = f"""
-                SELECT COUNT(*) cnt
-                FROM audio_files
-                {where}
-            """
-        if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM audio_files_fts
-                    {where}
-                """
-            else:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM audio_files    
-                    {where}
-                """
-
-        query = fix_query( query )
-        s.dc.execute( query, data )
-        count = s.dc.fetchone()[ 'cnt' ]
+        #   WRW 18-Oct-2026 - count comes from COUNT(*) OVER() in the row query, was a second scan.
+        count = rows[0][ 'cnt' ] if rows else 0
 
     return table, count
 
@@ -556,21 +448,13 @@ def do_query_music_filename( title ):
             data.append( title )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( f"""rpath MATCH ?""" )
-                data.append( title )
-
-                wheres.append( f"""file MATCH ?""" )
-                data.append( title )
-
-            else:
-                w, d = s.fb.get_fulltext( "rpath", title )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "music_files.rpath", title )
+            wheres.append( w )
+            data.extend( d )
 
-                w, d = s.fb.get_fulltext( "file", title )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "music_files.file", title )
+            wheres.append( w )
+            data.extend( d )
 
     if len( data ):
 
@@ -578,33 +462,28 @@ def do_query_music_filename( title ):
 
         if MYSQL:
             query = f"""
-                SELECT rpath, file
+                SELECT rpath, file, COUNT(*) OVER() AS cnt
                 FROM music_files
                 {where}
                 ORDER BY rpath, file
                 LIMIT {Select_Limit}
             """
         if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT rpath, file
-                    FROM music_files_fts
-                    {where}
-                    ORDER BY rpath, file   
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT rpath, file
-                    FROM music_files
-                    {where}
-                    ORDER BY rpath, file   
-                    LIMIT {Select_Limit}
-                """
+            r, rd = s.fb.get_fulltext_rank( "music_files.file", title )
+            data.extend( rd )
+
+            query = f"""
+                SELECT rpath, file, COUNT(*) OVER() AS cnt
+                FROM music_files
+                {where}
+                ORDER BY {r}rpath, file   
+                LIMIT {Select_Limit}
+            """
 
         query = fix_query( query )
-        s.dc.execute( query, data )
-        rows = s.dc.fetchall()
+        dc = s.fb.get_dc()
+        dc.execute( query, data )
+        rows = dc.fetchall()
 
         if rows:
             for row in rows:
@@ -612,32 +491,8 @@ def do_query_music_filename( title ):
                                 'file' : row[ 'file' ]
                               } )
 
-        if MYSQL:
-            query = f"""
-                SELECT COUNT(*) cnt
-                FROM music_files
-                {where}
-                LIMIT {Select_Limit}
-            """
-        if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM music_files_fts
-                    {where}
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM music_files
-                    {where}
-                    LIMIT {Select_Limit}
-                """
-
-        query = fix_query( query )
-        s.dc.execute( query, data )
-        count = s.dc.fetchone()[ 'cnt' ]
+        #   WRW 18-Oct-2026 - count comes from COUNT(*) OVER() in the row query, was a second scan.
+        count = rows[0][ 'cnt' ] if rows else 0
 
     return table, count
 
@@ -665,28 +520,17 @@ def do_query_midi_filename( title, composer ):
             data.append( title )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( "rpath MATCH ?" )
-                data.append( title )
-
-                wheres.append( "file MATCH ?" )
-                data.append( title )
-
-                wheres.append( "title MATCH ?" )
-                data.append( title )
-
-            else:
-                w, d = s.fb.get_fulltext( "rpath", title, full=False )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "rpath", title, full=False )
+            wheres.append( w )
+            data.extend( d )
 
-                w, d = s.fb.get_fulltext( "file", title, full=False  )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "file", title, full=False  )
+            wheres.append( w )
+            data.extend( d )
 
-                w, d = s.fb.get_fulltext( "title", title, full=False  )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "title", title, full=False  )
+            wheres.append( w )
+            data.extend( d )
 
     if composer:
         if MYSQL:
@@ -694,46 +538,34 @@ def do_query_midi_filename( title, composer ):
             data.append( composer )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( "composer MATCH ?" )
-                data.append( composer )
-            else:
-                w, d = s.fb.get_fulltext( "composer", composer, full=False )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "composer", composer, full=False )
+            wheres.append( w )
+            data.extend( d )
 
     if len( data ):
         where = "WHERE " + " OR ".join( wheres )
         if MYSQL:
             query = f"""
-                SELECT title, composer, rpath, file
+                SELECT title, composer, rpath, file, COUNT(*) OVER() AS cnt
                 FROM midi_files    
                 {where}
                 ORDER BY title, rpath, file
                 LIMIT {Select_Limit}
             """
         if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT title, composer, rpath, file
-                    FROM midi_files_fts
-                    {where}
-                    ORDER BY title, rpath, file
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT title, composer, rpath, file
-                    FROM midi_files
-                    {where}
-                    ORDER BY title, rpath, file
-                    LIMIT {Select_Limit}
-                """
+            query = f"""
+                SELECT title, composer, rpath, file, COUNT(*) OVER() AS cnt
+                FROM midi_files
+                {where}
+                ORDER BY title, rpath, file
+                LIMIT {Select_Limit}
+            """
 
         query = fix_query( query )
 
-        s.dc.execute( query, data )
-        rows = s.dc.fetchall()
+        dc = s.fb.get_dc()
+        dc.execute( query, data )
+        rows = dc.fetchall()
 
         if rows:
             for row in rows:
@@ -743,32 +575,8 @@ def do_query_midi_filename( title, composer ):
                                 'composer' : row[ 'composer' ],
                               } )
 
-        if MYSQL:
-            query = f"""
-                SELECT COUNT(*) cnt
-                FROM midi_files
-                {where}
-                LIMIT {Select_Limit}
-            """
-        if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM midi_files_fts
-                    {where}
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM midi_files
-                    {where}
-                    LIMIT {Select_Limit}
-                """
-
-        query = fix_query( query )
-        s.dc.execute( query, data )
-        count = s.dc.fetchone()[ 'cnt' ]
+        #   WRW 18-Oct-2026 - count comes from COUNT(*) OVER() in the row query, was a second scan.
+        count = rows[0][ 'cnt' ] if rows else 0
 
     return table, count
 
@@ -790,14 +598,9 @@ def do_query_chordpro( title, artist ):
             data.append( title )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( "title MATCH ?" )
-                data.append( title )
-
-            else:
-                w, d = s.fb.get_fulltext( "title", title )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "chordpro_files.title", title )
+            wheres.append( w )
+            data.extend( d )
 
     if artist:
         if MYSQL:
@@ -805,47 +608,37 @@ def do_query_chordpro( title, artist ):
             data.append( artist )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( "artist MATCH ?" )
-                data.append( artist )
-
-            else:
-                w, d = s.fb.get_fulltext( "artist", artist )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "chordpro_files.artist", artist )
+            wheres.append( w )
+            data.extend( d )
 
     if len( data ):
         where = "WHERE " + " AND ".join( wheres )
         if MYSQL:
             query = f"""
-                SELECT title, artist, file
+                SELECT title, artist, file, COUNT(*) OVER() AS cnt
                 FROM chordpro_files
                 {where}
                 ORDER BY title, artist, file
                 LIMIT {Select_Limit}
             """
         if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT title, artist, file
-                    FROM chordpro_files_fts
-                    {where}
-                    ORDER BY title, artist, file
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT title, artist, file
-                    FROM chordpro_files
-                    {where}
-                    ORDER BY title, artist, file
-                    LIMIT {Select_Limit}
-                """
+            r, rd = s.fb.get_fulltext_rank( "chordpro_files.title", title )
+            data.extend( rd )
+
+            query = f"""
+                SELECT title, artist, file, COUNT(*) OVER() AS cnt
+                FROM chordpro_files
+                {where}
+                ORDER BY {r}title, artist, file
+                LIMIT {Select_Limit}
+            """
 
         query = fix_query( query )
 
-        s.dc.execute( query, data )
-        rows = s.dc.fetchall()
+        dc = s.fb.get_dc()
+        dc.execute( query, data )
+        rows = dc.fetchall()
 
         if rows:
             for row in rows:
@@ -853,32 +646,8 @@ def do_query_chordpro( title, artist ):
                                 'artist' : row[ 'artist' ],
                                 'file' : row[ 'file' ]
                               } )
-        if MYSQL:
-            query = f"""
-                SELECT COUNT(*) cnt
-                FROM chordpro_files
-                {where}
-                LIMIT {Select_Limit}
-            """
-        if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM chordpro_files_fts
-                    {where}
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM chordpro_files
-                    {where}
-                    LIMIT {Select_Limit}
-                """
-
-        query = fix_query( query )
-        s.dc.execute( query, data )
-        count = s.dc.fetchone()[ 'cnt' ]
+        #   WRW 18-Oct-2026 - count comes from COUNT(*) OVER() in the row query, was a second scan.
+        count = rows[0][ 'cnt' ] if rows else 0
 
     return table, count
 
@@ -900,79 +669,45 @@ def do_query_jjazz_filename( title ):
             data.append( title )
 
         if SQLITE:
-            if FULLTEXT:
-                wheres.append( "title MATCH ?" )
-                data.append( title )
-
-            else:
-                w, d = s.fb.get_fulltext( "title", title )
-                wheres.append( w )
-                data.extend( d )
+            w, d = s.fb.get_fulltext( "jjazz_files.title", title )
+            wheres.append( w )
+            data.extend( d )
 
     if len( data ):
         where = "WHERE " + " OR ".join( wheres )
         if MYSQL:
             query = f"""
-                SELECT title, file
+                SELECT title, file, COUNT(*) OVER() AS cnt
                 FROM jjazz_files
                 {where}
                 ORDER BY title, file
                 LIMIT {Select_Limit}
             """
         if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT title, file
-                    FROM jjazz_files_fts
-                    {where}
-                    ORDER BY title, file
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT title, file
-                    FROM jjazz_files
-                    {where}
-                    ORDER BY title, file
-                    LIMIT {Select_Limit}
-                """
+            r, rd = s.fb.get_fulltext_rank( "jjazz_files.title", title )
+            data.extend( rd )
+
+            query = f"""
+                SELECT title, file, COUNT(*) OVER() AS cnt
+                FROM jjazz_files
+                {where}
+                ORDER BY {r}title, file
+                LIMIT {Select_Limit}
+            """
 
         query = fix_query( query )
 
-        s.dc.execute( query, data )
-        rows = s.dc.fetchall()
+        dc = s.fb.get_dc()
+        dc.execute( query, data )
+        rows = dc.fetchall()
 
         if rows:
             for row in rows:
                 table.append( { 'title' : row[ 'title' ],
                                 'file' : row[ 'file' ]
                               } )
-        if MYSQL:
-            query = f"""
-                SELECT COUNT(*) cnt
-                FROM jjazz_files
-                {where}
-                LIMIT {Select_Limit}
-            """
-        if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM jjazz_files_fts
-                    {where}
-                    LIMIT {Select_Limit}
-                """
-            else:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM jjazz_files
-                    {where}
-                    LIMIT {Select_Limit}
-                """
-
-        query = fix_query( query )
-        s.dc.execute( query, data )
-        count = s.dc.fetchone()[ 'cnt' ]
+        #   WRW 18-Oct-2026 - count comes from COUNT(*) OVER() in the row query, was a second scan.
+        count = rows[0][ 'cnt' ] if rows else 0
 
     return table, count
 
@@ -993,7 +728,8 @@ def do_query_youtube_index( title ):
             # title2youtube.duration,
             query = f"""
                 SELECT titles_distinct.title,
-                title2youtube.ytitle, title2youtube.yt_id
+                title2youtube.ytitle, title2youtube.yt_id,
+                COUNT(*) OVER() AS cnt
                 FROM titles_distinct
                 JOIN title2youtube ON title2youtube.title_id = titles_distinct.title_id
                 WHERE MATCH( titles_distinct.title ) AGAINST( %s IN BOOLEAN MODE )
@@ -1003,41 +739,31 @@ def do_query_youtube_index( title ):
             data.append( title )
 
         if SQLITE:
-            if FULLTEXT:
-                # title2youtube.duration,
-                query = f"""
-                    SELECT title,
-                    title2youtube.ytitle, title2youtube.yt_id
-                    FROM titles_distinct_fts
-                    JOIN title2youtube USING( title_id )
-                    WHERE titles_distinct_fts.title MATCH ?
-                    ORDER BY titles_distinct.title, title2youtube.ytitle   
-                    LIMIT {Select_Limit}
-                """
-                data.append( title )
-
-            else:
-                w, d = s.fb.get_fulltext( "titles_distinct.title", title )
-                data.extend( d )
-
-                # title2youtube.duration,
-                query = f"""
-                    SELECT title,
-                    title2youtube.ytitle, title2youtube.yt_id
-                    FROM titles_distinct
-                    JOIN title2youtube USING( title_id )
-                    WHERE {w}
-                    ORDER BY titles_distinct.title, title2youtube.ytitle   
-                    LIMIT {Select_Limit}
-                """
+            w, d = s.fb.get_fulltext( "titles_distinct.title", title )
+            data.extend( d )
+            r, rd = s.fb.get_fulltext_rank( "titles_distinct.title", title )
+            data.extend( rd )
+
+            # title2youtube.duration,
+            query = f"""
+                SELECT title,
+                title2youtube.ytitle, title2youtube.yt_id,
+                COUNT(*) OVER() AS cnt
+                FROM titles_distinct
+                JOIN title2youtube USING( title_id )
+                WHERE {w}
+                ORDER BY {r}titles_distinct.title, title2youtube.ytitle   
+                LIMIT {Select_Limit}
+            """
 
         query = fix_query( query )
 
     # --------------------------------------------------------------------
 
     if len( data ):
-        s.dc.execute( query, data )
-        rows = s.dc.fetchall()
+        dc = s.fb.get_dc()
+        dc.execute( query, data )
+        rows = dc.fetchall()
 
         if rows:
             for row in rows:
@@ -1048,39 +774,8 @@ def do_query_youtube_index( title ):
                 # table.append( { 'title': title, 'ytitle': ytitle, 'duration':duration, 'yt_id': yt_id } )
                 table.append( { 'title': title, 'ytitle': ytitle, 'yt_id': yt_id } )
 
-        # data = []
-        if MYSQL:
-            query = f"""
-                SELECT COUNT(*) cnt
-                FROM titles_distinct
-                JOIN title2youtube ON title2youtube.title_id = titles_distinct.title_id
-                WHERE MATCH( titles_distinct.title ) AGAINST( %s IN BOOLEAN MODE )
-            """
-            # data.append( title )
-
-        if SQLITE:
-            if FULLTEXT:
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM titles_distinct_fts
-                    JOIN title2youtube USING( title_id )
-                    WHERE titles_distinct_fts.title MATCH ?
-                """
-                # data.append( title )
-
-            else:
-                # w, d = s.fb.get_fulltext( "titles_distinct.title", title )
-                query = f"""
-                    SELECT COUNT(*) cnt
-                    FROM titles_distinct
-                    JOIN title2youtube USING( title_id )
-                    WHERE {w}
-                """
-                # data.extend( d )
-
-        query = fix_query( query )
-        s.dc.execute( query, data )
-        count = s.dc.fetchone()[ 'cnt' ]
+        #   WRW 18-Oct-2026 - count comes from COUNT(*) OVER() in the row query, was a second scan.
+        count = rows[0][ 'cnt' ] if rows else 0
 
     return table, count
 
@@ -1106,8 +801,9 @@ def get_audio_from_titles( title ):
         """
 
     data = (title,)
-    s.dc.execute( query, data )
-    rows = s.dc.fetchall()
+    dc = s.fb.get_dc()
+    dc.execute( query, data )
+    rows = dc.fetchall()
 
     res = [ [row[ 'title' ], row[ 'artist' ], row[ 'file' ] ] for row in rows ] if rows else []
 
@@ -1132,24 +828,17 @@ def get_midi_from_titles( title ):
         data.append( title )
 
     if SQLITE:
-        if FULLTEXT:
-            query = f"""
-                SELECT rpath, file
-                FROM midi_files_fts
-                WHERE file MATCH ?
-                ORDER BY rank
-            """
-            data.append( title )
+        w, d = s.fb.get_fulltext( "midi_files.file", title )
+        data.extend( d )
+        r, rd = s.fb.get_fulltext_rank( "midi_files.file", title )
+        data.extend( rd )
 
-        else:
-            w, d = s.fb.get_fulltext( "file", title )
-            query = f"""
-                SELECT rpath, file
-                FROM midi_files
-                WHERE {w}
-                ORDER BY file
-            """
-            data.extend( d )
+        query = f"""
+            SELECT rpath, file
+            FROM midi_files
+            WHERE {w}
+            ORDER BY {r}file
+        """
 
     # parts = title.split()
     # t = [ f'+{x}' for x in parts if len(x) >= 4]
@@ -1158,8 +847,9 @@ def get_midi_from_titles( title ):
     # print( query )
     # print( data )
 
-    s.dc.execute( query, data )
-    rows = s.dc.fetchall()
+    dc = s.fb.get_dc()
+    dc.execute( query, data )
+    rows = dc.fetchall()
 
     res = [ [row[ 'rpath'], row[ 'file' ]] for row in rows ] if rows else []
 
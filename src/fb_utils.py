@@ -12,6 +12,9 @@ import subprocess
 from pathlib import Path
 import gzip
 import csv
+import bisect
+import threading
+import sqlite3
 from unidecode import unidecode
 
 from PySide6.QtCore import QObject, QThread, Signal, Slot, Qt
@@ -24,6 +27,7 @@ from PySide6.QtSvg import QSvgRenderer
 
 from Store import Store
 from bl_constants import MT
+from fb_fullword import fullword_tokens     # WRW 18-Oct-2026 - Word splitting as fullword does, also fb_utils.fullword_tokens
 
 try:                            # WRW 3 May 2022 - in case there is a problem with fullword module in some environments.
     import fullword             # Make bogus name 'xfullword' to test missing module
@@ -36,6 +40,28 @@ except ImportError:             # WRW 13 June remove 'as e' for pylint
 # WRW 7-Apr-2025 - Fullword NG for serching piano roll midi because of filename structure.
 #   Make use of it conditional on arg to get_fulltext()
 
+# ---------------------------------------------------------------------------
+#   WRW 18-Oct-2026 - Inverted word index, built by build_tables.py into table word_index
+#       as ( col, token, row_id ), col is 'table.column', row_id is rowid in table.
+#       Columns indexed, all searched with my_match_c().
+
+Word_Index_Columns = {
+    'titles_distinct' : [ 'title' ],
+    'titles' :          [ 'composer', 'lyricist' ],
+    'audio_files' :     [ 'title', 'artist', 'album' ],
+    'music_files' :     [ 'rpath', 'file' ],
+    'midi_files' :      [ 'file' ],
+    'chordpro_files' :  [ 'title', 'artist' ],
+    'jjazz_files' :     [ 'title' ],
+}
+
+#   WRW 18-Oct-2026 - Tokenizer for the Sqlite FTS5 tables, one {table}_fts per table above
+#       with the same columns, built by build_tables.py when FTS is selected. unicode61
+#       breaks on all punctuation, make it keep the punctuation fullword keeps in words.
+#       Only difference left is that fullword ignore_chars inside a word break it here.
+
+Fts_Tokenizer = "unicode61 remove_diacritics 0 tokenchars '''&:;+#@$%*=<>[]{}|\\^~`'"
+
 # ---------------------------------------------------------------------------
 #   Replace spaces with underscores and path separators with dash so can
 #       keep these files in flat directory hierarchy.
@@ -100,6 +126,13 @@ class FB( QObject ):
             self.svgRegistry = []           # WRW 10-Apr-2025 - so can redraw svg icons when theme changes
             self.groupBoxRegistry = []      # WRW 11-Apr-2025 - so can adjust group box border by theme
             self.saveIconColor = None
+            self.sheet_offsets_index = None     # WRW 18-Oct-2026 - Loaded on first use by get_sheet_offsets_index()
+            self.sheet_offsets_stamp = None
+            self.thread_dcs = {}                    # WRW 18-Oct-2026 - thread id : cursor for search workers, see get_dc()
+            self.word_index_cols = {}               # WRW 18-Oct-2026 - See have_word_index()
+            self.word_index_stamp = None
+            self.fts_tables = {}                    # WRW 18-Oct-2026 - See have_fts_index()
+            self.fts_tables_stamp = None
 
             # self.doc = None
             # self.cur_page = None
@@ -298,10 +331,36 @@ class FB( QObject ):
             w = ss[1:-1]                     # Remove leading and trailing quote
             return f"{col} = ? COLLATE NOCASE", [w]
 
+        # ----------------------------------------------
+        #   WRW 18-Oct-2026 - Sqlite FTS5 selected by --fts or use_fts_search setting and
+        #       an FTS table exists for col. Filter on the base table by rowid so the callers'
+        #       queries are the same for both. Ordering by bm25() is from get_fulltext_rank().
+        #       FTS5 does not check word order, my_match_c() still does that on the FTS rows.
+
+        elif self.use_fts( col, ss, full ):
+            table, _, column = col.rpartition( '.' )
+            fts = f"{table}.rowid IN ( SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ? )"
+            if match_type == "my_match_c":
+                return f"( {fts} AND my_match_c( {col}, ? ) )", [ self.get_fts_match( column, ss ), ss ]
+            return fts, [ self.get_fts_match( column, ss ) ]
+
         # ----------------------------------------------
         #   This is best and fast. Same as below but in C.
 
+        #   WRW 18-Oct-2026 - When col is in the word index narrow the rows to the intersection of
+        #       the posting lists of the words in ss, then verify with my_match_c(), which also
+        #       checks word order. Search time then follows posting list size, not table size.
+        #       Fall back to my_match_c() over the whole table if no index for col.
+
         elif match_type == "my_match_c":
+            table, _, column = col.rpartition( '.' )
+            tokens = sorted( set( fullword_tokens( ss ) ))
+
+            if tokens and self.have_word_index( col ):
+                postings = " INTERSECT ".join( [ "SELECT row_id FROM word_index WHERE col = ? AND token = ?" ] * len( tokens ) )
+                data = [ x for token in tokens for x in ( col, token ) ]
+                return f"( {table}.rowid IN ( {postings} ) AND my_match_c( {col}, ? ) )", data + [ss]
+
             return f"my_match_c( {col}, ? )", [ss]
 
         # ----------------------------------------------
@@ -449,19 +508,100 @@ class FB( QObject ):
 
     # ------------------------------------------------------------------------
     #   Call 'callback' for each source file in Index.Json matching 'src'
+    #   WRW 18-Oct-2026 - From the packed index of src when it is up to date.
 
     def get_music_index_data_by_src( self, src, callback, **kwargs ):
         s = Store()
         curdir = os.getcwd()                            # OK on windows
         os.chdir( s.conf.val( 'music_index_dir' ))        # OK on windows
         files = glob.glob( f"{src}*.json.gz" )
-        for file in files:
-          # with open( file ) as ifd:
-            with gzip.open( file, 'rt', encoding='utf-8'  ) as ifd: # /// WRW 23-Mar-2025 ENCODING
-                data = json.load( ifd )
-                callback( src, data, file, **kwargs )
+
+        packed = self.open_packed_index( src, files )
+        if packed:
+            for file, text in packed.execute( "SELECT file, data FROM books ORDER BY rowid" ):
+                callback( src, json.loads( text ), file, **kwargs )
+            packed.close()
+
+        else:
+            for file in files:
+              # with open( file ) as ifd:
+                with gzip.open( file, 'rt', encoding='utf-8'  ) as ifd: # /// WRW 23-Mar-2025 ENCODING
+                    data = json.load( ifd )
+                    callback( src, data, file, **kwargs )
         os.chdir ( curdir )
 
+    # ------------------------------------------------------------------------
+    #   WRW 18-Oct-2026 - Packed index. One sqlite file per src in music_index_dir,
+    #       {src}-Packed-Index.db, with the data of all its {src}*.json.gz files, one row per book
+    #       as compact json. Read with one open and no gzip in place of a file per book.
+    #       Optional, made by build_tables.py --pack_index and remade by --convert_raw once
+    #       it exists. The .json.gz files remain the source, a packed index is used only when
+    #       the files and their mtime and size are the same as when it was packed.
+
+    def get_packed_index_path( self, src ):
+        s = Store()
+        return Path( s.conf.val( 'music_index_dir' ), f"{src}-{s.Const.Packed_Index_File}" )
+
+    # ------------------------------------------------------------------------
+    #   Return count of books packed.
+
+    def pack_music_index( self, src ):
+        s = Store()
+        index_dir = s.conf.val( 'music_index_dir' )
+        path = self.get_packed_index_path( src )
+        tmp = Path( f"{path}.tmp" )
+        tmp.unlink( missing_ok=True )
+
+        conn = sqlite3.connect( tmp )
+        conn.execute( "CREATE TABLE books ( file TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, data TEXT )" )
+
+        count = 0
+        for file in glob.glob( f"{src}*.json.gz", root_dir=index_dir ):
+            ipath = Path( index_dir, file )
+            st = os.stat( ipath )
+            with gzip.open( ipath, 'rt', encoding='utf-8' ) as ifd:
+                data = json.load( ifd )
+            conn.execute( "INSERT INTO books ( file, mtime, size, data ) VALUES( ?, ?, ?, ? )",
+                          ( file, st.st_mtime_ns, st.st_size, json.dumps( data, separators=( ',', ':' ))) )
+            count += 1
+
+        conn.commit()
+        conn.close()
+        os.replace( tmp, path )
+        return count
+
+    # ------------------------------------------------------------------------
+    #   Connection to packed index of src if it matches files, else None. Files
+    #       relative to music_index_dir.
+
+    def open_packed_index( self, src, files ):
+        s = Store()
+        index_dir = s.conf.val( 'music_index_dir' )
+        path = self.get_packed_index_path( src )
+        if not path.is_file():
+            return None
+
+        try:
+            conn = sqlite3.connect( f"file:{path}?mode=ro", uri=True )
+            packed = { file : ( mtime, size ) for file, mtime, size in conn.execute( "SELECT file, mtime, size FROM books" ) }
+
+        except sqlite3.Error:
+            (extype, value, traceback) = sys.exc_info()
+            print( f"      ERROR on packed index {path}, type: {extype}, value: {value}", file=sys.stderr, flush=True )
+            return None
+
+        current = {}
+        for file in files:
+            st = os.stat( Path( index_dir, file ))
+            current[ file ] = ( st.st_mtime_ns, st.st_size )
+
+        if current != packed:
+            print( f"      WARNING: packed index for {src} is out of date, using .json.gz files", file=sys.stderr, flush=True )
+            conn.close()
+            return None
+
+        return conn
+
     # ------------------------------------------------------------------------
     #   WRW 2 Mar 2022 - Original returned array of arrays, now returns just array.
 
@@ -831,30 +971,221 @@ class FB( QObject ):
             # print( f"   {title}", file=sys.stderr  )
             return None
 
+    # ----------------------------------------
+    #   WRW 18-Oct-2026 - FTS5 support for get_fulltext().
+
+    def use_fts( self, col, ss, full=True ):
+        s = Store()
+        MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+        table, _, column = col.rpartition( '.' )
+        return bool( SQLITE and FULLTEXT and full and ss and
+                     column in Word_Index_Columns.get( table, [] ) and
+                     fullword_tokens( ss ) and
+                     self.have_fts_index( table ) )
+
+    #   FTS5 query restricting each word to column, words quoted so FTS5 operators
+    #   and punctuation in the search are taken literally. All words must match.
+
+    def get_fts_match( self, column, ss ):
+        return ' AND '.join( [ f'{column} : "{token}"' for token in fullword_tokens( ss ) ] )
+
+    #   ORDER BY prefix ranking rows of col by bm25(), best first. Empty when not using FTS.
+
+    def get_fulltext_rank( self, col, ss ):
+        if not self.use_fts( col, ss ):
+            return "", []
+
+        table, _, column = col.rpartition( '.' )
+        rank = f"( SELECT bm25( {table}_fts ) FROM {table}_fts WHERE {table}_fts MATCH ? AND {table}_fts.rowid = {table}.rowid ), "
+        return rank, [ self.get_fts_match( column, ss ) ]
+
+    #   True if {table}_fts exists. Cached until the database changes.
+    #   WRW 18-Oct-2026 - Called from several search worker threads. Work on a local
+    #       reference to the cache so another thread replacing it does not matter.
+
+    def have_fts_index( self, table ):
+        stamp = self.get_db_stamp()
+        fts_tables = self.fts_tables
+        if self.fts_tables_stamp != stamp:
+            fts_tables = {}
+            self.fts_tables = fts_tables
+            self.fts_tables_stamp = stamp
+
+        found = fts_tables.get( table )
+        if found is None:
+            try:
+                dc = self.get_dc()
+                dc.execute( "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", [ f"{table}_fts" ] )
+                found = dc.fetchone() is not None
+
+            except Exception:
+                found = False
+
+            fts_tables[ table ] = found
+
+        return found
+
+    # ----------------------------------------
+    #   WRW 18-Oct-2026 - True if word_index has entries for col, 'table.column'.
+    #       Cached until the database changes. False for a database built before word_index.
+    #       Thread safe the same way as have_fts_index().
+
+    def have_word_index( self, col ):
+        table, _, column = col.rpartition( '.' )
+        if column not in Word_Index_Columns.get( table, [] ):
+            return False
+
+        stamp = self.get_db_stamp()
+        word_index_cols = self.word_index_cols
+        if self.word_index_stamp != stamp:
+            word_index_cols = {}
+            self.word_index_cols = word_index_cols
+            self.word_index_stamp = stamp
+
+        found = word_index_cols.get( col )
+        if found is None:
+            try:
+                dc = self.get_dc()
+                dc.execute( "SELECT 1 FROM word_index WHERE col = ? LIMIT 1", [col] )
+                found = dc.fetchone() is not None
+
+            except Exception:                   # No word_index table, not built yet.
+                found = False
+
+            word_index_cols[ col ] = found
+
+        return found
+
+    # ----------------------------------------
+    #   WRW 18-Oct-2026 - Searches run on worker threads with their own read-only
+    #   sqlite connection, see bl_search_exec.py. A worker installs its cursor
+    #   with set_thread_dc(), queries get it with get_dc(), main thread gets s.dc.
+    #   By thread id, not threading.local(), which Python drops for a Qt pool thread
+    #   after each run().
+
+    def set_thread_dc( self, dc ):
+        self.thread_dcs[ threading.get_ident() ] = dc
+
+    def get_dc( self ):
+        dc = self.thread_dcs.get( threading.get_ident() )
+        return dc if dc is not None else Store().dc
+
+    # ------------------------------------------------------------------------
+    #   WRW 18-Oct-2026 - In-memory interval index over sheet_offsets.
+    #       get_page_from_sheet(), get_sheet_from_page() and get_sheet_offset_from_page() were
+    #       running a query on every page turn, toc click and search row. The table is tiny
+    #       and only changes when build_tables.py rebuilds it. Load it once, keep it per
+    #       (src, local), and answer both directions with bisect.
+
+    #   The SQL answered 'last entry by offset_id where value >= key', with key sheet_start
+    #       for sheet->page and sheet_start + sheet_offset for page->sheet. For each direction
+    #       keep the entries sorted by key and, at each position, the entry with the highest
+    #       offset_id seen so far. bisect on the key then gives the same entry as the SQL
+    #       even if an offsets line is not in ascending order.
+
+    #   Invalidated by invalidate_sheet_offsets(), called after an external command
+    #       completes, and for sqlite when the database file modification time changes.
+
+    def get_db_stamp( self ):
+        s = Store()
+        MYSQL, SQLITE, FULLTEXT = s.driver.values()
+
+        if SQLITE:
+            try:
+                return os.stat( Path( s.conf.user_data_directory, s.conf.sqlite_database ) ).st_mtime_ns
+            except OSError:
+                return None
+        return None
+
+    # ----------------------------------------
+
+    def invalidate_sheet_offsets( self ):
+        self.sheet_offsets_index = None
+
+    # ----------------------------------------
+
+    def make_offset_interval( self, entries, key ):
+        entries = sorted( entries, key=key )
+        keys = []
+        best = []
+        top = None
+        for entry in entries:
+            if top is None or entry[0] > top[0]:        # entry[0] is offset_id
+                top = entry
+            keys.append( key( entry ) )
+            best.append( top )
+        return keys, best
+
+    # ----------------------------------------
+
+    def get_sheet_offsets_index( self ):
+        dc = self.get_dc()
+
+        stamp = self.get_db_stamp()
+        index = self.sheet_offsets_index            # Local, invalidate_sheet_offsets() may run on another thread.
+        if index is not None and self.sheet_offsets_stamp == stamp:
+            return index
+
+        query = "SELECT src, local, sheet_start, sheet_offset, offset_id FROM sheet_offsets"
+
+        try:
+            dc.execute( query )
+
+        except Exception:
+            (extype, value, traceback) = sys.exc_info()
+            print( f"ERROR on SELECT, type: {extype}, value: {value}", file=sys.stderr )
+            print( f"  {query}", file=sys.stderr  )
+            return {}
+
+        books = {}
+        for row in dc.fetchall():
+            entry = ( int( row[ 'offset_id' ] ), int( row[ 'sheet_start' ] ), int( row[ 'sheet_offset' ] ) )
+            books.setdefault( (row[ 'src' ], row[ 'local' ]), [] ).append( entry )
+
+        index = {}
+        for book, entries in books.items():
+            index[ book ] = {
+                'sheet' : self.make_offset_interval( entries, lambda x: x[1] ),           # sheet >= sheet_start
+                'page'  : self.make_offset_interval( entries, lambda x: x[1] + x[2] ),    # page >= sheet_start + sheet_offset
+            }
+
+        self.sheet_offsets_index = index
+        self.sheet_offsets_stamp = stamp
+        return index
+
+    # ----------------------------------------
+    #   Return (offset_id, sheet_start, sheet_offset) of the entry applying to value, or None.
+    #   direction is 'sheet' when value is a sheet, 'page' when value is a page.
+
+    def find_sheet_offset( self, value, src, local, direction ):
+        try:
+            value = int( value )
+        except (TypeError, ValueError):
+            try:
+                value = int( float( value ) )
+            except (TypeError, ValueError):
+                return None
+
+        book = self.get_sheet_offsets_index().get( (src, local) )
+        if not book:
+            return None
+
+        keys, best = book[ direction ]
+        pos = bisect.bisect_right( keys, value ) - 1
+        return best[ pos ] if pos >= 0 else None
+
     # ------------------------------------------------------------------------
     #        AND %s >= sheet_start + sheet_offset
     #        AND %s >= sheet_start   
     #   WRW 28 Apr 2022 - This is not working with sqlite3 as it should
     #   WRW change ORDER BY id to ORDER BY offset_id. Can't do much with id in sqlite3.
     #   WRW 1 May 2022 - Realized not working. Added '+ sheet_offset' to 'AND %s >= sheet_start + sheet_offset'
+    #   WRW 18-Oct-2026 - Now from in-memory index, see get_sheet_offsets_index().
 
     def get_sheet_offset_from_page( self, page, src, local ):
-        s = Store()
-        query = """
-            SELECT sheet_offset
-            FROM sheet_offsets
-            WHERE src = %s
-            AND local = %s
-            AND %s >= sheet_start + sheet_offset
-            ORDER BY offset_id DESC
-            LIMIT 1
-        """
-        query = fix_query( query )
-        data = [ src, local, page ]
-        s.dc.execute( query, data )
-        row = s.dc.fetchone()
-
-        return row[ 'sheet_offset' ] if row else None
+        entry = self.find_sheet_offset( page, src, local, 'page' )
+        return entry[2] if entry else None
 
     # --------------------------------------------------------------------------
     #   Remember: 'sheet' is what is printed in the book, 'page' is the PDF page number.
@@ -870,25 +1201,11 @@ class FB( QObject ):
     #       Find last sheet_offsets entry where page >= (sheet_start + sheet_offset) ordered by sheet_start + sheet_offset
     #       Had error in earlier approach.
     #   WRW 1 May 2022 - Realized not working. Added '+ sheet_offset' to 'AND %s >= sheet_start + sheet_offset'
+    #   WRW 18-Oct-2026 - Now from in-memory index, no SQL on page turns.
 
     def get_sheet_from_page( self, page, src, local ):
-
-        s = Store()
-
-        query = """SELECT %s - sheet_offset AS sheet
-                   FROM sheet_offsets
-                   WHERE src = %s
-                   AND local = %s
-                   AND %s >= sheet_start + sheet_offset
-                   ORDER BY offset_id DESC
-                   LIMIT 1
-                """
-        query = fix_query( query )
-        data = [page, src, local, page]
-        s.dc.execute( query, data )
-
-        row = s.dc.fetchone()
-        return str(int(row[ 'sheet' ])) if row else None
+        entry = self.find_sheet_offset( page, src, local, 'page' )
+        return str( int( float( page )) - entry[2] ) if entry else None
 
     # ----------------------------------------------------------------------------
 
@@ -908,31 +1225,19 @@ class FB( QObject ):
     #   WRW 5 Apr 2022 - I don't think this is working, always returns same value. Showed up in scatter plot
     #       of page vs sheet. Problem is with Sqlite, OK with MySql. Prob is use of primary key 'id'. Add
     #       a separate id value in table as offset_id. Solved problem
+    #   WRW 18-Oct-2026 - Now from in-memory index, see get_sheet_offsets_index().
 
     def get_page_from_sheet( self, sheet, src, local ):
-        s = Store()
-
-        query = """SELECT %s + sheet_offset AS page
-                   FROM sheet_offsets
-                   WHERE src = %s
-                   AND local = %s
-                   AND %s >= sheet_start
-                   ORDER BY offset_id DESC
-                   LIMIT 1
-                """
-
-        query = fix_query( query )
-        data = [sheet, src, local, sheet]
-        s.dc.execute( query, data )
-
-        # print( query )
-        # print( data )
-
-        row = s.dc.fetchone()
+        entry = self.find_sheet_offset( sheet, src, local, 'sheet' )
+        return str( int( float( sheet )) + entry[2] ) if entry else None
 
-        # print( "/// sheet:", sheet, '-> page', row[ 'page' ], src, local )
+    # ----------------------------------------------------------------------------
+    #   WRW 18-Oct-2026 - Bulk version of get_page_from_sheet() for search results.
+    #       Was one SELECT per result row, now resolved from the in-memory offsets index.
+    #       items: list of (sheet, src, local). Returns list of page (string or None) in same order.
 
-        return str(int(row[ 'page' ])) if row else None
+    def get_pages_from_sheets( self, items ):
+        return [ self.get_page_from_sheet( sheet, src, local ) for sheet, src, local in items ]
 
     # ----------------------------------------------------------------------------
     #   WRW 7 Jan 2022 - For First/Prev/Next/Last - do a higher level to update button box
@@ -1123,6 +1428,32 @@ class FB( QObject ):
         row = s.dc.fetchone()
         return (row[ 'cnt' ], row[ 'src' ]) if row else (None, None)
 
+    # --------------------------------------------------------------------------
+    #   WRW 18-Oct-2026 - get_index_count_from_file() for all files in one query, for the
+    #       browser thumbnails. Returns { file : ( cnt, src ) }, src with the most titles.
+
+    def get_index_counts_by_file( self ):
+        s = Store()
+
+        query = """
+            SELECT file, src, COUNT(*) cnt
+            FROM canonical2file
+            JOIN local2canonical USING( canonical )
+            JOIN titles USING( src, local )
+            JOIN titles_distinct USING( title_id )
+            GROUP BY file, src
+        """
+
+        s.dc.execute( query )
+
+        res = {}
+        for row in s.dc.fetchall():
+            file, cnt = row[ 'file' ], row[ 'cnt' ]
+            if file not in res or cnt > res[ file ][0]:
+                res[ file ] = ( cnt, row[ 'src' ] )
+
+        return res
+
     # --------------------------------------------------------------------------
     #   os.walk( folder ) returns generator that returns list of folders and list of files
     #       in 'folder'.
@@ -1281,6 +1612,7 @@ class FB( QObject ):
     def external_command_finished( self, rcode, stdout, stderr ):
         s = Store()
         s.app.restoreOverrideCursor()
+        self.invalidate_sheet_offsets()             # WRW 18-Oct-2026 - Command may have rebuilt the database.
 
         if rcode:
             stdout_txt = f"Stdout: {stdout.decode()}" if stdout is not None else 'None'
@@ -1507,6 +1839,32 @@ def do_main():
         offset = s.fb.get_sheet_offset_from_page( page, 'Shr', 'Standards Real Book' )
         print( f"page: {page} -> offset: {offset}" )
 
+    #   WRW 18-Oct-2026 - Check in-memory sheet offsets index against the SQL it replaced
+    #       for every book in sheet_offsets.
+
+    print()
+    print( "Check sheet offsets index against SQL" )
+    errors = 0
+    for ( src, local ) in s.fb.get_sheet_offsets_index():
+        for value in range( 0, 1200 ):
+            s.dc.execute( """SELECT sheet_offset FROM sheet_offsets WHERE src = %s AND local = %s
+                             AND %s >= sheet_start ORDER BY offset_id DESC LIMIT 1""", [ src, local, value ] )
+            row = s.dc.fetchone()
+            page = str( int( value + row[ 'sheet_offset' ] )) if row else None
+            if page != s.fb.get_page_from_sheet( str( value ), src, local ):
+                print( f"   ERROR: get_page_from_sheet(), {src}, {local}, sheet {value}, SQL page {page}" )
+                errors += 1
+
+            s.dc.execute( """SELECT sheet_offset FROM sheet_offsets WHERE src = %s AND local = %s
+                             AND %s >= sheet_start + sheet_offset ORDER BY offset_id DESC LIMIT 1""", [ src, local, value ] )
+            row = s.dc.fetchone()
+            offset = row[ 'sheet_offset' ] if row else None
+            if offset != s.fb.get_sheet_offset_from_page( value, src, local ):
+                print( f"   ERROR: get_sheet_offset_from_page(), {src}, {local}, page {value}, SQL offset {offset}" )
+                errors += 1
+
+    print( f"   {errors} errors" )
+
     lrows = s.fb.get_local_from_src_canonical( 'Shr', 'Standards Real Book - Chuck Sher' )
     print( lrows )
 